@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+#################################################
+""" b_tree.py
+# # B+ Tree (sorted map) Implementation
+#   Cache-friendly alternative to the Binary Search Tree: nodes hold sorted
+#   lists of up to <fanout> keys (searched with bisect), and all data lives
+#   in leaves linked in order for fast range scans.
+#   Supports:
+#      - Insert (key, optional value), remove, contains, get.
+#      - Size, min, max, height.
+#      - Traverse:
+#          > in-order, reverse in-order (leaf chain), irange(lazy range iterator).
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from bisect import bisect_left, bisect_right
+##################################################
+# Implementation
+##################################################
+class BPlusLeaf:
+    """Leaf node of a B+ Tree: sorted keys, their values, and links to the
+       neighbouring leaves."""
+    __slots__ = ("keys", "values", "next", "prev")
+
+    def __init__(self, keys=None, values=None):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.next = None
+        self.prev = None
+
+class BPlusInternal:
+    """Internal node of a B+ Tree: children[i] holds the keys in
+       [keys[i-1], keys[i]) (unbounded at the ends)."""
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys, children):
+        self.keys = keys
+        self.children = children
+
+class BPlusTree:
+    """B+ Tree implementation, with the BinarySearchTree interface.
+       Every node but the root holds between fanout//2 and fanout keys.
+       A node search is one C-level bisect over a compact list, instead of a
+       pointer hop per comparison, and a leaf packs many keys per object.
+       Complexity: Search | Insert | Remove | Range scan (k keys)
+              O(log(n)) | O(log(n) + fanout) | O(log(n) + fanout) | O(log(n) + k)"""
+    def __init__(self, fanout=64):
+        if fanout < 4:
+            print("WARNING: Fanout too small. Fanout=4 Tree Created!")
+            fanout = 4
+        self.fanout = fanout
+        self.min_keys = fanout // 2
+        self.root = BPlusLeaf()
+        self.num_keys = 0
+
+    def __str__(self):
+        return str(self.in_order(False))
+
+    def __iter__(self):
+        return self.irange()
+
+    def size(self):
+        """Get the number of keys in the tree."""
+        return self.num_keys
+
+    def height(self):
+        """Get the height of the tree (number of node levels)."""
+        height = 1
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[0]
+            height += 1
+        return height
+
+    def _find_leaf(self, key, path=None):
+        """Utility function to find the leaf that holds (or would hold) key.
+           If path is given, the (internal node, child index) pairs walked are recorded."""
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            idx = bisect_right(node.keys, key)
+            if path is not None:
+                path.append((node, idx))
+            node = node.children[idx]
+        return node
+
+    def contains(self, key):
+        """Check if key is in the tree."""
+        leaf = self._find_leaf(key)
+        idx = bisect_left(leaf.keys, key)
+        return idx < len(leaf.keys) and leaf.keys[idx] == key
+
+    def get(self, key, default=None):
+        """Get the value stored with key (default if key is not in the tree)."""
+        leaf = self._find_leaf(key)
+        idx = bisect_left(leaf.keys, key)
+        if idx < len(leaf.keys) and leaf.keys[idx] == key:
+            return leaf.values[idx]
+        return default
+
+    def insert(self, key, value=None):
+        """Insert key (with value) in the tree. An existing key gets its value updated.
+           Returns:
+               feedback (Boolean): True if the key was not in the tree
+                                   and was added, False otherwise."""
+        path = []
+        leaf = self._find_leaf(key, path)
+        idx = bisect_left(leaf.keys, key)
+        if idx < len(leaf.keys) and leaf.keys[idx] == key:
+            leaf.values[idx] = value
+            return False
+        leaf.keys.insert(idx, key)
+        leaf.values.insert(idx, value)
+        self.num_keys += 1
+        if len(leaf.keys) > self.fanout:
+            self._split(leaf, path)
+        return True
+
+    def _split(self, node, path):
+        """Utility function to split the overflowing node, cascading up path."""
+        while len(node.keys) > self.fanout:
+            mid = len(node.keys) // 2
+            if isinstance(node, BPlusLeaf):
+                sibling = BPlusLeaf(node.keys[mid:], node.values[mid:])
+                del node.keys[mid:]
+                del node.values[mid:]
+                sibling.next = node.next
+                if node.next is not None:
+                    node.next.prev = sibling
+                sibling.prev = node
+                node.next = sibling
+                separator = sibling.keys[0]
+            else:
+                separator = node.keys[mid]
+                sibling = BPlusInternal(node.keys[mid + 1:], node.children[mid + 1:])
+                del node.keys[mid:]
+                del node.children[mid + 1:]
+            if not path:
+                self.root = BPlusInternal([separator], [node, sibling])
+                return
+            parent, idx = path.pop()
+            parent.keys.insert(idx, separator)
+            parent.children.insert(idx + 1, sibling)
+            node = parent
+
+    def remove(self, key):
+        """Remove key from the tree.
+           Returns:
+               feedback (Boolean): True if the key was in the tree
+                                   and was removed, False otherwise."""
+        path = []
+        leaf = self._find_leaf(key, path)
+        idx = bisect_left(leaf.keys, key)
+        if idx == len(leaf.keys) or leaf.keys[idx] != key:
+            return False
+        del leaf.keys[idx]
+        del leaf.values[idx]
+        self.num_keys -= 1
+        self._rebalance(leaf, path)
+        return True
+
+    def _rebalance(self, node, path):
+        """Utility function to fix the underflowing node (by borrowing from, or merging
+           with a sibling), cascading up path. Separators may go stale on removal,
+           which is fine: they still split the children's keys correctly."""
+        while path and len(node.keys) < self.min_keys:
+            parent, idx = path.pop()
+            left = parent.children[idx - 1] if idx > 0 else None
+            right = parent.children[idx + 1] if idx + 1 < len(parent.children) else None
+            if left is not None and len(left.keys) > self.min_keys:
+                self._borrow_left(parent, idx, left, node)
+                return
+            if right is not None and len(right.keys) > self.min_keys:
+                self._borrow_right(parent, idx, node, right)
+                return
+            if left is not None:
+                self._merge(parent, idx - 1, left, node)
+            else:
+                self._merge(parent, idx, node, right)
+            node = parent
+        if isinstance(self.root, BPlusInternal) and not self.root.keys:
+            self.root = self.root.children[0]
+
+    @staticmethod
+    def _borrow_left(parent, idx, left, node):
+        """Utility function to move the last key of left to the front of node."""
+        if isinstance(node, BPlusLeaf):
+            node.keys.insert(0, left.keys.pop())
+            node.values.insert(0, left.values.pop())
+            parent.keys[idx - 1] = node.keys[0]
+        else:
+            node.keys.insert(0, parent.keys[idx - 1])
+            node.children.insert(0, left.children.pop())
+            parent.keys[idx - 1] = left.keys.pop()
+
+    @staticmethod
+    def _borrow_right(parent, idx, node, right):
+        """Utility function to move the first key of right to the end of node."""
+        if isinstance(node, BPlusLeaf):
+            node.keys.append(right.keys.pop(0))
+            node.values.append(right.values.pop(0))
+            parent.keys[idx] = right.keys[0]
+        else:
+            node.keys.append(parent.keys[idx])
+            node.children.append(right.children.pop(0))
+            parent.keys[idx] = right.keys.pop(0)
+
+    @staticmethod
+    def _merge(parent, idx, left, right):
+        """Utility function to merge right into left (children idx & idx+1 of parent)."""
+        if isinstance(left, BPlusLeaf):
+            left.keys.extend(right.keys)
+            left.values.extend(right.values)
+            left.next = right.next
+            if right.next is not None:
+                right.next.prev = left
+        else:
+            left.keys.append(parent.keys[idx])
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+        del parent.keys[idx]
+        del parent.children[idx + 1]
+
+    def _edge_leaf(self, last):
+        """Utility function to get the first (or last) leaf."""
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[-1 if last else 0]
+        return node
+
+    def get_min(self):
+        """Get the minimum key in the tree."""
+        leaf = self._edge_leaf(False)
+        return leaf.keys[0] if leaf.keys else None
+
+    def get_max(self):
+        """Get the maximum key in the tree."""
+        leaf = self._edge_leaf(True)
+        return leaf.keys[-1] if leaf.keys else None
+
+    def in_order(self, verbose=True):
+        """In-order(min->max sorted) traverse the tree, along the leaf chain."""
+        traversal = []
+        leaf = self._edge_leaf(False)
+        while leaf is not None:
+            traversal.extend(leaf.keys)
+            leaf = leaf.next
+        if verbose:
+            print(traversal)
+        return traversal
+
+    def rev_in_order(self, verbose=True):
+        """Reverse in-order(max->min sorted) traverse the tree, along the leaf chain."""
+        traversal = []
+        leaf = self._edge_leaf(True)
+        while leaf is not None:
+            traversal.extend(reversed(leaf.keys))
+            leaf = leaf.prev
+        if verbose:
+            print(traversal)
+        return traversal
+
+    def irange(self, low=None, high=None, reverse=False):
+        """Lazily iterate over the keys in [low, high) (None - unbounded), in sorted
+           (or reverse sorted) order: one descent, then a walk along the leaf chain."""
+        if not reverse:
+            leaf = self._edge_leaf(False) if low is None else self._find_leaf(low)
+            idx = 0 if low is None else bisect_left(leaf.keys, low)
+            while leaf is not None:
+                keys = leaf.keys
+                end = len(keys) if high is None else bisect_left(keys, high, idx)
+                yield from keys[idx:end]
+                if end < len(keys):
+                    return
+                leaf = leaf.next
+                idx = 0
+        else:
+            leaf = self._edge_leaf(True) if high is None else self._find_leaf(high)
+            end = len(leaf.keys) if high is None else bisect_left(leaf.keys, high)
+            while leaf is not None:
+                keys = leaf.keys
+                start = 0 if low is None else bisect_left(keys, low, 0, end)
+                yield from reversed(keys[start:end])
+                if start > 0:
+                    return
+                leaf = leaf.prev
+                end = len(leaf.keys) if leaf is not None else 0
+
+    def items(self, low=None, high=None):
+        """Lazily iterate over the (key, value) pairs with keys in [low, high)."""
+        leaf = self._edge_leaf(False) if low is None else self._find_leaf(low)
+        idx = 0 if low is None else bisect_left(leaf.keys, low)
+        while leaf is not None:
+            keys = leaf.keys
+            end = len(keys) if high is None else bisect_left(keys, high, idx)
+            yield from zip(keys[idx:end], leaf.values[idx:end])
+            if end < len(keys):
+                return
+            leaf = leaf.next
+            idx = 0
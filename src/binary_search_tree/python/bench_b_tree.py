@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#################################################
+""" bench_b_tree.py
+# # Benchmark for B+ Tree vs Binary Search Tree(BST) & AVL Tree
+#   On random keys, reports insert/lookup/remove ops/sec, a full in-order
+#   traversal, range scans, and the memory per key, for a few fanouts.
+#   Usage: python bench_b_tree.py [num_keys] [num_scans]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+import tracemalloc
+from random import sample, randrange
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import binary_search_tree as bst
+import b_tree as bt
+##################################################
+# Benchmark
+##################################################
+NUM_KEYS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+NUM_SCANS = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+SCAN_WIDTH = 1000
+
+def ops_per_sec(func, keys):
+    """Get the rate of func(key) calls over keys."""
+    start = perf_counter()
+    for key in keys:
+        func(key)
+    return len(keys) / (perf_counter() - start)
+
+def scan(tree, lows):
+    """Get the ms taken to consume irange(low, low + SCAN_WIDTH) for each low."""
+    start = perf_counter()
+    for low in lows:
+        for _ in tree.irange(low, low + SCAN_WIDTH):
+            pass
+    return (perf_counter() - start) * 1e3
+
+KEYS = sample(range(NUM_KEYS * 10), NUM_KEYS)
+LOWS = [randrange(NUM_KEYS * 10) for _ in range(NUM_SCANS)]
+TREES = [("BinarySearchTree", bst.BinarySearchTree), ("AVLTree", bst.AVLTree)]
+TREES += [("BPlusTree({})".format(fanout), lambda fanout=fanout: bt.BPlusTree(fanout))
+          for fanout in (16, 64, 256)]
+print("==== {} RANDOM KEYS | {} SCANS OF WIDTH {} ====".format(NUM_KEYS, NUM_SCANS, SCAN_WIDTH))
+print("{:>18} | {:>11} | {:>11} | {:>11} | {:>9} | {:>11} | {:>9}".format(
+    "tree", "insert op/s", "lookup op/s", "in_order ms", "scans ms", "remove op/s", "bytes/key"))
+for name, tree_class in TREES:
+    tracemalloc.start()
+    TREE = tree_class()
+    for key in KEYS:
+        TREE.insert(key)
+    KEY_BYTES = tracemalloc.get_traced_memory()[0] / TREE.size()
+    tracemalloc.stop()
+    TREE = tree_class()
+    INSERT_RATE = ops_per_sec(TREE.insert, KEYS)
+    # BST: floor(key) is its exact-match lookup.
+    LOOKUP_RATE = ops_per_sec(getattr(TREE, "contains", None) or TREE.floor, KEYS)
+    START = perf_counter()
+    TREE.in_order(False)
+    IN_ORDER_MS = (perf_counter() - START) * 1e3
+    SCANS_MS = scan(TREE, LOWS)
+    REMOVE_RATE = ops_per_sec(TREE.remove, KEYS)
+    print("{:>18} | {:>11.0f} | {:>11.0f} | {:>11.1f} | {:>9.1f} | {:>11.0f} | {:>9.1f}".format(
+        name, INSERT_RATE, LOOKUP_RATE, IN_ORDER_MS, SCANS_MS, REMOVE_RATE, KEY_BYTES))
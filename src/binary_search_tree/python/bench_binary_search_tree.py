@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+#################################################
+""" bench_binary_search_tree.py
+# # Benchmark for Binary Search Tree(BST) vs AVL Tree
+#   Inserts sequential keys (the worst case of a plain BST), then looks up,
+#   traverses and removes them, reporting ops/sec and the final tree height.
+#   The plain BST is capped at bst_keys, as it degenerates into a linked list.
+#   Then reports ops/sec on random keys, the memory per node,
+#   and bulk-loading (from_sorted, union) against repeated inserts.
+#   Usage: python bench_binary_search_tree.py [num_keys] [bst_keys]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+import tracemalloc
+from random import sample
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import binary_search_tree as bst
+##################################################
+# Benchmark
+##################################################
+NUM_KEYS = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+BST_KEYS = int(sys.argv[2]) if len(sys.argv) > 2 else 900
+
+def ops_per_sec(func, keys):
+    """Get the rate of func(key) calls over keys."""
+    start = perf_counter()
+    for key in keys:
+        func(key)
+    return len(keys) / (perf_counter() - start)
+
+def bench(tree, num_keys):
+    """Get (insert, remove ops/sec, height after inserts) for sequential keys."""
+    keys = range(num_keys)
+    insert_rate = ops_per_sec(tree.insert, keys)
+    height = tree.height()
+    remove_rate = ops_per_sec(tree.remove, keys)
+    return insert_rate, remove_rate, height
+
+print("==== SEQUENTIAL KEYS: BST vs AVL TREE ====")
+print("{:>18} | {:>9} | {:>12} | {:>12} | {:>7}".format("tree", "keys", "insert op/s",
+                                                        "remove op/s", "height"))
+for name, tree, num_keys in [("BinarySearchTree", bst.BinarySearchTree(), BST_KEYS),
+                             ("AVLTree", bst.AVLTree(), BST_KEYS),
+                             ("AVLTree", bst.AVLTree(), NUM_KEYS)]:
+    insert_rate, remove_rate, height = bench(tree, num_keys)
+    print("{:>18} | {:>9} | {:>12.0f} | {:>12.0f} | {:>7}".format(name, num_keys, insert_rate,
+                                                                 remove_rate, height))
+
+RANDOM_KEYS = sample(range(NUM_KEYS * 10), min(NUM_KEYS, 200000))
+print("\n==== {} RANDOM KEYS ====".format(len(RANDOM_KEYS)))
+print("{:>18} | {:>12} | {:>12} | {:>12} | {:>10}".format("tree", "insert op/s", "in_order ms",
+                                                         "remove op/s", "bytes/node"))
+for name, tree_class in [("BinarySearchTree", bst.BinarySearchTree), ("AVLTree", bst.AVLTree)]:
+    tracemalloc.start()
+    TREE = tree_class()
+    for key in RANDOM_KEYS:
+        TREE.insert(key)
+    NODE_BYTES = tracemalloc.get_traced_memory()[0] / TREE.size()
+    tracemalloc.stop()
+    TREE = tree_class()
+    INSERT_RATE = ops_per_sec(TREE.insert, RANDOM_KEYS)
+    START = perf_counter()
+    TREE.in_order(False)
+    IN_ORDER_MS = (perf_counter() - START) * 1e3
+    REMOVE_RATE = ops_per_sec(TREE.remove, RANDOM_KEYS)
+    print("{:>18} | {:>12.0f} | {:>12.1f} | {:>12.0f} | {:>10.1f}".format(
+        name, INSERT_RATE, IN_ORDER_MS, REMOVE_RATE, NODE_BYTES))
+
+print("\n==== BULK-LOAD {} SORTED KEYS ====".format(NUM_KEYS))
+for name, tree_class in [("BinarySearchTree", bst.BinarySearchTree), ("AVLTree", bst.AVLTree)]:
+    START = perf_counter()
+    TREE = tree_class.from_sorted(range(NUM_KEYS))
+    BULK_MS = (perf_counter() - START) * 1e3
+    START = perf_counter()
+    TREE.union(tree_class.from_sorted(range(NUM_KEYS // 2, NUM_KEYS * 3 // 2)))
+    UNION_MS = (perf_counter() - START) * 1e3
+    print("{:>18} | from_sorted: {:>8.1f} ms | height: {:>3} | union (+50%): {:>8.1f} ms".format(
+        name, BULK_MS, TREE.height(), UNION_MS))
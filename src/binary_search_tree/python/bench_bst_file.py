@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+#################################################
+""" bench_bst_file.py
+# # Benchmark for the Memory-Mapped BST File vs rebuilding an AVL Tree
+#   Compares process-start cost (rebuild from sorted keys vs mmap the file),
+#   lookup ops/sec and range scans, for int keys.
+#   Usage: python bench_bst_file.py [num_keys] [num_lookups]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import os
+import sys
+import tempfile
+from random import randrange
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import binary_search_tree as bst
+import bst_file as bf
+##################################################
+# Benchmark
+##################################################
+NUM_KEYS = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+NUM_LOOKUPS = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+PATH = os.path.join(tempfile.mkdtemp(), "bench.bst")
+KEYS = range(0, NUM_KEYS * 3, 3)
+QUERIES = [randrange(NUM_KEYS * 3) for _ in range(NUM_LOOKUPS)]
+
+START = perf_counter()
+bf.dump_tree(KEYS, PATH)
+print("==== {} INT KEYS | dump: {:.1f} ms | file: {:.1f} MB ====".format(
+    NUM_KEYS, (perf_counter() - START) * 1e3, os.path.getsize(PATH) / 2 ** 20))
+START = perf_counter()
+TREE = bst.AVLTree.from_sorted(KEYS)
+REBUILD_MS = (perf_counter() - START) * 1e3
+START = perf_counter()
+MAPPED = bf.load_tree(PATH)
+LOAD_MS = (perf_counter() - START) * 1e3
+print("{:>10} | {:>10} | {:>12} | {:>14}".format("tree", "start ms", "lookup op/s",
+                                                 "1k scans ms"))
+for name, tree, start_ms, lookup in [("AVLTree", TREE, REBUILD_MS, TREE.floor),
+                                     ("MappedBST", MAPPED, LOAD_MS, MAPPED.floor)]:
+    START = perf_counter()
+    for query in QUERIES:
+        lookup(query)
+    LOOKUP_RATE = NUM_LOOKUPS / (perf_counter() - START)
+    START = perf_counter()
+    for query in QUERIES[:1000]:
+        for _ in tree.irange(query, query + 3000):
+            pass
+    SCANS_MS = (perf_counter() - START) * 1e3
+    print("{:>10} | {:>10.2f} | {:>12.0f} | {:>14.1f}".format(name, start_ms, LOOKUP_RATE,
+                                                             SCANS_MS))
+MAPPED.close()
+os.remove(PATH)
+os.rmdir(os.path.dirname(PATH))
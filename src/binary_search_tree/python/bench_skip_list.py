@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+#################################################
+""" bench_skip_list.py
+# # Benchmark for the Concurrent Skip List vs a globally locked AVL Tree
+#   N threads (default 8) run a mixed workload on their own key stripes:
+#   inserts, lookups, removes and short range scans. Reports total ops/sec.
+#   Note: on a GIL build of CPython threads do not run Python code in parallel,
+#   so this mostly measures locking overhead; fine-grained locking pays off
+#   on free-threaded builds.
+#   Usage: python bench_skip_list.py [num_threads] [ops_per_thread]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+import threading
+from random import Random
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import binary_search_tree as bst
+import skip_list as sl
+##################################################
+# Benchmark
+##################################################
+NUM_THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+OPS = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+class LockedAVLTree:
+    """AVL Tree behind one global lock (the baseline)."""
+    def __init__(self):
+        self.tree = bst.AVLTree()
+        self.lock = threading.Lock()
+
+    def insert(self, data):
+        with self.lock:
+            return self.tree.insert(data)
+
+    def remove(self, data):
+        with self.lock:
+            return self.tree.remove(data)
+
+    def contains(self, data):
+        with self.lock:
+            return self.tree.floor(data) == data
+
+    def irange(self, low, high):
+        with self.lock:
+            return list(self.tree.irange(low, high))
+
+def worker(container, idx):
+    """Run OPS mixed operations on the keys = idx (mod NUM_THREADS)."""
+    rand = Random(idx)
+    for _ in range(OPS):
+        key = rand.randrange(OPS) * NUM_THREADS + idx
+        choice = rand.random()
+        if choice < 0.4:
+            container.insert(key)
+        elif choice < 0.8:
+            container.contains(key)
+        elif choice < 0.95:
+            container.remove(key)
+        else:
+            for _ in container.irange(key, key + 100):
+                pass
+
+def bench(container, num_threads):
+    """Get the total ops/sec of num_threads workers on container."""
+    threads = [threading.Thread(target=worker, args=(container, idx))
+               for idx in range(num_threads)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return num_threads * OPS / (perf_counter() - start)
+
+print("==== MIXED WORKLOAD: 40% insert, 40% lookup, 15% remove, 5% scan ====")
+print("{:>14} | {:>8} | {:>10}".format("container", "threads", "ops/s"))
+for num_threads in sorted({1, NUM_THREADS}):
+    for name, container_class in [("LockedAVLTree", LockedAVLTree), ("SkipList", sl.SkipList)]:
+        print("{:>14} | {:>8} | {:>10.0f}".format(name, num_threads,
+                                                  bench(container_class(), num_threads)))
@@ -5,67 +5,215 @@
 #   Supports:
 #      - Insert, remove.
 #      - Size, min, max, height.
-#      - Recursive traverse:
+#      - Order statistics (subtree sizes):
+#          > select(k-th smallest), rank, count_range.
+#      - Ordered queries:
+#          > floor, ceiling, successor, predecessor, irange(lazy range iterator).
+#      - Bulk operations (linear time):
+#          > from_sorted (balanced bulk-load), union, intersection, difference.
+#      - Traverse (recursion-free, explicit stack/queue engine):
 #          > {Pre, in, reverse in, post}-order, level
-#      - Iterative traverse:
+#      - Iterative traverse (standalone showcase versions):
 #          > {Pre, in, post}-order, level
+# # AVL Tree (self-balancing BST) Implementation
+#   Supports:
+#      - Everything BST supports, with O(log(n)) height guaranteed:
+#          > Iterative insert/remove, rebalanced by rotations.
 """
 #################################################
 # ###  Author: Samyuel Danyo
 # ###  Date: 07/06/2020
-# ###  Last Edit: 07/06/2020
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from collections import deque
 ##################################################
 # Implementation
 ##################################################
 class BSTNode:
-    """Node for a Binary Search Tree(BST) implementation."""
+    """Node for a Binary Search Tree(BST) implementation.
+       __slots__ drops the per-node __dict__ (about half the node's memory).
+       size is the number of nodes in the subtree rooted at the node."""
+    __slots__ = ("data", "left", "right", "size")
+
     def __init__(self, data):
         self.data = data
         self.left = None
         self.right = None
+        self.size = 1
 
 class BinarySearchTree:
-    """Binary Search Tree(BST) implementation."""
+    """Binary Search Tree(BST) implementation.
+       Every operation is iterative (no recursion), so degenerate trees cannot
+       hit the recursion limit - they are just O(n) per operation."""
     def __init__(self, root=None):
         self.root = root
         self.num_nodes = 0 + (root is not None)
 
-    def _insert(self, root, data, feedback):
-        """Utility function to insert BSTNode(data) in the tree."""
-        if root is None:
-            root = BSTNode(data)
-            self.num_nodes += 1
-            feedback.append(True)
-        elif root.data == data:
-            feedback.append(False)
-        elif root.data > data:
-            root.left = self._insert(root.left, data, feedback)
+    def _new_node(self, data):
+        """Utility function to create the tree's node for data."""
+        return BSTNode(data)
+
+    def _bulk_node(self, data, size):
+        """Utility function to create the root node of a bulk-loaded subtree of size nodes."""
+        node = self._new_node(data)
+        node.size = size
+        return node
+
+    def _bulk_load(self, keys):
+        """Utility function to replace the tree with a perfectly balanced one
+           holding keys (a sorted list of unique data), iterative - O(n)."""
+        self.root = None
+        self.num_nodes = len(keys)
+        # (low, high, parent, is_left): build keys[low:high] under parent.
+        stack = [(0, len(keys), None, False)]
+        while stack:
+            low, high, parent, is_left = stack.pop()
+            if low >= high:
+                continue
+            mid = (low + high) // 2
+            node = self._bulk_node(keys[mid], high - low)
+            if parent is None:
+                self.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((low, mid, node, True))
+            stack.append((mid + 1, high, node, False))
+        return self
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from sorted data in O(n).
+           Duplicates are dropped. Unsorted data is sorted first (O(n*log(n)))."""
+        return cls()._bulk_load(cls._sorted_keys(iterable))
+
+    @staticmethod
+    def _sorted_keys(iterable):
+        """Utility function to get the data of iterable as a sorted list of unique keys.
+           Duplicates are dropped, unsorted data is sorted (with a warning)."""
+        keys = []
+        ordered = True
+        for data in iterable:
+            if keys and data <= keys[-1]:
+                if data == keys[-1]:
+                    continue
+                ordered = False
+            keys.append(data)
+        if not ordered:
+            print("WARNING: Data NOT Sorted! Sorting it.")
+            keys = sorted(set(keys))
+        return keys
+
+    def _merge(self, other, keep_left, keep_both, keep_right):
+        """Utility function to merge the sorted streams of the BST and other, in O(n+m).
+           keep_* select the data found only in the BST, in both, only in other.
+           A plain iterable is checked first: duplicates are dropped and unsorted
+           data is sorted (O(m*log(m))), as in from_sorted.
+           Returns a new (balanced) tree of the BST's kind."""
+        if not isinstance(other, BinarySearchTree):
+            other = self._sorted_keys(other)
+        keys = []
+        left = iter(self)
+        right = iter(other)
+        end = object()
+        ldata = next(left, end)
+        rdata = next(right, end)
+        while ldata is not end and rdata is not end:
+            if ldata < rdata:
+                if keep_left:
+                    keys.append(ldata)
+                ldata = next(left, end)
+            elif rdata < ldata:
+                if keep_right:
+                    keys.append(rdata)
+                rdata = next(right, end)
+            else:
+                if keep_both:
+                    keys.append(ldata)
+                ldata = next(left, end)
+                rdata = next(right, end)
+        if keep_left and ldata is not end:
+            keys.append(ldata)
+            keys.extend(left)
+        if keep_right and rdata is not end:
+            keys.append(rdata)
+            keys.extend(right)
+        return type(self)()._bulk_load(keys)
+
+    def union(self, other):
+        """Get a new tree with the data in the BST or other (a BST or sorted iterable)."""
+        return self._merge(other, True, True, True)
+
+    def intersection(self, other):
+        """Get a new tree with the data in both the BST and other (a BST or sorted iterable)."""
+        return self._merge(other, False, True, False)
+
+    def difference(self, other):
+        """Get a new tree with the data in the BST but not in other (a BST or sorted iterable)."""
+        return self._merge(other, True, False, False)
+
+    def _replace_child(self, parent, old, new):
+        """Utility function to put new in place of parent's child old (or of the root)."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            root.right = self._insert(root.right, data, feedback)
-        return root
+            parent.right = new
+
+    def _fix_path(self, path, delta):
+        """Utility function to restore the tree's invariants along path (root -> changed node)
+           after an insert(delta=1)/remove(delta=-1): the subtree sizes."""
+        for node in path:
+            node.size += delta
+
+    @staticmethod
+    def _size(node):
+        """Get the size of the subtree at node in O(1)."""
+        if node is None:
+            return 0
+        return node.size
 
     def insert(self, data):
         """Insert BSTNode(data) in the tree.
            Returns:
                feedback (Boolean): True if the data was not in the BST
                                    and was added, False otherwise."""
-        feedback = []
-        self.root = self._insert(self.root, data, feedback)
-        return feedback[0]
+        path = []
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                return False
+            path.append(node)
+            node = node.left if node.data > data else node.right
+        node = self._new_node(data)
+        self.num_nodes += 1
+        if not path:
+            self.root = node
+            return True
+        if path[-1].data > data:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self._fix_path(path, 1)
+        return True
 
     def size(self):
         """Get the number of nodes in the BST."""
         return self.num_nodes
 
     def _height(self, root):
-        """Utility function for getting the height of the BST."""
-        if root is None:
-            return 0
-        lheight = self._height(root.left)
-        rheight = self._height(root.right)
-        if lheight > rheight:
-            return lheight+1
-        return rheight+1
+        """Utility function for getting the height of the BST (level by level)."""
+        height = 0
+        level = [root] if root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right)
+                     if child is not None]
+        return height
 
     def height(self):
         """Get the height of the BST."""
@@ -75,9 +223,9 @@ class BinarySearchTree:
         """Utility function for getting the minimum node in the BST."""
         if root is None:
             return None
-        if root.left is None:
-            return root.data
-        return self._get_min(root.left)
+        while root.left is not None:
+            root = root.left
+        return root.data
 
     def get_min(self):
         """Get the minimum node in the BST."""
@@ -87,52 +235,158 @@ class BinarySearchTree:
         """Utility function for getting the maximum node in the BST."""
         if root is None:
             return None
-        if root.right is None:
-            return root.data
-        return self._get_max(root.right)
+        while root.right is not None:
+            root = root.right
+        return root.data
 
     def get_max(self):
         """Get the maximum node in the BST."""
         return self._get_max(self.root)
 
-    def _remove(self, root, data, feedback):
-        """Utility function to remove <data> from the BST."""
-        if root is None:
-            feedback.append(False)
-            return None
-        if root.data == data:
-            feedback.append(True)
-            self.num_nodes -= 1
-            if root.right and root.left:
-                next_min = self._get_min(root.right)
-                root.data = next_min
-                root.right = self._remove(root.right, next_min, feedback)
-                return root
-            if root.right:
-                return root.right
-            return root.left
-        if root.data > data:
-            root.left = self._remove(root.left, data, feedback)
-        else:
-            root.right = self._remove(root.right, data, feedback)
-        return root
-
     def remove(self, data):
         """Remove <data> from the BST.
            Returns:
                feedback (Boolean): True if the data was in the BST
                                    and was removed, False otherwise."""
-        feedback = []
-        self._remove(self.root, data, feedback)
-        return feedback[0]
+        path = []
+        node = self.root
+        while node is not None and node.data != data:
+            path.append(node)
+            node = node.left if node.data > data else node.right
+        if node is None:
+            return False
+        if node.left is not None and node.right is not None:
+            # Copy in the in-order successor, then unlink the successor instead.
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        self.num_nodes -= 1
+        self._fix_path(path, -1)
+        return True
+
+    def select(self, k):
+        """Get the k-th smallest data in the BST (k=0 is the minimum)."""
+        if not 0 <= k < self._size(self.root):
+            print("WARNING: Index Out of Range!")
+            return None
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.data
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, data):
+        """Get the number of nodes in the BST with data smaller than <data>."""
+        rank = 0
+        node = self.root
+        while node is not None:
+            if node.data < data:
+                rank += self._size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def count_range(self, low, high):
+        """Get the number of nodes in the BST with low <= data < high."""
+        if high <= low:
+            return 0
+        return self.rank(high) - self.rank(low)
+
+    def _closest(self, data, below, inclusive):
+        """Utility function to find the closest data below (or above) <data>."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                if inclusive:
+                    return node.data
+                node = node.left if below else node.right
+            elif (node.data < data) == below:
+                # node is on the requested side: remember it, look for a closer one.
+                best = node.data
+                node = node.right if below else node.left
+            else:
+                node = node.left if below else node.right
+        return best
+
+    def floor(self, data):
+        """Get the largest data in the BST <= <data> (None if there is none)."""
+        return self._closest(data, True, True)
+
+    def ceiling(self, data):
+        """Get the smallest data in the BST >= <data> (None if there is none)."""
+        return self._closest(data, False, True)
+
+    def predecessor(self, data):
+        """Get the largest data in the BST < <data> (None if there is none)."""
+        return self._closest(data, True, False)
+
+    def successor(self, data):
+        """Get the smallest data in the BST > <data> (None if there is none)."""
+        return self._closest(data, False, False)
+
+    def irange(self, low=None, high=None, reverse=False):
+        """Lazily iterate over the data in [low, high) (None - unbounded), in sorted
+           (or reverse sorted) order. Subtrees outside the range are never visited,
+           so getting the first k items costs O(log(n) + k)."""
+        stack = []
+        node = self.root
+        if not reverse:
+            while node is not None or stack:
+                while node is not None:
+                    if low is not None and node.data < low:
+                        node = node.right
+                    else:
+                        stack.append(node)
+                        node = node.left
+                if not stack:
+                    return
+                node = stack.pop()
+                if high is not None and node.data >= high:
+                    return
+                yield node.data
+                node = node.right
+        else:
+            while node is not None or stack:
+                while node is not None:
+                    if high is not None and node.data >= high:
+                        node = node.left
+                    else:
+                        stack.append(node)
+                        node = node.right
+                if not stack:
+                    return
+                node = stack.pop()
+                if low is not None and node.data < low:
+                    return
+                yield node.data
+                node = node.left
+
+    def __iter__(self):
+        return self.irange()
 
     def _pre_order(self, root, callback=print):
         """Utility function to pre-order(nlr) traverse the BST."""
-        if root is None:
-            return
-        callback(root.data)
-        self._pre_order(root.left, callback)
-        self._pre_order(root.right, callback)
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            callback(node.data)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
     def pre_order(self, verbose=True):
         """Pre-order(nlr, topologically-sorted) traverse the BST."""
@@ -145,7 +399,8 @@ class BinarySearchTree:
     def pre_order_iter(self, verbose=True):
         """Pre-order(nlr, topologically-sorted) traverse the BST, iterative implementation."""
         stack = []
-        stack.append(self.root)
+        if self.root is not None:
+            stack.append(self.root)
         traversal = []
         while stack:
             node = stack.pop()
@@ -163,11 +418,15 @@ class BinarySearchTree:
 
     def _in_order(self, root, callback=print):
         """Utility function to in-order(lnr, min->max sorted) traverse the BST."""
-        if root is None:
-            return
-        self._in_order(root.left, callback)
-        callback(root.data)
-        self._in_order(root.right, callback)
+        stack = []
+        node = root
+        while node is not None or stack:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            callback(node.data)
+            node = node.right
 
     def in_order(self, verbose=True):
         """In-order(lnr, min->max sorted) traverse the BST."""
@@ -194,12 +453,16 @@ class BinarySearchTree:
         return traversal
 
     def _rev_in_order(self, root, callback=print):
-        """Utility function to reverse in-order(lnr, max->min sorted) traverse the BST."""
-        if root is None:
-            return
-        self._rev_in_order(root.right, callback)
-        callback(root.data)
-        self._rev_in_order(root.left, callback)
+        """Utility function to reverse in-order(rnl, max->min sorted) traverse the BST."""
+        stack = []
+        node = root
+        while node is not None or stack:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            callback(node.data)
+            node = node.left
 
     def rev_in_order(self, verbose=True):
         """Reverse in-order(lnr, max->min sorted) traverse the BST."""
@@ -211,11 +474,21 @@ class BinarySearchTree:
 
     def _post_order(self, root, callback=print):
         """Utility function to post-order(lrn, leaves->root) traverse the BST."""
-        if root is None:
-            return
-        self._post_order(root.left, callback)
-        self._post_order(root.right, callback)
-        callback(root.data)
+        stack = []
+        node = root
+        last = None
+        while node is not None or stack:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack[-1]
+            if node.right is not None and node.right is not last:
+                node = node.right
+                continue
+            stack.pop()
+            callback(node.data)
+            last = node
+            node = None
 
     def post_order(self, verbose=True):
         """Post-order(lrn, leaves->root) traverse the BST."""
@@ -227,7 +500,7 @@ class BinarySearchTree:
 
     def post_order_iter(self, verbose=True):
         """Post-order(lrn, leaves->root) traverse the BST, iterative implementation."""
-        tmp = [self.root]
+        tmp = [self.root] if self.root is not None else []
         full = []
         traversal = []
         while tmp:
@@ -244,45 +517,135 @@ class BinarySearchTree:
             print(traversal)
         return traversal
 
-    def _print_level(self, root, lvl):
-        """Utility function for printing <lvl> level of the BST."""
-        if root is None:
-            return
-        if lvl == 1:
-            print(root.data, end=' ')
-        else:
-            self._print_level(root.left, lvl-1)
-            self._print_level(root.right, lvl-1)
+    def _levels(self):
+        """Utility function to get the BST's levels (lists of nodes), top-down."""
+        levels = []
+        level = [self.root] if self.root is not None else []
+        while level:
+            levels.append(level)
+            level = [child for node in level for child in (node.left, node.right)
+                     if child is not None]
+        return levels
 
     def print_level(self, lvl):
         """Print <lvl> level of the BST."""
         print("Level {}:".format(lvl), end=" ")
-        self._print_level(self.root, lvl)
+        levels = self._levels()
+        if 0 < lvl <= len(levels):
+            for node in levels[lvl - 1]:
+                print(node.data, end=' ')
         print()
 
     def lvl_traverse(self):
         """Level traverse the BST."""
-        height = self.height()
-        for lvl in range(1, height+1):
-            self.print_level(lvl)
+        for lvl, level in enumerate(self._levels(), 1):
+            print("Level {}:".format(lvl), end=" ")
+            for node in level:
+                print(node.data, end=' ')
+            print()
 
     def lvl_traverse_iter(self):
         """Level traverse the BST, iterative(BFS) implementation."""
         if self.root is None:
             return
-        queue = [self.root]
-        tmp = []
+        queue = deque([self.root])
+        tmp = deque()
         lvl = 1
         print("Level {}:".format(lvl), end=" ")
         while queue:
-            node = queue.pop()
+            node = queue.popleft()
             print(node.data, end=' ')
             if node.left:
-                tmp.insert(0, node.left)
+                tmp.append(node.left)
             if node.right:
-                tmp.insert(0, node.right)
+                tmp.append(node.right)
             if not queue and tmp:
                 lvl += 1
                 queue = tmp
-                tmp = []
+                tmp = deque()
                 print("\nLevel {}:".format(lvl), end=" ")
+
+##################################################
+# AVL Tree Implementation
+##################################################
+class AVLNode(BSTNode):
+    """Node for an AVL Tree, caching the height of its subtree."""
+    __slots__ = ("height",)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+class AVLTree(BinarySearchTree):
+    """AVL Tree implementation - self-balancing Binary Search Tree.
+       The heights of every node's subtrees differ by at most one, which
+       keeps the tree height below 1.44*log2(n+2). Insert and remove walk
+       down iteratively, recording the path, then rebalance it bottom-up.
+       Complexity: Search | Insert | Remove | Height
+                 O(log(n)) | O(log(n)) | O(log(n)) | O(1)"""
+    def _new_node(self, data):
+        """Utility function to create the tree's node for data."""
+        return AVLNode(data)
+
+    def _height(self, root):
+        """Get the (cached) height of the subtree at root."""
+        if root is None:
+            return 0
+        return root.height
+
+    def _bulk_node(self, data, size):
+        """Utility function to create the root node of a bulk-loaded subtree of size nodes.
+           Bulk-loading splits at the middle, so the subtree's height is size.bit_length()."""
+        node = super()._bulk_node(data, size)
+        node.height = size.bit_length()
+        return node
+
+    def _update(self, node):
+        """Utility function to recompute the cached fields of node from its children."""
+        node.height = max(self._height(node.left), self._height(node.right)) + 1
+        node.size = self._size(node.left) + self._size(node.right) + 1
+
+    def _rotate_left(self, node):
+        """Utility function to left-rotate the subtree at node. Returns the new root."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        """Utility function to right-rotate the subtree at node. Returns the new root."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _balance(self, node):
+        """Utility function to restore the AVL property at node. Returns the subtree's new root."""
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _fix_path(self, path, delta):
+        """Utility function to update the sizes on path (root -> leaf), then rebalance
+           its nodes bottom-up. Stops early once a subtree keeps its height without rotating."""
+        super()._fix_path(path, delta)
+        for idx in range(len(path) - 1, -1, -1):
+            node = path[idx]
+            height = node.height
+            balanced = self._balance(node)
+            if balanced is not node:
+                self._replace_child(path[idx - 1] if idx else None, node, balanced)
+            elif node.height == height:
+                return
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+#################################################
+""" bst_file.py
+# # Compact Binary Search Tree File + Memory-Mapped Read-Only BST Implementation
+#   A tree's keys are written once, in Eytzinger (implicit BFS) order: slot k
+#   holds a node whose children are slots 2k and 2k+1, so the file *is* a
+#   balanced BST with no pointers. Numeric keys are fixed-width (array typecode);
+#   str/bytes keys go to a blob, addressed by a fixed-width offsets table.
+#   The file is queried in place through mmap - no BSTNode objects are built,
+#   and processes mapping the same file share one page-cached copy.
+#   Supports:
+#      - dump_tree(tree/sorted iterable -> file), load_tree(file -> MappedBST).
+#      - Size, min, max, height, contains, floor, ceiling.
+#      - Traverse:
+#          > in-order, reverse in-order, irange(lazy range iterator).
+#   File layout (native byte order, recorded in the header):
+#      - Header (32 bytes): magic, version, key typecode, little-endian flag, count, blob size.
+#      - Numeric keys: count * itemsize.
+#      - str/bytes keys: (count+1) uint64 offsets into the blob, then the blob.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import mmap
+import struct
+import sys
+from array import array
+##################################################
+# Implementation
+##################################################
+MAGIC = b"BSTF"
+VERSION = 1
+HEADER = struct.Struct("<4sBcBxQQ8x")
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+# Variable-width key typecodes: 's' - str (utf-8 bytes order == code point order), 'y' - bytes.
+BLOB_TYPECODES = "sy"
+
+def _eytzinger(keys):
+    """Utility function to lay out keys (sorted) in Eytzinger order (slot k -> index k-1)
+       by an iterative in-order walk of the implicit tree."""
+    num_keys = len(keys)
+    layout = [None] * num_keys
+    stack = []
+    idx = 0
+    slot = 1
+    while stack or slot <= num_keys:
+        while slot <= num_keys:
+            stack.append(slot)
+            slot *= 2
+        slot = stack.pop()
+        layout[slot - 1] = keys[idx]
+        idx += 1
+        slot = 2 * slot + 1
+    return layout
+
+def dump_tree(tree, path, typecode="q"):
+    """Serialize the keys of tree (a BST, or any sorted iterable of unique keys) to path.
+       typecode: an array typecode for numeric keys, 's' for str keys, 'y' for bytes keys.
+       Returns:
+           num_keys (Int): the number of keys written (None on error)."""
+    if typecode not in NUMERIC_TYPECODES + BLOB_TYPECODES:
+        print("ERROR: Unsupported key typecode '{}'!".format(typecode))
+        return None
+    keys = list(tree)
+    for idx in range(1, len(keys)):
+        if keys[idx] <= keys[idx - 1]:
+            print("ERROR: Keys NOT Sorted & Unique! Nothing written.")
+            return None
+    layout = _eytzinger(keys)
+    blob = b""
+    try:
+        if typecode in NUMERIC_TYPECODES:
+            sections = [array(typecode, layout)]
+        else:
+            chunks = [key.encode() if typecode == "s" else bytes(key) for key in layout]
+            offsets = array("Q", [0])
+            for chunk in chunks:
+                offsets.append(offsets[-1] + len(chunk))
+            blob = b"".join(chunks)
+            sections = [offsets, blob]
+    except (TypeError, OverflowError, AttributeError) as err:
+        print("ERROR: Keys do not fit typecode '{}': {}".format(typecode, err))
+        return None
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, typecode.encode(),
+                               sys.byteorder == "little", len(keys), len(blob)))
+        for section in sections:
+            file.write(section)
+    return len(keys)
+
+def load_tree(path):
+    """Memory-map the tree file at path (read-only).
+       Returns:
+           tree (MappedBST): the mapped tree (None on error)."""
+    with open(path, "rb") as file:
+        if not file.read(HEADER.size):
+            print("ERROR: Empty File '{}'!".format(path))
+            return None
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < HEADER.size:
+        print("ERROR: Truncated File '{}'!".format(path))
+        buffer.close()
+        return None
+    magic, version, typecode, little, num_keys, blob_size = HEADER.unpack_from(buffer)
+    typecode = typecode.decode()
+    if magic != MAGIC or version != VERSION or \
+       typecode not in NUMERIC_TYPECODES + BLOB_TYPECODES:
+        print("ERROR: Not a BST File (v{}) '{}'!".format(VERSION, path))
+        buffer.close()
+        return None
+    if bool(little) != (sys.byteorder == "little"):
+        print("ERROR: BST File '{}' has the wrong byte order for this machine!".format(path))
+        buffer.close()
+        return None
+    if typecode in NUMERIC_TYPECODES:
+        size = num_keys * array(typecode).itemsize
+    else:
+        size = (num_keys + 1) * 8 + blob_size
+    if len(buffer) != HEADER.size + size:
+        print("ERROR: Truncated File '{}'!".format(path))
+        buffer.close()
+        return None
+    return MappedBST(buffer, typecode, num_keys)
+
+class MappedBST:
+    """Read-only Binary Search Tree over a memory-mapped Eytzinger layout.
+       Slot k (1-based) is the node, slots 2k & 2k+1 its children, so a search
+       is a branch-light descent over one array, and neighbours are found by
+       moving within the implicit tree. Keys are decoded only when returned.
+       Complexity: Search | Min/Max | Range scan (k keys) | Load
+                 O(log(n)) | O(log(n)) | O(log(n) + k) | O(1) (pages fault in lazily)"""
+    def __init__(self, buffer, typecode, num_keys):
+        self._buffer = buffer
+        self.typecode = typecode
+        self.num_keys = num_keys
+        view = memoryview(buffer)
+        if typecode in NUMERIC_TYPECODES:
+            itemsize = array(typecode).itemsize
+            self._keys = view[HEADER.size:HEADER.size + num_keys * itemsize].cast(typecode)
+            self._offsets = None
+        else:
+            end = HEADER.size + (num_keys + 1) * 8
+            self._offsets = view[HEADER.size:end].cast("Q")
+            self._blob = view[end:]
+            self._keys = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the views and unmap the file."""
+        if self._keys is not None:
+            self._keys.release()
+        else:
+            self._offsets.release()
+            self._blob.release()
+        self._buffer.close()
+
+    def __str__(self):
+        return str(self.in_order(False))
+
+    def __iter__(self):
+        return self.irange()
+
+    def _raw(self, slot):
+        """Utility function to get the comparable key at slot (encoded for str/bytes)."""
+        if self._keys is not None:
+            return self._keys[slot - 1]
+        return self._blob[self._offsets[slot - 1]:self._offsets[slot]].tobytes()
+
+    def _decode(self, raw):
+        """Utility function to turn a raw key into the user's key."""
+        if self.typecode == "s":
+            return raw.decode()
+        return raw
+
+    def _encode(self, key):
+        """Utility function to turn the user's key into a comparable raw key."""
+        if self.typecode == "s":
+            return key.encode()
+        return key
+
+    def size(self):
+        """Get the number of keys in the tree."""
+        return self.num_keys
+
+    def height(self):
+        """Get the height of the (complete) implicit tree."""
+        return self.num_keys.bit_length()
+
+    def _lower_bound(self, raw, strict=False):
+        """Utility function to get the slot of the first key >= raw (> raw if strict),
+           or 0 if there is none. Descends to a leaf, then climbs back over the
+           trailing right-turns to the last left-turn."""
+        slot = 1
+        num_keys = self.num_keys
+        # Fixed-width keys: index the array directly (hot loop).
+        key = self._keys.__getitem__ if self._keys is not None else \
+            lambda idx: self._raw(idx + 1)
+        if strict:
+            while slot <= num_keys:
+                slot = 2 * slot + (key(slot - 1) <= raw)
+        else:
+            while slot <= num_keys:
+                slot = 2 * slot + (key(slot - 1) < raw)
+        return slot >> (~slot & (slot + 1)).bit_length()
+
+    def _first(self):
+        """Utility function to get the slot of the minimum key (0 if empty)."""
+        if not self.num_keys:
+            return 0
+        slot = 1
+        while 2 * slot <= self.num_keys:
+            slot *= 2
+        return slot
+
+    def _last(self):
+        """Utility function to get the slot of the maximum key (0 if empty)."""
+        if not self.num_keys:
+            return 0
+        slot = 1
+        while 2 * slot + 1 <= self.num_keys:
+            slot = 2 * slot + 1
+        return slot
+
+    def _next(self, slot):
+        """Utility function to get the in-order successor slot (0 past the end)."""
+        if 2 * slot + 1 <= self.num_keys:
+            slot = 2 * slot + 1
+            while 2 * slot <= self.num_keys:
+                slot *= 2
+            return slot
+        while slot & 1:
+            slot >>= 1
+        return slot >> 1
+
+    def _prev(self, slot):
+        """Utility function to get the in-order predecessor slot (0 before the start)."""
+        if 2 * slot <= self.num_keys:
+            slot = 2 * slot
+            while 2 * slot + 1 <= self.num_keys:
+                slot = 2 * slot + 1
+            return slot
+        while slot > 1 and not slot & 1:
+            slot >>= 1
+        return slot >> 1
+
+    def contains(self, key):
+        """Check if key is in the tree."""
+        raw = self._encode(key)
+        slot = self._lower_bound(raw)
+        return slot > 0 and self._raw(slot) == raw
+
+    def floor(self, key):
+        """Get the largest key <= key (None if there is none)."""
+        slot = self._lower_bound(self._encode(key), strict=True)
+        slot = self._prev(slot) if slot else self._last()
+        return self._decode(self._raw(slot)) if slot else None
+
+    def ceiling(self, key):
+        """Get the smallest key >= key (None if there is none)."""
+        slot = self._lower_bound(self._encode(key))
+        return self._decode(self._raw(slot)) if slot else None
+
+    def get_min(self):
+        """Get the minimum key in the tree."""
+        slot = self._first()
+        return self._decode(self._raw(slot)) if slot else None
+
+    def get_max(self):
+        """Get the maximum key in the tree."""
+        slot = self._last()
+        return self._decode(self._raw(slot)) if slot else None
+
+    def irange(self, low=None, high=None, reverse=False):
+        """Lazily iterate over the keys in [low, high) (None - unbounded),
+           in sorted (or reverse sorted) order."""
+        raw_low = None if low is None else self._encode(low)
+        raw_high = None if high is None else self._encode(high)
+        if not reverse:
+            slot = self._first() if low is None else self._lower_bound(raw_low)
+            while slot:
+                raw = self._raw(slot)
+                if raw_high is not None and raw >= raw_high:
+                    return
+                yield self._decode(raw)
+                slot = self._next(slot)
+        else:
+            slot = 0 if high is None else self._lower_bound(raw_high)
+            slot = self._prev(slot) if slot else self._last()
+            while slot:
+                raw = self._raw(slot)
+                if raw_low is not None and raw < raw_low:
+                    return
+                yield self._decode(raw)
+                slot = self._prev(slot)
+
+    def in_order(self, verbose=True):
+        """In-order(min->max sorted) traverse the tree."""
+        traversal = list(self.irange())
+        if verbose:
+            print(traversal)
+        return traversal
+
+    def rev_in_order(self, verbose=True):
+        """Reverse in-order(max->min sorted) traverse the tree."""
+        traversal = list(self.irange(reverse=True))
+        if verbose:
+            print(traversal)
+        return traversal
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+#################################################
+""" interval_tree.py
+# # Interval Tree Implementation
+#   An AVL Tree of closed intervals [start, end], ordered by start (then end),
+#   where every node is augmented with the max end in its subtree, so overlap
+#   queries skip every subtree that ends before the query starts.
+#   Supports:
+#      - Insert interval, remove interval.
+#      - Overlapping(point), overlapping(lo, hi).
+#      - Everything the AVL Tree supports (intervals are (start, end) tuples).
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Local Application/Library Specific Imports.
+from binary_search_tree import AVLNode, AVLTree
+##################################################
+# Implementation
+##################################################
+class IntervalNode(AVLNode):
+    """Node for an Interval Tree, caching the max end in its subtree."""
+    __slots__ = ("max_end",)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.max_end = data[1]
+
+class IntervalTree(AVLTree):
+    """Interval Tree implementation - AVL Tree keyed on (start, end),
+       augmented with the subtree max end. The augmentation is kept by the
+       AVL Tree's own hooks: _update (rotations) and _fix_path (insert/remove).
+       Complexity: Insert | Remove | Overlapping (k results)
+                 O(log(n)) | O(log(n)) | O(log(n) + k) typical, O(k*log(n)) worst"""
+    def _new_node(self, data):
+        """Utility function to create the tree's node for data."""
+        return IntervalNode(data)
+
+    def _update_max_end(self, node):
+        """Utility function to recompute the max end of node from its children."""
+        max_end = node.data[1]
+        if node.left is not None and node.left.max_end > max_end:
+            max_end = node.left.max_end
+        if node.right is not None and node.right.max_end > max_end:
+            max_end = node.right.max_end
+        node.max_end = max_end
+
+    def _update(self, node):
+        """Utility function to recompute the cached fields of node from its children."""
+        super()._update(node)
+        self._update_max_end(node)
+
+    def _fix_path(self, path, delta):
+        """Utility function to rebalance path (root -> leaf), then refresh its max ends
+           bottom-up (rebalancing may stop early, but a max end can change all the way up)."""
+        super()._fix_path(path, delta)
+        for node in reversed(path):
+            self._update_max_end(node)
+
+    def _bulk_load(self, keys):
+        """Utility function to bulk-load keys, then compute the max ends bottom-up."""
+        super()._bulk_load(keys)
+        nodes = [self.root] if self.root is not None else []
+        for node in nodes:
+            nodes.extend(child for child in (node.left, node.right) if child is not None)
+        for node in reversed(nodes):
+            self._update_max_end(node)
+        return self
+
+    def insert_interval(self, start, end):
+        """Insert the interval [start, end] in the tree.
+           Returns:
+               feedback (Boolean): True if the interval was not in the tree
+                                   and was added, False otherwise (None on error)."""
+        if end < start:
+            print("ERROR: Invalid Interval [{}, {}]!".format(start, end))
+            return None
+        return self.insert((start, end))
+
+    def remove_interval(self, start, end):
+        """Remove the interval [start, end] from the tree.
+           Returns:
+               feedback (Boolean): True if the interval was in the tree
+                                   and was removed, False otherwise."""
+        return self.remove((start, end))
+
+    def overlapping(self, low, high=None):
+        """Get the intervals overlapping the point low, or [low, high], sorted by start.
+           A pruned in-order walk: subtrees whose max end < low are skipped,
+           and the walk stops at the first start > high."""
+        if high is None:
+            high = low
+        overlaps = []
+        stack = []
+        node = self.root
+        while node is not None or stack:
+            while node is not None and node.max_end >= low:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            start, end = node.data
+            if start > high:
+                break
+            if end >= low:
+                overlaps.append(node.data)
+            node = node.right
+        return overlaps
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+#################################################
+""" persistent_bst.py
+# # Persistent (immutable, path-copying) Binary Search Tree Implementation
+#   Insert and remove return a new version of the tree, which shares every
+#   untouched node with the old one - only the O(log(n)) nodes on the search
+#   path (plus rotated ones) are copied. Versions never change, so a version
+#   is a free snapshot that any number of readers can traverse with no locks.
+#   Supports:
+#      - Insert, remove (return new versions).
+#      - Everything the AVL Tree supports for reading:
+#          > size, min, max, height, order statistics, ordered queries, traversals.
+# # Snapshot BST Implementation
+#   A mutable handle on the latest version: writers serialise on a lock and
+#   publish each new version with one reference swap; readers take snapshots
+#   and never block (or get blocked by) writers.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import threading
+
+# Local Application/Library Specific Imports.
+from binary_search_tree import AVLNode, AVLTree
+##################################################
+# Implementation
+##################################################
+class PersistentBST(AVLTree):
+    """Persistent Binary Search Tree implementation (AVL-balanced).
+       Nodes are never mutated once a version holding them is returned:
+       insert/remove rebuild the search path bottom-up with new nodes,
+       rebalancing as they go (rotations also build new nodes).
+       Complexity: Search | Insert | Remove | Snapshot
+                 O(log(n)) | O(log(n)) | O(log(n)) | O(1)
+                 (insert/remove allocate O(log(n)) nodes)"""
+    def __init__(self, root=None):
+        super().__init__(root)
+        self.num_nodes = self._size(root)
+
+    def _join(self, data, left, right):
+        """Utility function to create the node for data over left & right."""
+        node = AVLNode(data)
+        node.left = left
+        node.right = right
+        self._update(node)
+        return node
+
+    def _join_balanced(self, data, left, right):
+        """Utility function to create the AVL-balanced subtree for data over left & right,
+           whose heights differ by at most two. Never mutates left or right."""
+        hleft = self._height(left)
+        hright = self._height(right)
+        if hleft > hright + 1:
+            if self._height(left.left) >= self._height(left.right):
+                return self._join(left.data, left.left, self._join(data, left.right, right))
+            pivot = left.right
+            return self._join(pivot.data, self._join(left.data, left.left, pivot.left),
+                              self._join(data, pivot.right, right))
+        if hright > hleft + 1:
+            if self._height(right.right) >= self._height(right.left):
+                return self._join(right.data, self._join(data, left, right.left), right.right)
+            pivot = right.left
+            return self._join(pivot.data, self._join(data, left, pivot.left),
+                              self._join(right.data, pivot.right, right.right))
+        return self._join(data, left, right)
+
+    def _rebuild(self, path, node):
+        """Utility function to copy path (root -> parent of node, as (old node, went left)
+           pairs) bottom-up over the new subtree node. Returns the new root."""
+        for parent, went_left in reversed(path):
+            if went_left:
+                node = self._join_balanced(parent.data, node, parent.right)
+            else:
+                node = self._join_balanced(parent.data, parent.left, node)
+        return node
+
+    def insert(self, data):
+        """Insert data in a new version of the tree.
+           Returns:
+               version (PersistentBST): the new version, or the tree itself if
+                                        the data was already in it."""
+        path = []
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                return self
+            went_left = node.data > data
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        return type(self)(self._rebuild(path, self._join(data, None, None)))
+
+    def _remove_min(self, root):
+        """Utility function to get (min data, copy of the subtree at root without it)."""
+        path = []
+        node = root
+        while node.left is not None:
+            path.append((node, True))
+            node = node.left
+        return node.data, self._rebuild(path, node.right)
+
+    def remove(self, data):
+        """Remove data from a new version of the tree.
+           Returns:
+               version (PersistentBST): the new version, or the tree itself if
+                                        the data was not in it."""
+        path = []
+        node = self.root
+        while node is not None and node.data != data:
+            went_left = node.data > data
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        if node is None:
+            return self
+        if node.left is None or node.right is None:
+            subtree = node.left if node.left is not None else node.right
+        else:
+            successor, right = self._remove_min(node.right)
+            subtree = self._join_balanced(successor, node.left, right)
+        return type(self)(self._rebuild(path, subtree))
+
+class SnapshotBST:
+    """Mutable handle on the latest version of a PersistentBST.
+       Writers serialise on a lock; publishing a version is a single reference
+       assignment (atomic), so readers never take the lock."""
+    def __init__(self, version=None):
+        self._version = version if version is not None else PersistentBST()
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        """Get the current version - an immutable tree, in O(1)."""
+        return self._version
+
+    def insert(self, data):
+        """Insert data, publishing a new version.
+           Returns:
+               feedback (Boolean): True if the data was not in the tree
+                                   and was added, False otherwise."""
+        with self._write_lock:
+            version = self._version
+            self._version = version.insert(data)
+            return self._version is not version
+
+    def remove(self, data):
+        """Remove data, publishing a new version.
+           Returns:
+               feedback (Boolean): True if the data was in the tree
+                                   and was removed, False otherwise."""
+        with self._write_lock:
+            version = self._version
+            self._version = version.remove(data)
+            return self._version is not version
+
+    def size(self):
+        """Get the number of nodes in the current version."""
+        return self._version.size()
+
+    def in_order(self, verbose=True):
+        """In-order(min->max sorted) traverse the current version."""
+        return self._version.in_order(verbose)
+
+    def __iter__(self):
+        return iter(self._version)
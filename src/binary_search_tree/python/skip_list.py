@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+#################################################
+""" skip_list.py
+# # Concurrent Skip List (sorted set/map) Implementation
+#   A lazy, fine-grained locking skip list: every node has its own lock.
+#   Writers lock only the predecessors they relink (and the victim), then
+#   validate; readers take no locks at all. So readers never block, and
+#   writers on disjoint key ranges proceed concurrently - no rotations and
+#   no global lock, unlike a locked BinarySearchTree.
+#   Supports:
+#      - Insert (data, optional value), remove, contains, get.
+#      - Size, min, max.
+#      - Traverse:
+#          > in-order, irange(lazy, weakly consistent range iterator), items.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import random
+import threading
+import time
+##################################################
+# Implementation
+##################################################
+class SkipNode:
+    """Node for a Skip List: next holds one forward link per level.
+       marked - logically removed; fully_linked - linked at all its levels."""
+    __slots__ = ("data", "value", "next", "lock", "marked", "fully_linked")
+
+    def __init__(self, data, value, height):
+        self.data = data
+        self.value = value
+        self.next = [None] * height
+        self.lock = threading.Lock()
+        self.marked = False
+        self.fully_linked = False
+
+class SkipList:
+    """Concurrent Skip List implementation (lazy synchronisation).
+       A node is in the set iff it is fully linked and not marked. A writer
+       finds the predecessors lock-free, locks them bottom-up (each once),
+       checks they are still unmarked and still point where it expects,
+       and retries the search otherwise. Iterators are weakly consistent:
+       they see every key present for their whole run, and maybe others.
+       Complexity: Search | Insert | Remove | Range scan (k keys)
+                 O(log(n)) | O(log(n)) | O(log(n)) | O(log(n) + k) (expected)"""
+    def __init__(self, max_level=32, prob=0.5):
+        self.max_level = max_level
+        self.prob = prob
+        self.head = SkipNode(None, None, max_level)
+        self.head.fully_linked = True
+        # Number of levels in use (only grows): searches start there, not at max_level.
+        self.level = 1
+        self.num_nodes = 0
+        self._size_lock = threading.Lock()
+
+    def __str__(self):
+        return str(self.in_order(False))
+
+    def __iter__(self):
+        return self.irange()
+
+    def _random_level(self):
+        """Utility function to draw the height of a new node (geometric, 1..max_level)."""
+        height = 1
+        while height < self.max_level and random.random() < self.prob:
+            height += 1
+        return height
+
+    def _find(self, data):
+        """Utility function to find, lock-free, the predecessors & successors of data
+           at every level. Returns (highest level data was found at or -1, preds, succs)."""
+        found = -1
+        preds = [self.head] * self.max_level
+        succs = self.head.next[:]
+        pred = self.head
+        for level in range(self.level - 1, -1, -1):
+            curr = pred.next[level]
+            while curr is not None and curr.data < data:
+                pred = curr
+                curr = pred.next[level]
+            if found == -1 and curr is not None and curr.data == data:
+                found = level
+            preds[level] = pred
+            succs[level] = curr
+        return found, preds, succs
+
+    def _add_size(self, delta):
+        """Utility function to update the node count."""
+        with self._size_lock:
+            self.num_nodes += delta
+
+    def size(self):
+        """Get the number of keys in the skip list."""
+        return self.num_nodes
+
+    def insert(self, data, value=None):
+        """Insert data (with value) in the skip list. An existing key gets its value updated.
+           Returns:
+               feedback (Boolean): True if the data was not in the skip list
+                                   and was added, False otherwise."""
+        height = self._random_level()
+        while True:
+            found, preds, succs = self._find(data)
+            if found != -1:
+                node = succs[found]
+                if not node.marked:
+                    # Being inserted - yield the GIL until the inserter links it.
+                    while not node.fully_linked:
+                        time.sleep(0)
+                    node.value = value
+                    return False
+                # Being removed - yield, then retry once it is unlinked.
+                time.sleep(0)
+                continue
+            locked = []
+            try:
+                valid = True
+                for level in range(height):
+                    pred = preds[level]
+                    succ = succs[level]
+                    if not locked or locked[-1] is not pred:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                    valid = not pred.marked and (succ is None or not succ.marked) \
+                        and pred.next[level] is succ
+                    if not valid:
+                        break
+                if not valid:
+                    continue
+                if height > self.level:
+                    with self._size_lock:
+                        self.level = max(self.level, height)
+                node = SkipNode(data, value, height)
+                for level in range(height):
+                    node.next[level] = succs[level]
+                for level in range(height):
+                    preds[level].next[level] = node
+                node.fully_linked = True
+            finally:
+                for pred in locked:
+                    pred.lock.release()
+            self._add_size(1)
+            return True
+
+    def remove(self, data):
+        """Remove data from the skip list.
+           Returns:
+               feedback (Boolean): True if the data was in the skip list
+                                   and was removed, False otherwise."""
+        victim = None
+        while True:
+            found, preds, succs = self._find(data)
+            if victim is None:
+                if found == -1:
+                    return False
+                node = succs[found]
+                if not node.fully_linked or node.marked or len(node.next) - 1 != found:
+                    return False
+                node.lock.acquire()
+                if node.marked:
+                    node.lock.release()
+                    return False
+                node.marked = True
+                victim = node
+            locked = []
+            try:
+                valid = True
+                for level in range(len(victim.next)):
+                    pred = preds[level]
+                    if not locked or locked[-1] is not pred:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                    valid = not pred.marked and pred.next[level] is victim
+                    if not valid:
+                        break
+                if not valid:
+                    continue
+                for level in range(len(victim.next) - 1, -1, -1):
+                    preds[level].next[level] = victim.next[level]
+            finally:
+                for pred in locked:
+                    pred.lock.release()
+            victim.lock.release()
+            self._add_size(-1)
+            return True
+
+    def _search(self, data):
+        """Utility function to find, lock-free, the node of data (None if absent)."""
+        pred = self.head
+        for level in range(self.level - 1, -1, -1):
+            curr = pred.next[level]
+            while curr is not None and curr.data < data:
+                pred = curr
+                curr = pred.next[level]
+            if curr is not None and curr.data == data:
+                return curr if curr.fully_linked and not curr.marked else None
+        return None
+
+    def contains(self, data):
+        """Check if data is in the skip list (lock-free)."""
+        return self._search(data) is not None
+
+    def get(self, data, default=None):
+        """Get the value stored with data (default if data is not in the skip list)."""
+        node = self._search(data)
+        return node.value if node is not None else default
+
+    def get_min(self):
+        """Get the minimum key in the skip list."""
+        for data in self.irange():
+            return data
+        return None
+
+    def get_max(self):
+        """Get the maximum key in the skip list. Drops down the levels lock-free,
+           then finishes along the bottom level, skipping removed nodes."""
+        node = self.head
+        for level in range(self.level - 1, 0, -1):
+            while node.next[level] is not None:
+                node = node.next[level]
+        last = None
+        while node is not None:
+            if node is not self.head and node.fully_linked and not node.marked:
+                last = node
+            node = node.next[0]
+        if last is None and self.num_nodes:
+            # The max was removed under us: rescan the bottom level.
+            for data in self.irange():
+                last = data
+            return last
+        return last.data if last is not None else None
+
+    def _first_at_least(self, low):
+        """Utility function to get the first bottom-level node with data >= low."""
+        if low is None:
+            return self.head.next[0]
+        pred = self.head
+        for level in range(self.level - 1, -1, -1):
+            curr = pred.next[level]
+            while curr is not None and curr.data < low:
+                pred = curr
+                curr = pred.next[level]
+        return pred.next[0]
+
+    def irange(self, low=None, high=None):
+        """Lazily iterate over the keys in [low, high) (None - unbounded), in sorted order.
+           One descent, then a lock-free walk along the bottom level."""
+        node = self._first_at_least(low)
+        while node is not None and (high is None or node.data < high):
+            if node.fully_linked and not node.marked:
+                yield node.data
+            node = node.next[0]
+
+    def items(self, low=None, high=None):
+        """Lazily iterate over the (key, value) pairs with keys in [low, high)."""
+        node = self._first_at_least(low)
+        while node is not None and (high is None or node.data < high):
+            if node.fully_linked and not node.marked:
+                yield node.data, node.value
+            node = node.next[0]
+
+    def in_order(self, verbose=True):
+        """In-order(min->max sorted) traverse the skip list."""
+        traversal = list(self.irange())
+        if verbose:
+            print(traversal)
+        return traversal
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#################################################
+""" test_b_tree.py
+# # Test for B+ Tree Implementation
+#   Tests:
+#      - Insert, remove: functionality + API (incl. values & small fanout splits/merges).
+#      - Size, min, max, height, contains, get.
+#      - Traverse:
+#          > in-order, reverse in-order, irange, items.
+#      - Empty tree.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from random import randint, shuffle
+
+# Local Application/Library Specific Imports.
+import b_tree as bt
+##################################################
+# Test
+##################################################
+TREE = bt.BPlusTree(fanout=4)
+for data in range(5):
+    print("Insert: {} | Feedback: {}"
+          .format(data, TREE.insert(data, str(data))))
+for i in range(15):
+    data = randint(-100, 100)
+    print("Insert: {} | Feedback: {}"
+          .format(data, TREE.insert(data)))
+print("Insert: {} | Feedback: {}".format(2, TREE.insert(2, "two")))
+print("Get: {} | Value: {}".format(2, TREE.get(2)))
+print("Contains: {} | Feedback: {}".format(3, TREE.contains(3)))
+print("Size: {} | Height: {}".format(TREE.size(), TREE.height()))
+print("Min: {} | Max: {}".format(TREE.get_min(), TREE.get_max()))
+print("In-order:")
+KEYS = TREE.in_order()
+print("Reverse in-order:")
+TREE.rev_in_order()
+print("irange(-10, 10): {}".format(list(TREE.irange(-10, 10))))
+print("irange(-10, 10, reverse): {}".format(list(TREE.irange(-10, 10, reverse=True))))
+print("items(0, 5): {}".format(list(TREE.items(0, 5))))
+assert KEYS == sorted(KEYS) and TREE.size() == len(KEYS)
+assert TREE.get(2) == "two"
+assert list(TREE.irange(-10, 10)) == [key for key in KEYS if -10 <= key < 10]
+for data in KEYS[::2]:
+    print("Remove: {} | Feedback: {}".format(data, TREE.remove(data)))
+print("Remove: {} | Feedback: {}".format(1000, TREE.remove(1000)))
+print(TREE)
+assert TREE.in_order(False) == KEYS[1::2]
+
+print("\n==== SPLITS & MERGES (fanout=4, 1000 keys) ====")
+TREE = bt.BPlusTree(fanout=4)
+KEYS = list(range(1000))
+shuffle(KEYS)
+for key in KEYS:
+    TREE.insert(key)
+print("Size: {} | Height: {}".format(TREE.size(), TREE.height()))
+assert TREE.in_order(False) == list(range(1000))
+assert TREE.rev_in_order(False) == list(range(999, -1, -1))
+shuffle(KEYS)
+for key in KEYS[:900]:
+    TREE.remove(key)
+print("After 900 removes - Size: {} | Height: {}".format(TREE.size(), TREE.height()))
+assert TREE.in_order(False) == sorted(KEYS[900:])
+for key in KEYS[900:]:
+    TREE.remove(key)
+print("Empty - Size: {} | Height: {} | Min: {} | Max: {} | In-order: {}".format(
+    TREE.size(), TREE.height(), TREE.get_min(), TREE.get_max(), TREE.in_order(False)))
+assert TREE.size() == 0 and TREE.height() == 1 and list(TREE.irange()) == []
@@ -5,15 +5,21 @@
 #   Tests:
 #      - Insert, remove: functionality + API.
 #      - Size, min, max, height.
+#      - Order statistics: select, rank, count_range.
+#      - Floor, ceiling, successor, predecessor, irange (lazy, pruned).
+#      - From_sorted (bulk-load), union, intersection, difference (unsorted other).
 #      - Recursive traverse:
 #          > {Pre, in, reverse in, post}-order, level
 #      - Iterative traverse:
 #          > {Pre, in, post}-order, level
+#      - Degenerate (sequential keys) & empty trees: no recursion limit.
+#   Tests AVL tree:
+#      - Sequential insert/remove stay balanced (height).
 """
 #################################################
 # ###  Author: Samyuel Danyo
 # ###  Date: 07/06/2020
-# ###  Last Edit: 07/06/2020
+# ###  Last Edit: 18/10/2026
 ##################################################
 # ## imports
 # Python Standard Library
@@ -56,7 +62,69 @@ print("--- Post-Order Iterative ---")
 BST.post_order_iter()
 print("BST Height: ", BST.height())
 print("BST: min()={}, max()={}: ".format(BST.get_min(), BST.get_max()))
+SORTED = BST.in_order(False)
+print("BST: select(0)={}, select(3)={}, select(size)={}".format(
+    BST.select(0), BST.select(3), BST.select(BST.size())))
+print("BST: rank(0)={}, count_range(-50, 50)={}".format(BST.rank(0), BST.count_range(-50, 50)))
+assert BST.select(3) == SORTED[3] and BST.rank(0) == len([x for x in SORTED if x < 0])
+assert BST.count_range(-50, 50) == len([x for x in SORTED if -50 <= x < 50])
+print("BST: floor(0)={}, ceiling(0)={}, predecessor({})={}, successor({})={}".format(
+    BST.floor(0), BST.ceiling(0), SORTED[2], BST.predecessor(SORTED[2]),
+    SORTED[2], BST.successor(SORTED[2])))
+assert BST.predecessor(SORTED[2]) == SORTED[1] and BST.successor(SORTED[2]) == SORTED[3]
+PAGE = BST.irange(-50, None)
+print("BST: first 3 in [-50, inf) = {}".format([next(PAGE) for _ in range(3)]))
+print("BST: irange(-50, 50, reverse=True) = {}".format(list(BST.irange(-50, 50, reverse=True))))
+assert list(BST.irange(-50, 50)) == [x for x in SORTED if -50 <= x < 50] and list(BST) == SORTED
 print("--- Level Traverse Recursive ---")
 BST.lvl_traverse()
 print("--- Level Traverse Iterative ---")
 BST.lvl_traverse_iter()
+
+print("\n--- Degenerate BST (3000 sequential keys) ---")
+CHAIN = bst.BinarySearchTree()
+for data in range(3000):
+    CHAIN.insert(data)
+print("Height: {} | Post-order head: {} | Remove root: {}".format(
+    CHAIN.height(), CHAIN.post_order(False)[0], CHAIN.remove(0)))
+assert CHAIN.in_order(False) == list(range(1, 3000)) and CHAIN.size() == 2999
+EMPTY = bst.BinarySearchTree()
+print("Empty BST: pre={}, post={}, min={}, height={}".format(
+    EMPTY.pre_order_iter(False), EMPTY.post_order_iter(False), EMPTY.get_min(), EMPTY.height()))
+
+print("\n--- Bulk-Load & Set Operations ---")
+EVENS = bst.BinarySearchTree.from_sorted(range(0, 20, 2))
+THIRDS = bst.BinarySearchTree.from_sorted([0, 3, 3, 6, 9, 12, 15, 18])
+print("Evens: {} | height: {}".format(EVENS.in_order(False), EVENS.height()))
+print("Union:", EVENS.union(THIRDS).in_order(False))
+print("Intersection:", EVENS.intersection(THIRDS).in_order(False))
+print("Difference:", EVENS.difference(THIRDS).in_order(False))
+assert EVENS.height() == 4 and EVENS.intersection(THIRDS).in_order(False) == [0, 6, 12, 18]
+print("From unsorted:", bst.BinarySearchTree.from_sorted([3, 1, 2]).in_order(False))
+print("Union with unsorted [5, 1, 5, 4]:", EVENS.union([5, 1, 5, 4]).in_order(False))
+assert EVENS.union([5, 1, 5, 4]).in_order(False) == [0, 1, 2, 4, 5, 6, 8, 10, 12, 14, 16, 18]
+assert EVENS.difference([18, 0, 0]).in_order(False) == [2, 4, 6, 8, 10, 12, 14, 16]
+
+print("\n==== TEST AVL TREE IMPLEMENTATION ====")
+AVL = bst.AVLTree()
+for data in range(2000):
+    AVL.insert(data)
+print("AVL size={}, height={} (2000 sequential keys)".format(AVL.size(), AVL.height()))
+assert AVL.height() <= 12
+print("Insert: {} | Feedback: {}".format(5, AVL.insert(5)))
+for data in range(0, 2000, 2):
+    AVL.remove(data)
+print("Remove: {} | Feedback: {}".format(0, AVL.remove(0)))
+print("AVL size={}, height={}, min()={}, max()={}".format(AVL.size(), AVL.height(),
+                                                        AVL.get_min(), AVL.get_max()))
+assert AVL.in_order(False) == list(range(1, 2000, 2))
+print("AVL select(10)={}, rank(101)={}, count_range(100, 200)={}".format(
+    AVL.select(10), AVL.rank(101), AVL.count_range(100, 200)))
+assert (AVL.select(10), AVL.rank(101), AVL.count_range(100, 200)) == (21, 50, 50)
+AVL = bst.AVLTree()
+for i in range(15):
+    AVL.insert(randint(-100, 100))
+print("--- AVL In-Order ---")
+AVL.in_order()
+print("--- AVL Level Traverse ---")
+AVL.lvl_traverse()
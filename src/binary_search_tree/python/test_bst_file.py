@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#################################################
+""" test_bst_file.py
+# # Test for Compact BST File + Memory-Mapped Read-Only BST Implementation
+#   Tests:
+#      - Dump a BinarySearchTree (int keys) / sorted str keys, load by mmap.
+#      - Size, min, max, height, contains, floor, ceiling.
+#      - In-order, reverse in-order, irange.
+#      - Errors: unsorted keys, unsupported typecode, overflow, corrupt file.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import os
+import tempfile
+from random import randint
+
+# Local Application/Library Specific Imports.
+import binary_search_tree as bst
+import bst_file as bf
+##################################################
+# Test
+##################################################
+DIRECTORY = tempfile.mkdtemp()
+PATH = os.path.join(DIRECTORY, "tree.bst")
+
+TREE = bst.AVLTree()
+for i in range(20):
+    TREE.insert(randint(-100, 100))
+KEYS = TREE.in_order(False)
+print("Dump: {} keys | File size: {} bytes".format(bf.dump_tree(TREE, PATH), os.path.getsize(PATH)))
+with bf.load_tree(PATH) as MAPPED:
+    print("Size: {} | Height: {}".format(MAPPED.size(), MAPPED.height()))
+    print("Min: {} | Max: {}".format(MAPPED.get_min(), MAPPED.get_max()))
+    print("Contains: {} | Feedback: {}".format(KEYS[3], MAPPED.contains(KEYS[3])))
+    print("Contains: {} | Feedback: {}".format(1000, MAPPED.contains(1000)))
+    print("Floor: {} -> {} | Ceiling: {} -> {}".format(0, MAPPED.floor(0), 0, MAPPED.ceiling(0)))
+    print("In-order:")
+    assert MAPPED.in_order() == KEYS
+    print("Reverse in-order:")
+    assert MAPPED.rev_in_order() == KEYS[::-1]
+    print("irange(-50, 50): {}".format(list(MAPPED.irange(-50, 50))))
+    print("irange(-50, 50, reverse): {}".format(list(MAPPED.irange(-50, 50, reverse=True))))
+    assert list(MAPPED.irange(-50, 50)) == list(TREE.irange(-50, 50))
+    assert MAPPED.floor(0) == TREE.floor(0) and MAPPED.ceiling(0) == TREE.ceiling(0)
+    assert MAPPED.size() == TREE.size() and MAPPED.contains(KEYS[3])
+
+print("\n==== STR KEYS ====")
+WORDS = sorted({"tree", "arbre", "árbol", "baum", "drzewo", "дерево", "木"})
+print("Dump: {} keys".format(bf.dump_tree(WORDS, PATH, "s")))
+with bf.load_tree(PATH) as MAPPED:
+    print("In-order:", end=" ")
+    assert MAPPED.in_order() == WORDS
+    print("irange('b', 'z'): {}".format(list(MAPPED.irange("b", "z"))))
+    print("Contains: 'baum' | Feedback: {}".format(MAPPED.contains("baum")))
+    assert MAPPED.contains("木") and not MAPPED.contains("wood")
+
+print("\n==== EMPTY TREE & ERRORS ====")
+bf.dump_tree(bst.BinarySearchTree(), PATH)
+with bf.load_tree(PATH) as MAPPED:
+    print("Empty - Size: {} | Min: {} | Max: {} | In-order: {}".format(
+        MAPPED.size(), MAPPED.get_min(), MAPPED.get_max(), MAPPED.in_order(False)))
+print("Dump unsorted: {}".format(bf.dump_tree([3, 1, 2], PATH)))
+print("Dump bad typecode: {}".format(bf.dump_tree([1, 2], PATH, "z")))
+print("Dump overflow: {}".format(bf.dump_tree([1, 300], PATH, "b")))
+with open(PATH, "wb") as FILE:
+    FILE.write(b"NOT A TREE FILE" * 4)
+print("Load corrupt: {}".format(bf.load_tree(PATH)))
+os.remove(PATH)
+os.rmdir(DIRECTORY)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#################################################
+""" test_interval_tree.py
+# # Test for Interval Tree Implementation
+#   Tests:
+#      - Insert interval, remove interval: functionality + API.
+#      - Overlapping(point), overlapping(lo, hi) vs a linear scan.
+#      - Max end augmentation survives rotations, removes and from_sorted.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from random import randint
+
+# Local Application/Library Specific Imports.
+import interval_tree as itree
+##################################################
+# Test
+##################################################
+def scan(intervals, low, high):
+    """Get the intervals overlapping [low, high] by a linear scan."""
+    return sorted(interval for interval in intervals
+                  if interval[0] <= high and interval[1] >= low)
+
+TREE = itree.IntervalTree()
+for i in range(15):
+    start = randint(0, 100)
+    end = start + randint(0, 20)
+    print("Insert: [{}, {}] | Feedback: {}".format(start, end, TREE.insert_interval(start, end)))
+print("Insert: [{}, {}] | Feedback: {}".format(5, 1, TREE.insert_interval(5, 1)))
+INTERVALS = TREE.in_order(False)
+print("Size: {} | Height: {} | Root max end: {}".format(TREE.size(), TREE.height(),
+                                                        TREE.root.max_end))
+print("In-order:")
+TREE.in_order()
+print("Overlapping(50): {}".format(TREE.overlapping(50)))
+print("Overlapping(20, 40): {}".format(TREE.overlapping(20, 40)))
+assert TREE.overlapping(50) == scan(INTERVALS, 50, 50)
+assert TREE.overlapping(20, 40) == scan(INTERVALS, 20, 40)
+assert TREE.root.max_end == max(end for _, end in INTERVALS)
+for start, end in INTERVALS[::2]:
+    print("Remove: [{}, {}] | Feedback: {}".format(start, end, TREE.remove_interval(start, end)))
+print("Remove: [{}, {}] | Feedback: {}".format(-1, 0, TREE.remove_interval(-1, 0)))
+print("Overlapping(20, 40): {}".format(TREE.overlapping(20, 40)))
+assert TREE.overlapping(20, 40) == scan(INTERVALS[1::2], 20, 40)
+
+print("\n==== 5000 RANDOM WINDOWS vs LINEAR SCAN ====")
+TREE = itree.IntervalTree()
+for i in range(5000):
+    start = randint(0, 10 ** 6)
+    TREE.insert_interval(start, start + randint(0, 1000))
+for i in range(2000):
+    TREE.remove_interval(*TREE.select(randint(0, TREE.size() - 1)))
+INTERVALS = TREE.in_order(False)
+for i in range(200):
+    low = randint(-1000, 10 ** 6)
+    high = low + randint(0, 2000)
+    assert TREE.overlapping(low, high) == scan(INTERVALS, low, high)
+    assert TREE.overlapping(low) == scan(INTERVALS, low, low)
+BULK = itree.IntervalTree.from_sorted(INTERVALS)
+assert BULK.overlapping(10 ** 5, 2 * 10 ** 5) == TREE.overlapping(10 ** 5, 2 * 10 ** 5)
+print("Size: {} | Height: {} | 400 queries match the linear scan".format(TREE.size(),
+                                                                         TREE.height()))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#################################################
+""" test_persistent_bst.py
+# # Test for Persistent Binary Search Tree Implementation
+#   Tests:
+#      - Insert, remove: return new versions, old versions unchanged.
+#      - Structural sharing: a change copies O(log(n)) nodes.
+#      - Reads inherited from the AVL Tree (in-order, select, irange).
+#   Tests Snapshot BST:
+#      - Readers iterate snapshots while a writer inserts/removes.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import threading
+from random import randint, shuffle
+
+# Local Application/Library Specific Imports.
+import persistent_bst as pbst
+##################################################
+# Test
+##################################################
+def node_ids(tree):
+    """Get the ids of all the nodes of tree."""
+    ids = set()
+    stack = [tree.root]
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            ids.add(id(node))
+            stack.extend((node.left, node.right))
+    return ids
+
+VERSIONS = [pbst.PersistentBST()]
+for i in range(15):
+    data = randint(-100, 100)
+    VERSIONS.append(VERSIONS[-1].insert(data))
+    print("Insert: {} | Version size: {}".format(data, VERSIONS[-1].size()))
+for version in VERSIONS[::5]:
+    print("Version in-order:", end=" ")
+    version.in_order()
+TREE = VERSIONS[-1]
+KEYS = TREE.in_order(False)
+print("Remove: {} | Version size: {}".format(KEYS[0], TREE.remove(KEYS[0]).size()))
+print("Remove: {} | Same version: {}".format(1000, TREE.remove(1000) is TREE))
+print("Insert: {} | Same version: {}".format(KEYS[0], TREE.insert(KEYS[0]) is TREE))
+print("Old version in-order:", end=" ")
+assert TREE.in_order() == KEYS
+print("Min: {} | Max: {} | Height: {} | Select(0): {}".format(
+    TREE.get_min(), TREE.get_max(), TREE.height(), TREE.select(0)))
+
+print("\n==== STRUCTURAL SHARING (100000 keys) ====")
+TREE = pbst.PersistentBST.from_sorted(range(0, 200000, 2))
+NEW_TREE = TREE.insert(12345).remove(54320)
+COPIED = len(node_ids(NEW_TREE) - node_ids(TREE))
+print("Height: {} | Nodes copied by insert+remove: {}".format(TREE.height(), COPIED))
+assert COPIED <= 4 * TREE.height()
+assert TREE.size() == 100000 and NEW_TREE.size() == 100000
+assert 12345 not in TREE.irange(12344, 12346) and 12345 in NEW_TREE.irange(12344, 12346)
+assert list(TREE.irange(54320, 54321)) == [54320] and list(NEW_TREE.irange(54320, 54321)) == []
+
+print("\n==== SNAPSHOT BST: 3 READERS, 1 WRITER ====")
+SHARED = pbst.SnapshotBST()
+KEYS = list(range(2000))
+shuffle(KEYS)
+DONE = threading.Event()
+ERRORS = []
+READS = []
+
+def reader():
+    """Check each snapshot is sorted and consistent with its size, until the writer is done."""
+    reads = 0
+    while not DONE.is_set():
+        snapshot = SHARED.snapshot()
+        traversal = list(snapshot)
+        if traversal != sorted(traversal) or len(traversal) != snapshot.size():
+            ERRORS.append(traversal)
+        reads += 1
+    READS.append(reads)
+
+READERS = [threading.Thread(target=reader) for _ in range(3)]
+for thread in READERS:
+    thread.start()
+for key in KEYS:
+    SHARED.insert(key)
+for key in KEYS[::2]:
+    SHARED.remove(key)
+DONE.set()
+for thread in READERS:
+    thread.join()
+print("Snapshots read: {} | Final size: {} | Errors: {}".format(READS, SHARED.size(),
+                                                                len(ERRORS)))
+assert not ERRORS and SHARED.in_order(False) == sorted(KEYS[1::2])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#################################################
+""" test_skip_list.py
+# # Test for Concurrent Skip List Implementation
+#   Tests:
+#      - Insert, remove: functionality + API (incl. values).
+#      - Size, min, max, contains, get.
+#      - In-order, irange, items.
+#      - 8 threads inserting/removing (disjoint & contended keys) + lock-free readers.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import threading
+from random import Random, randint
+
+# Local Application/Library Specific Imports.
+import skip_list as sl
+##################################################
+# Test
+##################################################
+SKIP_LIST = sl.SkipList()
+for data in range(5):
+    print("Insert: {} | Feedback: {}".format(data, SKIP_LIST.insert(data, str(data))))
+for i in range(15):
+    data = randint(-100, 100)
+    print("Insert: {} | Feedback: {}".format(data, SKIP_LIST.insert(data)))
+print("Insert: {} | Feedback: {}".format(2, SKIP_LIST.insert(2, "two")))
+print("Get: {} | Value: {}".format(2, SKIP_LIST.get(2)))
+print("Contains: {} | Feedback: {}".format(3, SKIP_LIST.contains(3)))
+print("Size: {} | Min: {} | Max: {}".format(SKIP_LIST.size(), SKIP_LIST.get_min(),
+                                            SKIP_LIST.get_max()))
+print("In-order:")
+KEYS = SKIP_LIST.in_order()
+print("irange(-10, 10): {}".format(list(SKIP_LIST.irange(-10, 10))))
+print("items(0, 5): {}".format(list(SKIP_LIST.items(0, 5))))
+assert KEYS == sorted(KEYS) and SKIP_LIST.size() == len(KEYS) and SKIP_LIST.get(2) == "two"
+assert list(SKIP_LIST.irange(-10, 10)) == [key for key in KEYS if -10 <= key < 10]
+for data in KEYS[::2]:
+    print("Remove: {} | Feedback: {}".format(data, SKIP_LIST.remove(data)))
+print("Remove: {} | Feedback: {}".format(1000, SKIP_LIST.remove(1000)))
+print(SKIP_LIST)
+assert SKIP_LIST.in_order(False) == KEYS[1::2]
+
+print("\n==== 8 WRITERS (DISJOINT KEYS) + 2 READERS ====")
+SKIP_LIST = sl.SkipList()
+DONE = threading.Event()
+ERRORS = []
+
+def writer(idx):
+    """Insert the keys = idx (mod 8), then remove the keys = idx (mod 16)."""
+    for key in range(idx, 20000, 8):
+        SKIP_LIST.insert(key)
+    for key in range(idx, 20000, 16):
+        SKIP_LIST.remove(key)
+
+def reader():
+    """Check every range scan is sorted, until the writers are done."""
+    while not DONE.is_set():
+        scan = list(SKIP_LIST.irange(5000, 6000))
+        if scan != sorted(set(scan)):
+            ERRORS.append(scan)
+
+READERS = [threading.Thread(target=reader) for _ in range(2)]
+WRITERS = [threading.Thread(target=writer, args=(idx,)) for idx in range(8)]
+for thread in READERS + WRITERS:
+    thread.start()
+for thread in WRITERS:
+    thread.join()
+DONE.set()
+for thread in READERS:
+    thread.join()
+EXPECTED = [key for key in range(20000) if key % 16 >= 8]
+print("Size: {} | Min: {} | Max: {} | Reader errors: {}".format(
+    SKIP_LIST.size(), SKIP_LIST.get_min(), SKIP_LIST.get_max(), len(ERRORS)))
+assert SKIP_LIST.in_order(False) == EXPECTED and SKIP_LIST.size() == len(EXPECTED)
+assert not ERRORS
+
+print("\n==== 8 WRITERS (CONTENDED KEYS) ====")
+SKIP_LIST = sl.SkipList()
+NET = [0] * 8
+
+def contended(idx):
+    """Randomly insert/remove keys in [0, 50], counting the net successful inserts."""
+    rand = Random(idx)
+    for _ in range(5000):
+        key = rand.randint(0, 50)
+        if rand.random() < 0.5:
+            NET[idx] += SKIP_LIST.insert(key)
+        else:
+            NET[idx] -= SKIP_LIST.remove(key)
+
+WRITERS = [threading.Thread(target=contended, args=(idx,)) for idx in range(8)]
+for thread in WRITERS:
+    thread.start()
+for thread in WRITERS:
+    thread.join()
+KEYS = SKIP_LIST.in_order(False)
+print("Size: {} | Net inserts: {} | In-order: {}".format(SKIP_LIST.size(), sum(NET), KEYS))
+assert KEYS == sorted(set(KEYS)) and len(KEYS) == sum(NET) == SKIP_LIST.size()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+#################################################
+""" bench_graph.py
+# # Benchmark for Graph (Adjacency List) vs FrozenGraph (CSR)
+#   Builds a random directed weighted graph, then reports the memory per edge,
+#   freeze/from_edges build time, and BFS/DFS time on both layouts.
+#   Then times Dijkstra: all distances vs an early-exit point-to-point query,
+#   and a DAG growing in batches: re-sorting after each batch vs the online order.
+#   Usage: python bench_graph.py [num_vertices] [avg_degree]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+import tracemalloc
+from random import randrange, random, shuffle
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import graph as grph
+##################################################
+# Benchmark
+##################################################
+NUM_VERTICES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+AVG_DEGREE = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+EDGES = [(randrange(NUM_VERTICES), randrange(NUM_VERTICES), random())
+         for _ in range(NUM_VERTICES * AVG_DEGREE)]
+
+def timed(func, *args):
+    """Get (func(*args), ms taken)."""
+    start = perf_counter()
+    result = func(*args)
+    return result, (perf_counter() - start) * 1e3
+
+def traced(func, *args):
+    """Get (func(*args), bytes allocated and still held)."""
+    tracemalloc.start()
+    result = func(*args)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, held
+
+GRAPH, GRAPH_BYTES = traced(grph.Graph, EDGES, True, True)
+FROZEN, FREEZE_MS = timed(GRAPH.freeze)
+_, FROZEN_BYTES = traced(GRAPH.freeze)
+_, FROM_EDGES_MS = timed(grph.FrozenGraph.from_edges, EDGES, True, True)
+NUM_EDGES = GRAPH.size()[1]
+print("==== {} VERTICES, {} EDGES (directed, weighted) ====".format(NUM_VERTICES, NUM_EDGES))
+print("freeze: {:.0f} ms | from_edges: {:.0f} ms".format(FREEZE_MS, FROM_EDGES_MS))
+print("{:>12} | {:>10} | {:>8} | {:>8}".format("layout", "bytes/edge", "BFS ms", "DFS ms"))
+for name, graph, held in [("Graph", GRAPH, GRAPH_BYTES), ("FrozenGraph", FROZEN, FROZEN_BYTES)]:
+    _, BFS_MS = timed(graph.BFS, 0, False)
+    try:
+        DFS_MS = "{:.0f}".format(timed(graph.DFS, 0, False)[1])
+    except RecursionError:
+        DFS_MS = "RecursionError"
+    print("{:>12} | {:>10.1f} | {:>8.0f} | {:>8}".format(name, held / NUM_EDGES, BFS_MS, DFS_MS))
+
+print("\n==== DIJKSTRA (from vertex 0) ====")
+LENGTHS, ALL_MS = timed(GRAPH.shortest_path_lengths, 0)
+TARGET = sorted(LENGTHS, key=LENGTHS.get)[len(LENGTHS) // 100]
+_, POINT_MS = timed(GRAPH.shortest_path, 0, TARGET)
+_, CUTOFF_MS = timed(GRAPH.shortest_path_lengths, 0, LENGTHS[TARGET])
+print("all {} distances: {:.0f} ms | path to the 1%-nearest vertex: {:.1f} ms | "
+      "cutoff at its distance: {:.1f} ms".format(len(LENGTHS), ALL_MS, POINT_MS, CUTOFF_MS))
+
+print("\n==== GROWING DAG: {} VERTICES, 100 BATCHES OF {} EDGES ====".format(NUM_VERTICES // 10,
+                                                                           NUM_VERTICES // 100))
+RANK = list(range(NUM_VERTICES // 10))
+shuffle(RANK)
+BATCHES = []
+for _ in range(100):
+    BATCH = []
+    while len(BATCH) < NUM_VERTICES // 100:
+        vertex1, vertex2 = randrange(len(RANK)), randrange(len(RANK))
+        if RANK[vertex1] < RANK[vertex2]:
+            BATCH.append((vertex1, vertex2))
+    BATCHES.append(BATCH)
+
+def resort(batches):
+    """Add each batch to a directed Graph, then topologically sort it (DFS)."""
+    graph = grph.Graph(directed=True)
+    for batch in batches:
+        graph.add_edges(batch)
+        graph.topological_sort(False)
+
+def online(batches):
+    """Add each batch to a DAG (online order), then read its order."""
+    dag = grph.DAG()
+    for batch in batches:
+        dag.add_edges(batch)
+        dag.topological_sort(False)
+
+print("re-sort per batch: {:.0f} ms | online (DAG): {:.0f} ms".format(timed(resort, BATCHES)[1],
+                                                                       timed(online, BATCHES)[1]))
@@ -9,18 +9,42 @@
 #     - Inspection
 #         > size, is_directed, is_weighted, vertices, contains,
 #           adjecent, neighbors, get_edge_weight, find_path, BFS, DFS, topological_sort.
+#     - Lazy traversal generators (iterative, O(V+E), early exit):
+#         > iter_bfs(max_depth), iter_dfs(pre/post-order) -> (vertex, depth, parent).
+#     - Scheduling (Kahn waves):
+#         > topological_generations, execute(dag, fn, workers) - module-level pool driver.
+#     - Shortest paths (Dijkstra/A*, binary heap with lazy deletion, early exit, cutoff):
+#         > shortest_path, shortest_path_lengths, astar.
 #     - Internal:
 #         > set_edge_weight
+#     - Freeze:
+#         > freeze -> FrozenGraph (immutable CSR arrays), FrozenGraph.thaw -> Graph.
+# # DAG - directed acyclic Graph with an online topological order (Pearce-Kelly)
+#   Supports:
+#     - Everything Graph supports; add_edge rejects cycle-creating edges.
+#     - position (O(1)), topological_sort (the maintained order, no search).
+# # Frozen Graph - Compressed Sparse Row(CSR) snapshot
+#   Supports:
+#     - Build from a Graph (freeze) or straight from an edge stream (from_edges).
+#     - size, is_directed, is_weighted, vertices, contains, adjacent, degree,
+#       neighbors, get_edge_weight, BFS, DFS, thaw.
 """
 #################################################
 # ###  Author: Samyuel Danyo
 # ###  Date: 21/07/2020
-# ###  Last Edit: 29/06/2020
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import count
 ##################################################
 # Implementation
 ##################################################
-from collections import defaultdict
-
 class Graph:
     """Graph data structure using Adjacency List(Edge List), undirected, unweighted by default."""
 
@@ -154,7 +178,7 @@ class Graph:
             print("WARNING: Graph is NOT weighted!")
             return None
         self._graph[vertex1][vertex2] = weight
-        if self.is_directed():
+        if not self.is_directed():
             self._graph[vertex2][vertex1] = weight
         return True
 
@@ -166,29 +190,177 @@ class Graph:
         if self.adjacent(vertex1, vertex2):
             return self._graph[vertex1][vertex2]
 
+    def freeze(self):
+        """Get an immutable Compressed Sparse Row(CSR) snapshot of the graph."""
+        vertices = self.vertices()
+        ids = {vertex: idx for idx, vertex in enumerate(vertices)}
+        indptr = array('q', [0])
+        indices = array(FrozenGraph.id_typecode(len(vertices)))
+        weights = array('d') if self.is_weighted() else None
+        for vertex in vertices:
+            edges = self._graph[vertex]
+            row = sorted(ids[neighbor] for neighbor in edges)
+            indices.extend(row)
+            if weights is not None:
+                weights.extend(edges[vertices[idx]] for idx in row)
+            indptr.append(len(indices))
+        return FrozenGraph(vertices, indptr, indices, weights, self._directed)
+
     def find_path(self, start_vertex, end_vertex):
-        """Find a path between start_vertex and end_vertex (may not be shortest)."""
+        """Find a path between start_vertex and end_vertex (may not be shortest).
+           Walks the DFS tree back from end_vertex - iterative, stops once it is reached."""
         if not self.contains(start_vertex) or not self.contains(end_vertex):
             return None
+        parents = {}
+        for vertex, _, parent in self._dfs(start_vertex, set()):
+            parents[vertex] = parent
+            if vertex == end_vertex:
+                return self._trace_path(parents, end_vertex)
+        return []
+
+    def _edges(self, vertex):
+        """Utility function to get (neighbor, weight) pairs of vertex (weight 1 if unweighted)."""
+        if self.is_weighted():
+            return self._graph[vertex].items()
+        return ((neighbor, 1) for neighbor in self._graph[vertex])
+
+    def _search(self, source, target=None, heuristic=None, cutoff=None):
+        """Utility function for Dijkstra's algorithm (A* given a heuristic) from source.
+           The frontier is a binary heap of (priority, tie-breaker, vertex) with lazy
+           deletion: a shorter path pushes a new entry, and stale entries are skipped
+           when popped. Stops once target is settled; never goes beyond cutoff.
+           Returns:
+               (dist, parent): the distances and shortest-path tree of settled vertices
+                               (None on a negative edge weight)."""
+        dist = {source: 0}
+        parent = {source: None}
+        settled = {}
+        tie = count()
+        frontier = [(heuristic(source) if heuristic else 0, next(tie), source)]
+        while frontier:
+            _, _, vertex = heapq.heappop(frontier)
+            if vertex in settled:
+                continue
+            settled[vertex] = dist[vertex]
+            if vertex == target:
+                break
+            for neighbor, weight in self._edges(vertex):
+                if weight < 0:
+                    print("ERROR: Negative edge weight ({}, {})! Use Bellman-Ford.".format(
+                        vertex, neighbor))
+                    return None
+                new_dist = dist[vertex] + weight
+                if cutoff is not None and new_dist > cutoff:
+                    continue
+                if neighbor not in settled and new_dist < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = new_dist
+                    parent[neighbor] = vertex
+                    priority = new_dist + heuristic(neighbor) if heuristic else new_dist
+                    heapq.heappush(frontier, (priority, next(tie), neighbor))
+        return settled, parent
+
+    @staticmethod
+    def _trace_path(parent, target):
+        """Utility function to walk the shortest-path tree back from target."""
         path = []
-        visited = set()
-        self._find_path(start_vertex, end_vertex, path, visited)
-        if path[-1] != end_vertex:
-            return []
+        while target is not None:
+            path.append(target)
+            target = parent[target]
+        path.reverse()
         return path
 
-    def _find_path(self, start, end, path, visited):
-        """Utility fundtion to find a path between start and end (may not be shortest)."""
-        path.append(start)
-        visited.add(start)
-        if start == end:
-            return path
-        for vertex in self.neighbors(start):
-            if vertex not in visited:
-                if not self._find_path(vertex, end, path, visited):
-                    path.remove(vertex)
-                else:
-                    return True
+    def _point_to_point(self, src, dst, heuristic, cutoff):
+        """Utility function for shortest_path/astar."""
+        if not self.contains(src) or not self.contains(dst):
+            return None
+        search = self._search(src, dst, heuristic, cutoff)
+        if search is None:
+            return None
+        dist, parent = search
+        if dst not in dist:
+            return (float('inf'), [])
+        return (dist[dst], self._trace_path(parent, dst))
+
+    def shortest_path(self, src, dst, cutoff=None):
+        """Find the shortest path from src to dst (Dijkstra, unweighted edges cost 1).
+           Returns:
+               (distance, path): (inf, []) if dst is unreachable (within cutoff)."""
+        return self._point_to_point(src, dst, None, cutoff)
+
+    def astar(self, src, dst, heuristic, cutoff=None):
+        """Find the shortest path from src to dst with A* search.
+           heuristic(vertex) estimates the distance from vertex to dst; it must never
+           overestimate (admissible) and be consistent, for the path to be the shortest.
+           Returns:
+               (distance, path): (inf, []) if dst is unreachable (within cutoff)."""
+        return self._point_to_point(src, dst, heuristic, cutoff)
+
+    def shortest_path_lengths(self, src, cutoff=None):
+        """Get the shortest distances from src to every reachable vertex (within cutoff).
+           Returns:
+               distances (dict): {vertex: distance}."""
+        if not self.contains(src):
+            return None
+        search = self._search(src, cutoff=cutoff)
+        if search is None:
+            return None
+        return search[0]
+
+    def iter_bfs(self, source, max_depth=None):
+        """Lazily Breadth First Search from source, yielding (vertex, depth, parent)
+           (parent is None for source). Vertices deeper than max_depth are not visited.
+           O(V+E), no recursion; stop consuming at any point to exit early."""
+        if not self.contains(source):
+            return
+        yield from self._bfs(source, set(), max_depth)
+
+    def _bfs(self, source, visited, max_depth=None):
+        """Utility generator for Breadth First Search from source, sharing visited.
+           The queue is a deque, so every enqueue/dequeue is O(1)."""
+        queue = deque([(source, 0, None)])
+        visited.add(source)
+        while queue:
+            curr_vertex, depth, parent = queue.popleft()
+            yield curr_vertex, depth, parent
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for vertex in self._graph[curr_vertex]:
+                if vertex not in visited:
+                    visited.add(vertex)
+                    queue.append((vertex, depth + 1, curr_vertex))
+
+    def iter_dfs(self, source, order='pre'):
+        """Lazily Depth First Search from source, yielding (vertex, depth, parent)
+           (parent is None for source) in pre-order (on entry) or post-order
+           (once all its descendants are done). O(V+E), no recursion."""
+        if order not in ('pre', 'post'):
+            print("ERROR: Unknown DFS order '{}'! Use 'pre' or 'post'.".format(order))
+            return
+        if not self.contains(source):
+            return
+        yield from self._dfs(source, set(), order == 'post')
+
+    def _dfs(self, source, visited, post=False):
+        """Utility generator for Depth First Search from source, sharing visited.
+           The explicit stack holds each open vertex with its neighbor iterator,
+           so the visiting order is the same as the recursive one."""
+        visited.add(source)
+        if not post:
+            yield source, 0, None
+        stack = [(source, None, iter(self._graph[source]))]
+        while stack:
+            curr_vertex, parent, neighbors = stack[-1]
+            for vertex in neighbors:
+                if vertex not in visited:
+                    visited.add(vertex)
+                    if not post:
+                        yield vertex, len(stack), curr_vertex
+                    stack.append((vertex, curr_vertex, iter(self._graph[vertex])))
+                    break
+            else:
+                stack.pop()
+                if post:
+                    yield curr_vertex, len(stack), parent
 
     def BFS(self, start_vertex, verbose=True):
         """Perform Breadth First Search (traverse) on the graph."""
@@ -205,16 +377,8 @@ class Graph:
 
     def _BFS(self, start_vertex, visited, callback):
         """Utility function to Breadth First Search (traverse) the graph."""
-        queue = []
-        queue.insert(0, start_vertex)
-        visited.add(start_vertex)
-        while queue:
-            curr_vertex = queue.pop()
-            callback(curr_vertex)
-            for vertex in self.neighbors(curr_vertex):
-                if vertex not in visited:
-                    queue.insert(0, vertex)
-                    visited.add(vertex)
+        for vertex, _, _ in self._bfs(start_vertex, visited):
+            callback(vertex)
 
     def DFS(self, start_vertex, verbose=True):
         """Perform Depth First Search (traverse) on the graph."""
@@ -231,35 +395,451 @@ class Graph:
 
     def _DFS(self, curr_vertex, visited, callback):
         """Utility function to Depth First Search (traverse) the graph."""
-        visited.add(curr_vertex)
-        callback(curr_vertex)
-        for vertex in self.neighbors(curr_vertex):
-            if vertex not in visited:
-                self._DFS(vertex, visited, callback)
+        for vertex, _, _ in self._dfs(curr_vertex, visited):
+            callback(vertex)
 
     def topological_sort(self, verbose=True):
         """Get topological sort stack for the graph."""
         visited = set()
-        stack = []
+        post_order = []
         rec_stack = set()
         for vertex in self.vertices():
             if vertex not in visited:
-                if self._topological_sort(vertex, visited, stack, rec_stack):
+                if self._topological_sort(vertex, visited, post_order, rec_stack):
                     print('ERROR: Graph is cyclic! Cannot perform Topological Sort.')
                     return None
+        stack = post_order[::-1]
         if verbose:
             print('TopologicalSort(Graph):', stack)
         return stack
 
-    def _topological_sort(self, curr_vertex, visited, stack, rec_stack):
-        """Utility function to perform topological sorting on the graph."""
+    def _topological_sort(self, curr_vertex, visited, post_order, rec_stack):
+        """Utility function to perform topological sorting on the graph: an iterative
+           post-order DFS (appending, reversed at the end), where rec_stack holds
+           the open vertices - reaching one again means a cycle."""
         visited.add(curr_vertex)
         rec_stack.add(curr_vertex)
-        for vertex in self.neighbors(curr_vertex):
-            if vertex not in visited:
-                if self._topological_sort(vertex, visited, stack, rec_stack):
+        stack = [(curr_vertex, iter(self._graph[curr_vertex]))]
+        while stack:
+            curr_vertex, neighbors = stack[-1]
+            for vertex in neighbors:
+                if vertex not in visited:
+                    visited.add(vertex)
+                    rec_stack.add(vertex)
+                    stack.append((vertex, iter(self._graph[vertex])))
+                    break
+                if vertex in rec_stack:
                     return True
-            elif vertex in rec_stack:
-                return True
-        stack.insert(0, curr_vertex)
-        rec_stack.remove(curr_vertex)
+            else:
+                stack.pop()
+                post_order.append(curr_vertex)
+                rec_stack.remove(curr_vertex)
+        return False
+
+    def _in_degrees(self):
+        """Utility function to count the incoming edges of every vertex, O(V+E)."""
+        in_degree = dict.fromkeys(self._graph, 0)
+        for edges in self._graph.values():
+            for vertex in edges:
+                in_degree[vertex] += 1
+        return in_degree
+
+    def topological_generations(self):
+        """Lazily yield the topological generations (Kahn's algorithm): lists of vertices
+           whose predecessors are all in earlier generations, so each list can run in
+           parallel. O(V+E), no recursion. On a cycle, prints an ERROR and stops
+           (the vertices on or behind the cycle are never yielded)."""
+        in_degree = self._in_degrees()
+        generation = [vertex for vertex, degree in in_degree.items() if degree == 0]
+        done = 0
+        while generation:
+            yield generation
+            done += len(generation)
+            next_generation = []
+            for curr_vertex in generation:
+                for vertex in self._graph[curr_vertex]:
+                    in_degree[vertex] -= 1
+                    if in_degree[vertex] == 0:
+                        next_generation.append(vertex)
+            generation = next_generation
+        if done < len(in_degree):
+            print('ERROR: Graph is cyclic! Cannot perform Topological Sort.')
+
+
+def execute(dag, fn, workers=4, processes=False):
+    """Run fn(vertex) for every vertex of the directed acyclic graph dag on a pool of
+       workers (threads, or processes - fn must then be picklable). A vertex is
+       submitted the moment its in-degree hits zero (all its predecessors are done),
+       so the wall time follows the critical path rather than the vertex count.
+       On a failure, nothing new is submitted, the running tasks finish, and
+       the error is printed.
+       Returns:
+           results (dict): {vertex: fn(vertex)} (None if dag is cyclic or a task failed)."""
+    if sum(len(generation) for generation in dag.topological_generations()) < dag.size()[0]:
+        return None
+    in_degree = dag._in_degrees()
+    results = {}
+    failed = False
+    pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        running = {pool.submit(fn, vertex): vertex
+                   for vertex, degree in in_degree.items() if degree == 0}
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                curr_vertex = running.pop(future)
+                if future.exception() is not None:
+                    print('ERROR: Task {} failed: {!r}'.format(curr_vertex, future.exception()))
+                    failed = True
+                    continue
+                results[curr_vertex] = future.result()
+                if failed:
+                    continue
+                for vertex in dag.neighbors(curr_vertex):
+                    in_degree[vertex] -= 1
+                    if in_degree[vertex] == 0:
+                        running[pool.submit(fn, vertex)] = vertex
+    return None if failed else results
+
+##################################################
+# DAG Implementation
+##################################################
+class DAG(Graph):
+    """Directed Acyclic Graph keeping a topological order up to date (Pearce-Kelly).
+       Every vertex has a position in the order. An edge that already goes forward
+       costs O(1). A backward edge (u -> v, v before u) only searches the affected
+       region - vertices positioned between v and u - forward from v and backward
+       from u: reaching u from v means a cycle (the edge is rejected), otherwise
+       the two visited sets are swapped within their own positions."""
+
+    def __init__(self, edges=None, weighted=False):
+        self._order = []
+        self._position = {}
+        self._preds = defaultdict(set)
+        super().__init__(None, directed=True, weighted=weighted)
+        if edges:
+            self.add_edges(edges)
+
+    def _register(self, vertex):
+        """Utility function to give a new vertex the last position in the order."""
+        if vertex not in self._position:
+            self._position[vertex] = len(self._order)
+            self._order.append(vertex)
+
+    def position(self, vertex):
+        """Get the position of vertex in the topological order in O(1) (None if absent)."""
+        return self._position.get(vertex)
+
+    def topological_sort(self, verbose=True):
+        """Get the (maintained) topological order of the graph in O(V) - no search."""
+        stack = list(self._order)
+        if verbose:
+            print('TopologicalSort(DAG):', stack)
+        return stack
+
+    def add_vertex(self, vertex):
+        """Add vertex to the graph (last in the topological order)."""
+        if super().add_vertex(vertex) is None:
+            return None
+        self._register(vertex)
+        return True
+
+    def add_edge(self, vertex1, vertex2, weight=None):
+        """Add the edge vertex1 -> vertex2, unless it would create a cycle.
+           Returns:
+               feedback (Boolean): True if added (None if it would create a cycle)."""
+        if vertex1 == vertex2:
+            print('ERROR: Edge ({0}, {0}) is a self-loop! Graph would be cyclic.'.format(vertex1))
+            return None
+        self._register(vertex1)
+        self._register(vertex2)
+        if self._position[vertex1] > self._position[vertex2] and \
+           vertex2 not in self._graph[vertex1]:
+            if not self._reorder(vertex1, vertex2):
+                print('ERROR: Edge ({}, {}) would create a cycle! Not added.'.format(vertex1,
+                                                                                    vertex2))
+                return None
+        super().add_edge(vertex1, vertex2, weight)
+        self._preds[vertex2].add(vertex1)
+        return True
+
+    def _reorder(self, vertex1, vertex2):
+        """Utility function to make room for the backward edge vertex1 -> vertex2
+           (position[vertex2] < position[vertex1]). Returns False on a cycle."""
+        position = self._position
+        lower = position[vertex2]
+        upper = position[vertex1]
+        # Forward from vertex2, within the region: reaching vertex1 closes a cycle.
+        forward = {vertex2}
+        stack = [vertex2]
+        while stack:
+            for vertex in self._graph[stack.pop()]:
+                if vertex == vertex1:
+                    return False
+                if vertex not in forward and position[vertex] < upper:
+                    forward.add(vertex)
+                    stack.append(vertex)
+        # Backward from vertex1, within the region.
+        backward = {vertex1}
+        stack = [vertex1]
+        while stack:
+            for vertex in self._preds[stack.pop()]:
+                if vertex not in backward and position[vertex] > lower:
+                    backward.add(vertex)
+                    stack.append(vertex)
+        # Backward set first, then the forward set, into the same positions.
+        moved = sorted(backward, key=position.get) + sorted(forward, key=position.get)
+        slots = sorted(position[vertex] for vertex in moved)
+        for vertex, slot in zip(moved, slots):
+            position[vertex] = slot
+            self._order[slot] = vertex
+        return True
+
+    def set_edge_weight(self, vertex1, vertex2, weight):
+        """Sets the weight associated with the edge(vertex1, vertex2) to weight.
+           A missing edge is added (unless it would create a cycle)."""
+        if self.is_weighted() and not self.adjacent(vertex1, vertex2):
+            return self.add_edge(vertex1, vertex2, weight)
+        return super().set_edge_weight(vertex1, vertex2, weight)
+
+    def remove_edge(self, vertex1, vertex2):
+        """Remove edge{vertex1 : vertex2} (the order stays valid)."""
+        removed = super().remove_edge(vertex1, vertex2)
+        if removed:
+            self._preds[vertex2].discard(vertex1)
+        return removed
+
+    def remove_vertex(self, vertex):
+        """Remove vertex from the graph, closing its gap in the order in O(V)."""
+        if not self.contains(vertex):
+            return None
+        for successor in self._graph[vertex]:
+            self._preds[successor].discard(vertex)
+        self._preds.pop(vertex, None)
+        super().remove_vertex(vertex)
+        start = self._position.pop(vertex)
+        del self._order[start]
+        for slot in range(start, len(self._order)):
+            self._position[self._order[slot]] = slot
+        return True
+
+##################################################
+# Frozen Graph Implementation
+##################################################
+class FrozenGraph:
+    """Immutable graph in Compressed Sparse Row(CSR) form.
+       Vertices are interned to dense ids 0..V-1 (in the original vertex order).
+       The neighbors of id u are indices[indptr[u]:indptr[u+1]] (sorted), with
+       matching weights[...] - three flat arrays instead of a dict/set per vertex:
+       4 (or 8) bytes per edge (+8 for the weight), and traversals that index
+       arrays instead of hashing vertices. The arrays support the buffer protocol
+       (e.g. numpy.frombuffer can wrap them without a copy).
+       Weights must be numeric (stored as float64)."""
+
+    def __init__(self, vertices, indptr, indices, weights=None, directed=False):
+        self._vertices = vertices
+        self._ids = {vertex: idx for idx, vertex in enumerate(vertices)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self._directed = directed
+
+    @staticmethod
+    def id_typecode(num_vertices):
+        """Get the smallest array typecode for vertex ids (int32, else int64)."""
+        return 'i' if num_vertices < 2 ** 31 else 'q'
+
+    @classmethod
+    def from_edges(cls, edges, directed=False, weighted=False):
+        """Build a FrozenGraph straight from an edge iterable ((v1, v2) or (v1, v2, weight)),
+           without materialising a Graph - peak memory is a few flat arrays.
+           Duplicate edges are merged (the last weight wins), as in Graph."""
+        vertices = []
+        ids = {}
+        sources = array('q')
+        targets = array('q')
+        edge_weights = array('d') if weighted else None
+        for edge in edges:
+            for vertex in edge[:2]:
+                if vertex not in ids:
+                    ids[vertex] = len(vertices)
+                    vertices.append(vertex)
+            sources.append(ids[edge[0]])
+            targets.append(ids[edge[1]])
+            if weighted:
+                edge_weights.append(edge[2])
+        num_edges = len(sources)
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+            if weighted:
+                edge_weights = edge_weights + edge_weights
+        # Counting sort of the edges by source.
+        indptr = array('q', [0]) * (len(vertices) + 1)
+        for source in sources:
+            indptr[source + 1] += 1
+        for idx in range(len(vertices)):
+            indptr[idx + 1] += indptr[idx]
+        slots = array('q', indptr)
+        order = array('q', [0]) * len(sources)
+        for edge_idx, source in enumerate(sources):
+            order[slots[source]] = edge_idx
+            slots[source] += 1
+        # Sort each row by target, dropping duplicates (keeping the latest edge).
+        indices = array(cls.id_typecode(len(vertices)))
+        weights = array('d') if weighted else None
+        new_indptr = array('q', [0])
+        for idx in range(len(vertices)):
+            row = {}
+            for edge_idx in order[indptr[idx]:indptr[idx + 1]]:
+                # Mirrored (undirected) edge k is at k + num_edges: compare input positions.
+                target = targets[edge_idx]
+                if target not in row or row[target] % num_edges < edge_idx % num_edges:
+                    row[target] = edge_idx
+            for target in sorted(row):
+                indices.append(target)
+                if weighted:
+                    weights.append(edge_weights[row[target]])
+            new_indptr.append(len(indices))
+        return cls(vertices, new_indptr, indices, weights, directed)
+
+    def thaw(self):
+        """Convert back to a (mutable) Graph."""
+        graph = Graph(directed=self._directed, weighted=self.is_weighted())
+        vertices = self._vertices
+        for idx, vertex in enumerate(vertices):
+            graph.add_vertex(vertex)
+            for pos in range(self.indptr[idx], self.indptr[idx + 1]):
+                if self.weights is not None:
+                    graph.add_edge(vertex, vertices[self.indices[pos]], self.weights[pos])
+                else:
+                    graph.add_edge(vertex, vertices[self.indices[pos]])
+        return graph
+
+    def __str__(self):
+        return 'FrozenGraph(vertices={}, edges={}, directed={}, weighted={})'.format(
+            *self.size(), self._directed, self.is_weighted())
+
+    def is_directed(self):
+        """Check if the graph is directed."""
+        return self._directed
+
+    def is_weighted(self):
+        """Check if the graph is weighted (edges have values)."""
+        return self.weights is not None
+
+    def vertices(self):
+        """Get all vertices in the graph."""
+        return list(self._vertices)
+
+    def contains(self, vertex):
+        """Check if the graph contains vertex."""
+        return vertex in self._ids
+
+    def vertex_id(self, vertex):
+        """Get the dense id of vertex (None if absent)."""
+        return self._ids.get(vertex)
+
+    def size(self):
+        """Get the number of vertices and (stored) edges in the graph."""
+        return (len(self._vertices), len(self.indices))
+
+    def _edge_pos(self, vertex1, vertex2):
+        """Utility function to get the position of edge{vertex1 : vertex2} in indices
+           (binary search in the sorted row), or None."""
+        if vertex1 not in self._ids or vertex2 not in self._ids:
+            return None
+        idx = self._ids[vertex1]
+        target = self._ids[vertex2]
+        pos = bisect_left(self.indices, target, self.indptr[idx], self.indptr[idx + 1])
+        if pos < self.indptr[idx + 1] and self.indices[pos] == target:
+            return pos
+        return None
+
+    def adjacent(self, vertex1, vertex2):
+        """Check if edge{vertex1 : vertex2} exists."""
+        return self._edge_pos(vertex1, vertex2) is not None
+
+    def degree(self, vertex):
+        """Get the (out-)degree of vertex in O(1)."""
+        if vertex not in self._ids:
+            return None
+        idx = self._ids[vertex]
+        return self.indptr[idx + 1] - self.indptr[idx]
+
+    def neighbors(self, vertex):
+        """List all vertices y such that there is an edge{vertex : y}."""
+        if vertex not in self._ids:
+            return None
+        idx = self._ids[vertex]
+        vertices = self._vertices
+        return [vertices[nbr] for nbr in self.indices[self.indptr[idx]:self.indptr[idx + 1]]]
+
+    def get_edge_weight(self, vertex1, vertex2):
+        """Returns the weight associated with the edge(vertex1, vertex2)."""
+        if not self.is_weighted():
+            print("WARNING: Graph is NOT weighted!")
+            return None
+        pos = self._edge_pos(vertex1, vertex2)
+        if pos is not None:
+            return self.weights[pos]
+
+    def _traverse(self, start_vertex, single_pass, verbose, name):
+        """Utility function to traverse from start_vertex, then from every unvisited vertex."""
+        if not self.contains(start_vertex):
+            return None
+        visited = bytearray(len(self._vertices))
+        order = array(self.id_typecode(len(self._vertices)))
+        single_pass(self._ids[start_vertex], visited, order.append)
+        for idx in range(len(self._vertices)):
+            if not visited[idx]:
+                single_pass(idx, visited, order.append)
+        traversal = [self._vertices[idx] for idx in order]
+        if verbose:
+            print('{}(FrozenGraph) ='.format(name), traversal)
+        return traversal
+
+    def BFS(self, start_vertex, verbose=True):
+        """Perform Breadth First Search (traverse) on the graph, from start_vertex first."""
+        return self._traverse(start_vertex, self._BFS, verbose, 'BFS')
+
+    def _BFS(self, start, visited, callback):
+        """Utility function to Breadth First Search from id start - the frontier is an id array."""
+        indptr = self.indptr
+        indices = self.indices
+        queue = array(self.indices.typecode, [start])
+        visited[start] = 1
+        head = 0
+        while head < len(queue):
+            curr = queue[head]
+            head += 1
+            callback(curr)
+            for nbr in indices[indptr[curr]:indptr[curr + 1]]:
+                if not visited[nbr]:
+                    visited[nbr] = 1
+                    queue.append(nbr)
+
+    def DFS(self, start_vertex, verbose=True):
+        """Perform Depth First Search (traverse) on the graph, from start_vertex first."""
+        return self._traverse(start_vertex, self._DFS, verbose, 'DFS')
+
+    def _DFS(self, start, visited, callback):
+        """Utility function to (pre-order) Depth First Search from id start, iteratively:
+           the stack holds (id, next edge position), so the order matches recursion."""
+        indptr = self.indptr
+        indices = self.indices
+        visited[start] = 1
+        callback(start)
+        stack = [(start, indptr[start])]
+        while stack:
+            curr, pos = stack[-1]
+            end = indptr[curr + 1]
+            while pos < end and visited[indices[pos]]:
+                pos += 1
+            if pos == end:
+                stack.pop()
+                continue
+            stack[-1] = (curr, pos + 1)
+            nbr = indices[pos]
+            visited[nbr] = 1
+            callback(nbr)
+            stack.append((nbr, indptr[nbr]))
@@ -10,13 +10,31 @@
 #      - Traverse:
 #          > DFS, BFS
 #      - Find_path, topological_sort
+#   Tests Lazy traversal:
+#      - Iter_bfs (+max_depth, early exit), iter_dfs (pre/post-order).
+#      - 10^5-vertex chain: DFS, topological_sort, find_path without recursion.
+#   Tests Scheduling:
+#      - Topological_generations (Kahn waves), cyclic graph.
+#      - Execute: dependencies done first, independent tasks overlap, failing task.
+#   Tests DAG (online topological order):
+#      - Add_edge reorders only when needed, rejects cycles & self-loops; position.
+#      - Remove_vertex, set_edge_weight (directed: no mirrored edge).
+#   Tests Frozen Graph (CSR):
+#      - Freeze, from_edges, thaw (round trip).
+#      - Size, vertices, adjacent, degree, neighbors, get_edge_weight, BFS, DFS.
+#   Tests Shortest paths:
+#      - Shortest_path, shortest_path_lengths (+cutoff), astar (grid, Manhattan heuristic).
 """
 #################################################
 # ###  Author: Samyuel Danyo
 # ###  Date: 30/07/2020
-# ###  Last Edit: 30/07/2020
+# ###  Last Edit: 18/10/2026
 ##################################################
 # ## imports
+# Python Standard Library
+import threading
+from time import perf_counter, sleep
+
 # Local Application/Library Specific Imports.
 import graph as grph
 ##################################################
@@ -157,3 +175,139 @@ print("Path(E, D) =", GRAPH.find_path('E', 'D'))
 print("Path(A, G) =", GRAPH.find_path('A', 'G'))
 print("Path(A, F) =", GRAPH.find_path('A', 'F'))
 GRAPH.topological_sort()
+
+print("\n==== TEST FROZEN GRAPH (CSR) IMPLEMENTATION ====")
+GRAPH = grph.Graph(EDGES, directed=False, weighted=True)
+FROZEN = GRAPH.freeze()
+print(FROZEN)
+print("indptr={}, indices={}, weights={}".format(list(FROZEN.indptr), list(FROZEN.indices),
+                                                 list(FROZEN.weights)))
+print(FROZEN.size(), "Vertices:", FROZEN.vertices())
+print("F.adjacent(E)={}, A.adjacent(C)={}, A.adjacent(V)={}".format(FROZEN.adjacent('F', 'E'),
+                                                                    FROZEN.adjacent('A', 'C'),
+                                                                    FROZEN.adjacent('A', 'V')))
+print("B.degree()={}, B.neighbors()={}, Edge(C, D) weight={}".format(
+    FROZEN.degree('B'), FROZEN.neighbors('B'), FROZEN.get_edge_weight('C', 'D')))
+FROZEN.BFS('A')
+FROZEN.DFS('A')
+assert FROZEN.size() == GRAPH.size() and FROZEN.get_edge_weight('C', 'D') == 6
+assert sorted(FROZEN.neighbors('B')) == sorted(GRAPH.neighbors('B'))
+print("Thaw:")
+THAWED = FROZEN.thaw()
+print(THAWED)
+assert THAWED._graph == GRAPH._graph
+FROZEN = grph.FrozenGraph.from_edges(EDGES + [('A', 'B', 5)], directed=True, weighted=True)
+print("from_edges(directed): {} | Edge(A, B) weight={} | B.neighbors()={}".format(
+    FROZEN, FROZEN.get_edge_weight('A', 'B'), FROZEN.neighbors('B')))
+assert FROZEN.get_edge_weight('A', 'B') == 5 and FROZEN.size() == (6, 6)
+
+print("\n==== TEST SHORTEST PATHS ====")
+GRAPH = grph.Graph(EDGES, directed=False, weighted=True)
+print("ShortestPath(A, E) =", GRAPH.shortest_path('A', 'E'))
+print("ShortestPath(A, E, cutoff=5) =", GRAPH.shortest_path('A', 'E', cutoff=5))
+print("ShortestPath(A, G) =", GRAPH.shortest_path('A', 'G'))
+print("ShortestPathLengths(A) =", GRAPH.shortest_path_lengths('A'))
+print("ShortestPathLengths(A, cutoff=6) =", GRAPH.shortest_path_lengths('A', cutoff=6))
+assert GRAPH.shortest_path('A', 'E') == (10, ['A', 'B', 'C', 'F', 'E'])
+assert GRAPH.shortest_path('A', 'E', cutoff=5) == (float('inf'), [])
+assert GRAPH.shortest_path_lengths('A', cutoff=6) == {'A': 0, 'B': 3, 'D': 5}
+GRAPH.add_edge('A', 'W', -1)
+print("ShortestPath(A, E) with negative edge =", GRAPH.shortest_path('A', 'E'))
+# 30x30 grid with random weights in [1, 5]; Manhattan distance never overestimates.
+GRID = grph.Graph(weighted=True)
+for x in range(30):
+    for y in range(30):
+        if x < 29:
+            GRID.add_edge((x, y), (x + 1, y), 1 + (x * 7 + y * 13) % 5)
+        if y < 29:
+            GRID.add_edge((x, y), (x, y + 1), 1 + (x * 11 + y * 3) % 5)
+DIST, PATH = GRID.astar((0, 0), (29, 29), lambda vertex: (29 - vertex[0]) + (29 - vertex[1]))
+print("A*((0, 0), (29, 29)): distance={}, path length={}".format(DIST, len(PATH)))
+assert (DIST, len(PATH)) == (GRID.shortest_path((0, 0), (29, 29))[0], 59)
+
+print("\n==== TEST LAZY TRAVERSAL ====")
+GRAPH = grph.Graph(EDGES, directed=True, weighted=True)
+print("iter_bfs(A) =", list(GRAPH.iter_bfs('A')))
+print("iter_bfs(A, max_depth=1) =", list(GRAPH.iter_bfs('A', max_depth=1)))
+print("iter_dfs(E) =", list(GRAPH.iter_dfs('E')))
+print("iter_dfs(E, post) =", list(GRAPH.iter_dfs('E', order='post')))
+assert list(GRAPH.iter_bfs('A', max_depth=1)) == [('A', 0, None), ('B', 1, 'A')]
+assert list(GRAPH.iter_dfs('E')) == [('E', 0, None), ('F', 1, 'E'), ('C', 2, 'F'), ('D', 3, 'C')]
+assert [vertex for vertex, _, _ in GRAPH.iter_dfs('E', order='post')] == ['D', 'C', 'F', 'E']
+for vertex, depth, parent in GRAPH.iter_bfs('A'):
+    if vertex == 'C':
+        print("Early exit: found C at depth {} via {}".format(depth, parent))
+        break
+CHAIN = grph.Graph([(idx, idx + 1) for idx in range(10 ** 5)], directed=True)
+FIRST = next(CHAIN.iter_dfs(0, order='post'))
+print("Chain of {} vertices: DFS={}, topological_sort={}, find_path={}, first post-order={}"
+      .format(CHAIN.size()[0], len(CHAIN.DFS(0, False)), len(CHAIN.topological_sort(False)),
+              len(CHAIN.find_path(0, 10 ** 5)), FIRST))
+assert FIRST == (10 ** 5, 10 ** 5, 10 ** 5 - 1)
+
+print("\n==== TEST SCHEDULING (KAHN WAVES) ====")
+# Build graph: 'lib' -> 4 independent modules -> 'link' -> 'test'.
+BUILD = grph.Graph([('lib', 'mod{}'.format(idx)) for idx in range(4)], directed=True)
+BUILD.add_edges([('mod{}'.format(idx), 'link') for idx in range(4)] + [('link', 'test')])
+GENERATIONS = list(BUILD.topological_generations())
+print("TopologicalGenerations(Build) =", GENERATIONS)
+assert [len(generation) for generation in GENERATIONS] == [1, 4, 1, 1]
+print("TopologicalGenerations(cyclic) =",
+      list(grph.Graph([('A', 'B'), ('B', 'C'), ('C', 'A')], directed=True)
+           .topological_generations()))
+DONE = []
+SPANS = {}
+DONE_LOCK = threading.Lock()
+
+def build(vertex):
+    """Fake build step: check the dependencies are done, then take 50ms."""
+    start = perf_counter()
+    with DONE_LOCK:
+        missing = [dep for dep in BUILD.vertices() if vertex in BUILD.neighbors(dep)
+                   and dep not in DONE]
+    sleep(0.05)
+    with DONE_LOCK:
+        DONE.append(vertex)
+        SPANS[vertex] = (start, perf_counter())
+    return missing
+
+START = perf_counter()
+RESULTS = grph.execute(BUILD, build, workers=4)
+WALL_MS = (perf_counter() - START) * 1e3
+print("Execute(Build, workers=4): order={}, wall={:.0f} ms (7 tasks x 50 ms, critical path 4)"
+      .format(DONE, WALL_MS))
+assert all(not missing for missing in RESULTS.values()) and len(RESULTS) == 7
+# Independent modules ran in parallel: some of their [start, end] spans overlap.
+MODS = [SPANS['mod{}'.format(idx)] for idx in range(4)]
+assert any(span1[0] < span2[1] and span2[0] < span1[1]
+           for idx, span1 in enumerate(MODS) for span2 in MODS[idx + 1:])
+
+def fail_link(vertex):
+    """Fake build step where linking fails."""
+    if vertex == 'link':
+        raise RuntimeError('undefined reference')
+    return vertex
+
+print("Execute(Build, failing link) =", grph.execute(BUILD, fail_link))
+
+print("\n==== TEST DAG (ONLINE TOPOLOGICAL ORDER) ====")
+DAG = grph.DAG([('A', 'B'), ('C', 'D'), ('B', 'C')])
+print("TopologicalSort after A->B, C->D, B->C:", end=' ')
+DAG.topological_sort()
+print("Add edge(E, A) = {} | position(E) = {}".format(DAG.add_edge('E', 'A'), DAG.position('E')))
+print("Add edge(D, A) = {}".format(DAG.add_edge('D', 'A')))
+print("Add edge(B, B) = {}".format(DAG.add_edge('B', 'B')))
+ORDER = DAG.topological_sort()
+assert ORDER == ['E', 'A', 'B', 'C', 'D'] and DAG.position('C') == 3
+assert not DAG.adjacent('D', 'A')
+print("Remove vertex B:", end=' ')
+DAG.remove_vertex('B')
+DAG.topological_sort()
+print("Add edge(D, A) = {}".format(DAG.add_edge('D', 'A')))
+ORDER = DAG.topological_sort()
+assert ORDER.index('D') < ORDER.index('A') and ORDER.index('C') < ORDER.index('D')
+assert all(DAG.position(vertex) == idx for idx, vertex in enumerate(ORDER))
+DAG = grph.DAG([('A', 'B', 1)], weighted=True)
+print("Set edge(A, B) weight = {}, Set edge(B, A) weight = {}".format(
+    DAG.set_edge_weight('A', 'B', 5), DAG.set_edge_weight('B', 'A', 5)))
+assert DAG.get_edge_weight('A', 'B') == 5 and not DAG.adjacent('B', 'A')
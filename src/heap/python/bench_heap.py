@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#################################################
+""" bench_heap.py
+# # Benchmark for d-ary Heap Implementation
+#   Measures per-operation push & pop cost for every arity and reports
+#   the push:pop ratio above which a d-ary heap beats the binary heap.
+#   Every arity runs its keyless fast path; the reference is the binary one.
+#   "<d> (generic loop)" forces the generic (key-aware) loop, for comparison.
+#   Usage: python bench_heap.py [num_elements]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+from random import random
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import heap
+##################################################
+# Benchmark
+##################################################
+ARITIES = [2, 3, 4, 8, 16]
+NUM_ELS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+def bench(arity, values, generic=False):
+    """Get the (push, pop) cost per operation in ns for arity
+       (generic - use the d-ary sift loops even for arity 2)."""
+    hp = heap.Heap(htype="min", arity=arity)
+    if generic:
+        hp._binary = hp._dary = False
+    start = perf_counter()
+    for value in values:
+        hp.push(value)
+    push_time = perf_counter() - start
+    start = perf_counter()
+    while not hp.is_empty():
+        hp.pop()
+    pop_time = perf_counter() - start
+    return push_time / len(values) * 1e9, pop_time / len(values) * 1e9
+
+VALUES = [random() for _ in range(NUM_ELS)]
+RESULTS = {arity: bench(arity, VALUES) for arity in ARITIES}
+for arity in (2, 8):
+    RESULTS["{} (generic loop)".format(arity)] = bench(arity, VALUES, generic=True)
+BIN_PUSH, BIN_POP = RESULTS[2]
+print("==== D-ARY HEAP: {} elements ====".format(NUM_ELS))
+print("{:>16} | {:>12} | {:>12} | {}".format("arity", "push ns/op", "pop ns/op",
+                                             "beats binary when pushes/pop"))
+for arity, (push_ns, pop_ns) in RESULTS.items():
+    # Workload cost per pop: ratio*push + pop. Solve d-ary == binary for ratio.
+    if arity == 2:
+        crossover = "-"
+    elif push_ns >= BIN_PUSH:
+        if pop_ns >= BIN_POP:
+            crossover = "never"
+        elif push_ns == BIN_PUSH:
+            crossover = "always"
+        else:
+            crossover = "< {:.2f}".format((BIN_POP - pop_ns) / (push_ns - BIN_PUSH))
+    elif pop_ns <= BIN_POP:
+        crossover = "always"
+    else:
+        crossover = "> {:.2f}".format((pop_ns - BIN_POP) / (BIN_PUSH - push_ns))
+    print("{:>16} | {:>12.0f} | {:>12.0f} | {}".format(arity, push_ns, pop_ns, crossover))
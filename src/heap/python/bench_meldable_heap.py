@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+#################################################
+""" bench_meldable_heap.py
+# # Benchmark for Meldable Heap Implementations vs array Heap.merge
+#   Consolidates many small heaps into one (shard-consolidation workload),
+#   then drains the result, for heap.Heap and every meldable heap.
+#   Usage: python bench_meldable_heap.py [num_heaps] [heap_size]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+from random import random
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import heap
+import meldable_heap as mh
+##################################################
+# Benchmark
+##################################################
+NUM_HEAPS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+HEAP_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+SHARDS = [[random() for _ in range(HEAP_SIZE)] for _ in range(NUM_HEAPS)]
+
+def bench(heap_class, merge):
+    """Get the (merge, pop) time in ms for consolidating SHARDS with heap_class."""
+    heaps = [heap_class(list(shard)) for shard in SHARDS]
+    start = perf_counter()
+    total = heaps[0]
+    for other in heaps[1:]:
+        merge(total, other)
+    merge_time = perf_counter() - start
+    start = perf_counter()
+    while not total.is_empty():
+        total.pop()
+    pop_time = perf_counter() - start
+    return merge_time * 1e3, pop_time * 1e3
+
+print("==== MERGE {} HEAPS x {} ELEMENTS ====".format(NUM_HEAPS, HEAP_SIZE))
+print("{:>12} | {:>10} | {:>10}".format("heap", "merge ms", "drain ms"))
+RESULTS = [("Heap", bench(heap.Heap, lambda total, other: total.merge(other.data)))]
+for HEAP_CLASS in (mh.PairingHeap, mh.LeftistHeap, mh.SkewHeap):
+    RESULTS.append((HEAP_CLASS.__name__,
+                    bench(HEAP_CLASS, lambda total, other: total.merge(other))))
+for name, (merge_ms, pop_ms) in RESULTS:
+    print("{:>12} | {:>10.1f} | {:>10.1f}".format(name, merge_ms, pop_ms))
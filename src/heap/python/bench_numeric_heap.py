@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#################################################
+""" bench_numeric_heap.py
+# # Benchmark for Numeric Heap vs Heap
+#   Reports memory per element and throughput of build, push, pop
+#   and the batched push_many/pop_many.
+#   Usage: python bench_numeric_heap.py [num_elements]
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import sys
+from random import random
+from time import perf_counter
+
+# Local Application/Library Specific Imports.
+import heap
+import numeric_heap as nh
+##################################################
+# Benchmark
+##################################################
+NUM_ELS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+VALUES = [random() for _ in range(NUM_ELS)]
+
+def timed(func):
+    """Get (result, elapsed time in ms) of func()."""
+    start = perf_counter()
+    result = func()
+    return result, (perf_counter() - start) * 1e3
+
+def memory_per_element(hp):
+    """Get the bytes per element of the heap storage (container + element objects)."""
+    total = sys.getsizeof(hp.data)
+    if isinstance(hp.data, list):
+        total += sum(sys.getsizeof(value) for value in hp.data)
+    return total / hp.size()
+
+def drain(hp):
+    """Pop every element, one by one."""
+    while not hp.is_empty():
+        hp.pop()
+
+def push_all(hp):
+    """Push every value, one by one."""
+    for value in VALUES:
+        hp.push(value)
+
+print("==== NUMERIC HEAP vs HEAP: {} floats ====".format(NUM_ELS))
+HEAP, BUILD = timed(lambda: heap.Heap(list(VALUES)))
+NUM_HEAP, NUM_BUILD = timed(lambda: nh.NumericHeap.from_array(VALUES))
+print("{:>22} | {:>10} | {:>12}".format("", "Heap", "NumericHeap"))
+print("{:>22} | {:>10.1f} | {:>12.1f}".format("bytes / element",
+                                              memory_per_element(HEAP), memory_per_element(NUM_HEAP)))
+print("{:>22} | {:>10.1f} | {:>12.1f}".format("build ms", BUILD, NUM_BUILD))
+_, HEAP_POP = timed(lambda: drain(HEAP))
+_, NUM_POP = timed(lambda: drain(NUM_HEAP))
+_, HEAP_PUSH = timed(lambda: push_all(HEAP))
+_, NUM_PUSH = timed(lambda: push_all(NUM_HEAP))
+print("{:>22} | {:>10.1f} | {:>12.1f}".format("push one by one ms", HEAP_PUSH, NUM_PUSH))
+print("{:>22} | {:>10.1f} | {:>12.1f}".format("pop one by one ms", HEAP_POP, NUM_POP))
+NUM_HEAP = nh.NumericHeap()
+_, NUM_PUSH_MANY = timed(lambda: NUM_HEAP.push_many(VALUES))
+_, NUM_POP_MANY = timed(lambda: NUM_HEAP.pop_many(NUM_ELS))
+print("{:>22} | {:>10} | {:>12.1f}".format("push_many ms", "-", NUM_PUSH_MANY))
+print("{:>22} | {:>10} | {:>12.1f}".format("pop_many ms", "-", NUM_POP_MANY))
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+#################################################
+""" concurrent_heap.py
+# # Thread-Safe & Asyncio Priority Queue Implementations (over Heap)
+#   Supports:
+#     - ConcurrentHeap (threads):
+#         > put, get (blocking, with timeout), put_many, get_many, peek.
+#     - AsyncHeap (asyncio):
+#         > await put/get/get_many, put_nowait, get_nowait, put_threadsafe.
+#     - Inspection
+#         > size, is_empty, is_full, capacity.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import asyncio
+import threading
+from collections import deque
+
+# Local Application/Library Specific Imports.
+from heap import Heap
+##################################################
+# Thread-Safe Implementation
+##################################################
+class ConcurrentHeap:
+    """Thread-safe priority queue over Heap.
+       One lock guards the heap, with two conditions: put blocks while the heap
+       is full (cap), get blocks while it is empty. Timeouts return None
+       (so None should not be stored as a value).
+       get_many/put_many move a whole batch under one lock acquisition."""
+    def __init__(self, data=None, htype="min", cap=float("inf"), arity=2, key=None):
+        self._heap = Heap(data, htype, cap, arity, key)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __str__(self):
+        with self._lock:
+            return str(self._heap)
+
+    def size(self):
+        """Get the number of elements in the heap."""
+        with self._lock:
+            return self._heap.size()
+
+    def is_empty(self):
+        """True if the heap is empty."""
+        return self.size() <= 0
+
+    def capacity(self):
+        """Get the heap's capacity."""
+        return self._heap.capacity()
+
+    def is_full(self):
+        """True if the heap is full."""
+        with self._lock:
+            return self._heap.is_full()
+
+    def put(self, value, block=True, timeout=None):
+        """Add a value to the heap, waiting (up to timeout seconds) for free space.
+           Returns:
+               feedback (Boolean): True if value was added, None on timeout."""
+        with self._not_full:
+            if not self._wait(self._not_full, self._heap.is_full, block, timeout):
+                return None
+            self._heap.push(value)
+            self._not_empty.notify()
+            return True
+
+    def put_many(self, values, timeout=None):
+        """Add a batch of values, waiting (up to timeout seconds) whenever the heap is full.
+           Returns:
+               num_put (int): The number of values added."""
+        num_put = 0
+        with self._not_full:
+            for value in values:
+                if not self._wait(self._not_full, self._heap.is_full, True, timeout):
+                    break
+                self._heap.push(value)
+                num_put += 1
+                self._not_empty.notify()
+        return num_put
+
+    def get(self, block=True, timeout=None):
+        """Pop the root, waiting (up to timeout seconds) for an element.
+           Returns:
+               value: The root value, None on timeout."""
+        with self._not_empty:
+            if not self._wait(self._not_empty, self._heap.is_empty, block, timeout):
+                return None
+            value = self._heap.pop()
+            self._not_full.notify()
+            return value
+
+    def get_many(self, num, block=True, timeout=None):
+        """Pop up to num values (in heap order), waiting (up to timeout seconds)
+           only until the first one is available.
+           Returns:
+               values (list): The popped values, empty on timeout."""
+        with self._not_empty:
+            if not self._wait(self._not_empty, self._heap.is_empty, block, timeout):
+                return []
+            values = []
+            while len(values) < num and not self._heap.is_empty():
+                values.append(self._heap.pop())
+            self._not_full.notify(len(values))
+            return values
+
+    def peek(self):
+        """Find the root value without removing it (None if empty)."""
+        with self._lock:
+            if self._heap.is_empty():
+                return None
+            return self._heap.peek()
+
+    @staticmethod
+    def _wait(condition, blocked, block, timeout):
+        """Utility function to wait on condition while blocked() (lock held).
+           Returns False if still blocked after timeout (or straight away if not block)."""
+        if not blocked():
+            return True
+        if not block:
+            return False
+        return condition.wait_for(lambda: not blocked(), timeout)
+
+##################################################
+# Asyncio Implementation
+##################################################
+class AsyncHeap:
+    """Asyncio priority queue over Heap.
+       put awaits while the heap is full (cap), get awaits while it is empty.
+       Like asyncio.Queue, waiters park on futures, and every put/get (nowait or not)
+       synchronously wakes up the next waiter of the other side.
+       Timeouts return None (so None should not be stored as a value).
+       Not thread-safe, except for put_threadsafe, which lets producer threads
+       hand values over to the event loop the heap is used on."""
+    def __init__(self, data=None, htype="min", cap=float("inf"), arity=2, key=None, loop=None):
+        self._heap = Heap(data, htype, cap, arity, key)
+        self._getters = deque()
+        self._putters = deque()
+        self._loop = loop
+
+    def __str__(self):
+        return str(self._heap)
+
+    def size(self):
+        """Get the number of elements in the heap."""
+        return self._heap.size()
+
+    def is_empty(self):
+        """True if the heap is empty."""
+        return self._heap.is_empty()
+
+    def capacity(self):
+        """Get the heap's capacity."""
+        return self._heap.capacity()
+
+    def is_full(self):
+        """True if the heap is full."""
+        return self._heap.is_full()
+
+    def peek(self):
+        """Find the root value without removing it (None if empty)."""
+        if self.is_empty():
+            return None
+        return self._heap.peek()
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Utility function to wake up the first waiter still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, blocked, timeout):
+        """Utility function to wait on a future in waiters while blocked().
+           Returns False if still blocked after timeout."""
+        loop = self._loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while blocked():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                if deadline is None:
+                    await waiter
+                else:
+                    await asyncio.wait_for(waiter, max(0, deadline - loop.time()))
+            except BaseException as err:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Pass on a wake up this waiter received, but can no longer use.
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                if isinstance(err, asyncio.TimeoutError):
+                    return False
+                raise
+        return True
+
+    async def put(self, value, timeout=None):
+        """Add a value to the heap, waiting (up to timeout seconds) for free space.
+           Returns:
+               feedback (Boolean): True if value was added, None on timeout."""
+        if not await self._wait(self._putters, self._heap.is_full, timeout):
+            return None
+        return self.put_nowait(value)
+
+    async def get(self, timeout=None):
+        """Pop the root, waiting (up to timeout seconds) for an element.
+           Returns:
+               value: The root value, None on timeout."""
+        if not await self._wait(self._getters, self._heap.is_empty, timeout):
+            return None
+        return self.get_nowait()
+
+    async def get_many(self, num, timeout=None):
+        """Pop up to num values (in heap order), waiting (up to timeout seconds)
+           only until the first one is available.
+           Returns:
+               values (list): The popped values, empty on timeout."""
+        if not await self._wait(self._getters, self._heap.is_empty, timeout):
+            return []
+        values = []
+        while len(values) < num and not self._heap.is_empty():
+            values.append(self.get_nowait())
+        return values
+
+    def put_nowait(self, value):
+        """Add a value without waiting. Returns None if the heap is full."""
+        if self._heap.is_full():
+            return None
+        self._heap.push(value)
+        self._wakeup_next(self._getters)
+        return True
+
+    def get_nowait(self):
+        """Pop the root without waiting. Returns None if the heap is empty."""
+        if self._heap.is_empty():
+            return None
+        value = self._heap.pop()
+        self._wakeup_next(self._putters)
+        return value
+
+    def put_threadsafe(self, value, timeout=None):
+        """Add a value from another thread (blocks the calling thread while full).
+           Must not be called from the event loop's own thread, as blocking it
+           would deadlock: raises RuntimeError there (use put/put_nowait instead).
+           Returns:
+               feedback (Boolean): True if value was added, None on timeout
+                                   (or if the heap was never used on a loop)."""
+        if self._loop is None:
+            print("WARNING: AsyncHeap NOT bound to an event loop!")
+            return None
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            raise RuntimeError("put_threadsafe called from the event loop's thread")
+        return asyncio.run_coroutine_threadsafe(self.put(value, timeout), self._loop).result()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+#################################################
+""" external_sort.py
+# # External Merge Sort Implementation (k-way merge over Heap)
+#   Sorts datasets larger than memory: sorted runs are spilled
+#   to temporary files and streamed back through a k-way merge.
+#   Supports:
+#     - merge_sorted: lazy k-way merge of sorted iterables.
+#     - ExternalSorter/external_sort: run spilling (pickle or fixed-width struct records),
+#       multi-pass merge bounded by max_fanout open runs.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import pickle
+import struct
+import tempfile
+from itertools import islice
+
+# Local Application/Library Specific Imports.
+from heap import Heap
+##################################################
+# K-Way Merge Implementation
+##################################################
+def merge_sorted(*iterables, key=None, reverse=False):
+    """Lazily merge sorted iterables into a single sorted stream.
+       A heap holds one cursor [key, order, value, iterator] per non-exhausted iterable.
+       Cursors compare on (key, order), so values are never compared directly and
+       equal keys are yielded in iterable order (stable).
+       Complexity: O(n*log(k)) time, O(k) memory for n values over k iterables."""
+    heap = Heap(htype="max" if reverse else "min")
+    # Earlier iterables win ties: min-heap prefers low orders, max-heap high ones.
+    sign = -1 if reverse else 1
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.push([value if key is None else key(value), order * sign, value, iterator])
+            break
+    while heap.size() > 1:
+        cursor = heap.peek()
+        yield cursor[2]
+        for value in cursor[3]:
+            cursor[0] = value if key is None else key(value)
+            cursor[2] = value
+            heap.replace(cursor)
+            break
+        else:
+            heap.pop()
+    # A single iterable left - stream it without the heap.
+    if heap.size():
+        cursor = heap.pop()
+        yield cursor[2]
+        yield from cursor[3]
+
+##################################################
+# External Sort Implementation
+##################################################
+class ExternalSorter:
+    """External merge sort.
+       Values are consumed in runs of run_size, each run is sorted in memory and
+       spilled to an anonymous temporary file. The runs are then streamed back
+       through merge_sorted, at most max_fanout at a time (extra merge passes
+       are made when there are more runs than that).
+       Runs are stored either as pickled chunks of chunk_size values (default) or,
+       when record_format is given, as fixed-width struct records (e.g. "d", "qd"),
+       which is far more compact for numeric data.
+       Complexity: O(n*log(n)) time, O(run_size + max_fanout*chunk_size) memory."""
+    def __init__(self, key=None, reverse=False, run_size=100000, record_format=None,
+                 max_fanout=64, chunk_size=1024, tmp_dir=None):
+        self.key = key
+        self.reverse = reverse
+        self.run_size = run_size
+        self.max_fanout = max(2, max_fanout)
+        self.chunk_size = chunk_size
+        self.tmp_dir = tmp_dir
+        self.record = None if record_format is None else struct.Struct(record_format)
+        # Single field records are (un)packed as scalars, not 1-tuples.
+        self._scalar = self.record is not None and len(self.record.unpack(bytes(self.record.size))) == 1
+
+    def _write_run(self, values):
+        """Utility function to spill sorted values to a new temporary run file."""
+        run = tempfile.TemporaryFile(dir=self.tmp_dir)
+        values = iter(values)
+        while True:
+            chunk = list(islice(values, self.chunk_size))
+            if not chunk:
+                break
+            if self.record is None:
+                pickle.dump(chunk, run, pickle.HIGHEST_PROTOCOL)
+            elif self._scalar:
+                run.write(b"".join(map(self.record.pack, chunk)))
+            else:
+                run.write(b"".join(self.record.pack(*value) for value in chunk))
+        run.seek(0)
+        return run
+
+    def _read_run(self, run):
+        """Utility function to stream the values of a run file back, chunk by chunk."""
+        if self.record is None:
+            while True:
+                try:
+                    yield from pickle.load(run)
+                except EOFError:
+                    return
+        block_size = self.record.size * self.chunk_size
+        while True:
+            block = run.read(block_size)
+            if not block:
+                return
+            if self._scalar:
+                for (value,) in self.record.iter_unpack(block):
+                    yield value
+            else:
+                yield from self.record.iter_unpack(block)
+
+    def sort(self, iterable):
+        """Lazily sort iterable, spilling to disk once it does not fit in a run."""
+        values = iter(iterable)
+        first = sorted(islice(values, self.run_size), key=self.key, reverse=self.reverse)
+        if len(first) < self.run_size:
+            # Everything fits in memory - no spilling needed.
+            yield from first
+            return
+        runs = [self._write_run(first)]
+        spilled = list(runs)
+        del first
+        try:
+            while True:
+                run = sorted(islice(values, self.run_size), key=self.key, reverse=self.reverse)
+                if not run:
+                    break
+                runs.append(self._write_run(run))
+                spilled.append(runs[-1])
+            # Multi-pass merge of consecutive groups (keeps the sort stable),
+            # until all the runs can be merged at once.
+            while len(runs) > self.max_fanout:
+                merged_runs = []
+                for start in range(0, len(runs), self.max_fanout):
+                    group = runs[start:start + self.max_fanout]
+                    merged = merge_sorted(*map(self._read_run, group), key=self.key,
+                                          reverse=self.reverse)
+                    merged_runs.append(self._write_run(merged))
+                    spilled.append(merged_runs[-1])
+                    for run in group:
+                        run.close()
+                runs = merged_runs
+            yield from merge_sorted(*map(self._read_run, runs), key=self.key,
+                                    reverse=self.reverse)
+        finally:
+            for run in spilled:
+                run.close()
+
+def external_sort(iterable, key=None, reverse=False, **kwargs):
+    """Lazily sort iterable with an ExternalSorter (see ExternalSorter for kwargs)."""
+    return ExternalSorter(key, reverse, **kwargs).sort(iterable)
@@ -6,16 +6,23 @@
 #     - Basic:
 #         > push, peek(find min/max), pop(extract min/max), replace, pushpop.
 #     - Creation:
-#         > heap, full_heapify, merge.
+#         > heap (binary or d-ary, optional key function), full_heapify, merge.
 #     - Inspection
 #         > size, is_empty, is_full, capacity, height.
 #     - Internal:
 #         > parent, l/rchild, heapify, heapify_down, increase_key, decrease_key
+# # Indexed Heap Implementation
+#   Supports:
+#     - Everything Heap supports, plus stable handles:
+#         > push (returns handle), update, remove, contains, get, peek_item, pop_item.
+# # Top-K Selector Implementation
+#   Supports:
+#     - push (with eviction), extend (threshold pre-filtered), threshold, sorted.
 """
 #################################################
 # ###  Author: Samyuel Danyo
 # ###  Date: 08/06/2020
-# ###  Last Edit: 11/07/2020
+# ###  Last Edit: 18/10/2026
 ##################################################
 # ## imports
 # Python Standard Library
@@ -24,15 +31,28 @@ import operator
 # Implementation
 ##################################################
 class Heap:
-    """Binary Heap implementation.
+    """Binary (or d-ary) Heap implementation.
        Heap is partial order tree-based data structure, which is
        the maximally efficient implementation of a priority queue.
+       A d-ary heap (arity=d) is shallower - log_d(n) levels, so pushes
+       (sift up) get cheaper, while pops (sift down) compare d children per level.
+       In CPython, pops stay cheapest on the binary heap even so: a d-ary heap
+       (arity=8 measures best) pays off only on push-heavy workloads, above
+       roughly 6-50 pushes per pop (see bench_heap.py).
+       With key=func, every element's key is computed once (on push/heapify)
+       and cached in self.keys, parallel to self.data. Only the cached keys
+       are compared, and equal keys are popped in insertion order (FIFO).
        Complexity: Heapify | Find Max | Extract Max | Increase Key
                      O(n)  |   O(1)   |   O(log(n)) |   O(log(n))
                    -----------------------------------------------
                     Insert   |   Delete   | Merge
                    O(log(n)) |  O(log(n)) | O(m+n) """
-    def __init__(self, data=None, htype="min", cap=float("inf")):
+    def __init__(self, data=None, htype="min", cap=float("inf"), arity=2, key=None):
+        # resolve the heap's arity (number of children per node).
+        if not isinstance(arity, int) or arity < 2:
+            print("WARNING: Heap Arity NOT Supported. Binary Heap Created!")
+            arity = 2
+        self.arity = arity
         # resolve the heap's type (min/max).
         self.type = htype
         if self.type == "min":
@@ -42,15 +62,29 @@ class Heap:
         else:
             print("WARNING: Heap Type NOT Supported. MinHeap Created!")
             self.type = "min"
-            self.opr = operator.lt
+            self.opr = operator.gt
         # Create and order the heap.
         if data is None:
-            self.num_els = 0
-            self.data = []
+            data = []
+        self.data = data
+        self.num_els = len(data)
+        # Without a key function the elements are their own keys (self.keys is self.data).
+        # With one, keys are cached and ties are broken by insertion order (self._seq).
+        self.key = key
+        if key is None:
+            self.keys = self.data
+            self._seq = None
         else:
-            self.data = data
-            self.num_els = len(data)
-            self.full_heapify()
+            self.keys = [key(value) for value in data]
+            self._seq = list(range(self.num_els))
+        self._counter = self.num_els
+        # Heaps without a key take the dedicated binary / d-ary sift loops; with the
+        # base _swap (no position map to keep), those move a "hole" instead of swapping.
+        self._binary = arity == 2 and key is None
+        self._dary = arity > 2 and key is None
+        self._best = min if self.type == "min" else max
+        self._plain_swap = type(self)._swap is Heap._swap
+        self.full_heapify()
         self.cap = cap
 
     def size(self):
@@ -74,40 +108,210 @@ class Heap:
 
     def _parent(self, idx):
         """Get the parent element's index of idx
-           (as per binary tree list representation)."""
+           (as per d-ary tree list representation)."""
         if idx == 0:
             return 0
-        return (idx - 1) // 2
+        return (idx - 1) // self.arity
 
     def _lchild(self, idx):
-        """Get the left child element's index of idx
-           (as per binary tree list representation)."""
-        return idx * 2 + 1
+        """Get the left(first) child element's index of idx
+           (as per d-ary tree list representation)."""
+        return idx * self.arity + 1
 
     def _rchild(self, idx):
-        """Get the right child element's index of idx
-           (as per binary tree list representation)."""
-        return idx * 2 + 2
+        """Get the right(last) child element's index of idx
+           (as per d-ary tree list representation)."""
+        return idx * self.arity + self.arity
 
-    def __swap(self, idx1, idx2):
-        """Swap elements and idx1 & idx2."""
+    def _swap(self, idx1, idx2):
+        """Swap elements at idx1 & idx2."""
         self.data[idx1], self.data[idx2] = self.data[idx2], self.data[idx1]
+        if self._seq is not None:
+            keys, seq = self.keys, self._seq
+            keys[idx1], keys[idx2] = keys[idx2], keys[idx1]
+            seq[idx1], seq[idx2] = seq[idx2], seq[idx1]
+
+    def _key_of(self, value):
+        """Utility function to get the (comparison) key of value."""
+        if self.key is None:
+            return value
+        return self.key(value)
+
+    def _next_seq(self):
+        """Utility function to get the next insertion order number."""
+        self._counter += 1
+        return self._counter - 1
+
+    def _append(self, value):
+        """Utility function to add value at the end of the heap array."""
+        self.data.append(value)
+        if self._seq is not None:
+            self.keys.append(self.key(value))
+            self._seq.append(self._next_seq())
+        self.num_els += 1
+
+    def _pop_last(self):
+        """Utility function to remove and return the last element of the heap array."""
+        self.num_els -= 1
+        if self._seq is not None:
+            self.keys.pop()
+            self._seq.pop()
+        return self.data.pop()
+
+    def _assign(self, idx, value, key):
+        """Utility function to set the element at idx to value, with cached key."""
+        self.data[idx] = value
+        if self._seq is not None:
+            self.keys[idx] = key
+
+    def _root_first(self, key):
+        """True if the root would be popped before a new element with key
+           (on equal keys the older root goes first)."""
+        if self.opr(key, self.keys[0]):
+            return True
+        return self._seq is not None and not self.opr(self.keys[0], key)
 
     def heapify(self, idx):
         """Set partial order to (balance) the tree with root at idx.
-           Heapify up from idx to len(heap)."""
-        left = self._lchild(idx)
-        if left >= self.size():
+           Heapify up from idx to len(heap), iterative (sift down) implementation."""
+        if self._binary:
+            self._sift_down_binary(idx)
+            return
+        if self._dary:
+            self._sift_down_dary(idx)
+            return
+        keys = self.keys
+        seq = self._seq
+        opr = self.opr
+        size = self.size()
+        while True:
+            left = self._lchild(idx)
+            if left >= size:
+                return
+            right = min(self._rchild(idx), size - 1)
+            tar_idx = idx
+            for child in range(left, right + 1):
+                # Child goes first on a better key, or an equal key pushed earlier.
+                if opr(keys[tar_idx], keys[child]) or (
+                        seq is not None and not opr(keys[child], keys[tar_idx])
+                        and seq[tar_idx] > seq[child]):
+                    tar_idx = child
+            if tar_idx == idx:
+                return
+            self._swap(idx, tar_idx)
+            idx = tar_idx
+
+    def _sift_down_binary(self, idx):
+        """Utility function for heapify on a binary heap without a key (fast path)."""
+        data = self.data
+        opr = self.opr
+        size = self.num_els
+        if self._plain_swap:
+            value = data[idx]
+            left = 2 * idx + 1
+            while left < size:
+                child = left
+                if left + 1 < size and opr(data[left], data[left + 1]):
+                    child = left + 1
+                if not opr(value, data[child]):
+                    break
+                data[idx] = data[child]
+                idx = child
+                left = 2 * idx + 1
+            data[idx] = value
+            return
+        left = 2 * idx + 1
+        while left < size:
+            child = left
+            if left + 1 < size and opr(data[left], data[left + 1]):
+                child = left + 1
+            if not opr(data[idx], data[child]):
+                return
+            self._swap(idx, child)
+            idx = child
+            left = 2 * idx + 1
+
+    def _sift_up_binary(self, idx):
+        """Utility function for heapify_down on a binary heap without a key (fast path)."""
+        data = self.data
+        opr = self.opr
+        if self._plain_swap:
+            value = data[idx]
+            while idx > 0:
+                parent = (idx - 1) >> 1
+                if not opr(data[parent], value):
+                    break
+                data[idx] = data[parent]
+                idx = parent
+            data[idx] = value
+            return
+        while idx > 0:
+            parent = (idx - 1) >> 1
+            if not opr(data[parent], data[idx]):
+                return
+            self._swap(idx, parent)
+            idx = parent
+
+    def _sift_down_dary(self, idx):
+        """Utility function for heapify on a d-ary heap without a key (fast path).
+           The best child of a level is found in C (min/max over the children's slice).
+           With the base _swap, the hole goes straight down to a leaf and the value
+           is sifted back up from there (as heapq does), which skips comparing it
+           with the best child on every level."""
+        data = self.data
+        opr = self.opr
+        best = self._best
+        arity = self.arity
+        size = self.num_els
+        first = idx * arity + 1
+        if self._plain_swap:
+            start = idx
+            value = data[idx]
+            while first < size:
+                children = data[first:first + arity]
+                child_value = best(children)
+                data[idx] = child_value
+                idx = first + children.index(child_value)
+                first = idx * arity + 1
+            while idx > start:
+                parent = (idx - 1) // arity
+                if not opr(data[parent], value):
+                    break
+                data[idx] = data[parent]
+                idx = parent
+            data[idx] = value
+            return
+        while first < size:
+            children = data[first:first + arity]
+            child_value = best(children)
+            if not opr(data[idx], child_value):
+                return
+            child = first + children.index(child_value)
+            self._swap(idx, child)
+            idx = child
+            first = idx * arity + 1
+
+    def _sift_up_dary(self, idx):
+        """Utility function for heapify_down on a d-ary heap without a key (fast path)."""
+        data = self.data
+        opr = self.opr
+        arity = self.arity
+        if self._plain_swap:
+            value = data[idx]
+            while idx > 0:
+                parent = (idx - 1) // arity
+                if not opr(data[parent], value):
+                    break
+                data[idx] = data[parent]
+                idx = parent
+            data[idx] = value
             return
-        right = self._rchild(idx)
-        tar_idx = idx
-        if self.opr(self.data[tar_idx], self.data[left]):
-            tar_idx = left
-        if right < self.size() and self.opr(self.data[tar_idx], self.data[right]):
-            tar_idx = right
-        if tar_idx != idx:
-            self.__swap(idx, tar_idx)
-            self.heapify(tar_idx)
+        while idx > 0:
+            parent = (idx - 1) // arity
+            if not opr(data[parent], data[idx]):
+                return
+            self._swap(idx, parent)
+            idx = parent
 
     def full_heapify(self):
         """Convert the binary tree (self.data) into a Heap data structure."""
@@ -118,20 +322,33 @@ class Heap:
 
     def heapify_down(self, idx):
         """Set partial order to (balance) the tree with leaf at idx.
-           Heapify down from idx to heap[0]."""
-        parent = self._parent(idx)
-        if self.opr(self.data[parent], self.data[idx]):
-            self.__swap(idx, parent)
-            self.heapify_down(parent)
+           Heapify down from idx to heap[0], iterative (sift up) implementation."""
+        if self._binary:
+            self._sift_up_binary(idx)
+            return
+        if self._dary:
+            self._sift_up_dary(idx)
+            return
+        keys = self.keys
+        seq = self._seq
+        opr = self.opr
+        while idx > 0:
+            parent = self._parent(idx)
+            # Stop unless idx goes first (better key, or equal key pushed earlier).
+            if not (opr(keys[parent], keys[idx]) or (
+                    seq is not None and not opr(keys[idx], keys[parent])
+                    and seq[parent] > seq[idx])):
+                return
+            self._swap(idx, parent)
+            idx = parent
 
     def push(self, value):
         """Add a value to the heap."""
         if self.is_full():
             print("WARNING: Heap Overflow!")
             return None
-        self.data.insert(0, value)
-        self.num_els += 1
-        self.heapify(0)
+        self._append(value)
+        self.heapify_down(self.size() - 1)
         return True
 
     def peek(self):
@@ -148,13 +365,10 @@ class Heap:
         if self.is_empty():
             print("WARNING: Heap Underflow!")
             return None
-        lastvalue = self.data.pop()
-        self.num_els -= 1
-        if self.is_empty():
-            return lastvalue
-        value = self.data[0]
-        self.data[0] = lastvalue
-        self.heapify(0)
+        self._swap(0, self.size() - 1)
+        value = self._pop_last()
+        if not self.is_empty():
+            self.heapify(0)
         return value
 
     def replace(self, value):
@@ -162,34 +376,47 @@ class Heap:
            pop followed by push, since only need to balance once."""
         if self.is_empty():
             print("WARNING: Heap Underflow!. Will Push New Value!")
-            self.num_els += 1
-            rvalue = None
-        else:
-            rvalue = self.data.pop(0)
-        self.data.insert(0, value)
+            self._append(value)
+            return None
+        return self._replace_root(value, self._key_of(value))
+
+    def _replace_root(self, value, key):
+        """Utility function to put value(key) at the root as a newly pushed
+           element and rebalance. Returns the old root."""
+        rvalue = self.data[0]
+        self._assign(0, value, key)
+        if self._seq is not None:
+            self._seq[0] = self._next_seq()
         self.heapify(0)
         return rvalue
 
     def pushpop(self, value):
         """Push a new key and pop root(reverse of repalce). More efficient than
            push followed by pop, since only need to balance once."""
-        if self.size() and self.opr(value, self.data[0]):
-            value, self.data[0] = self.data[0], value
-            self.heapify(0)
+        if not self.size():
+            return value
+        key = self._key_of(value)
+        if self._root_first(key):
+            return self._replace_root(value, key)
         return value
 
     def merge(self, heap):
         """Union: joining two heaps to form a valid new heap containing all
            the elements of both, preserving the original heaps."""
-        self.num_els += len(heap)
-        self.data.extend(heap)
+        if self._seq is None:
+            self.num_els += len(heap)
+            self.data.extend(heap)
+        else:
+            for value in heap:
+                self._append(value)
         self.full_heapify()
 
     def decrease_key(self, idx, value):
         """Update key at idx with value, where value < key."""
-        if self.data[idx] <= value:
+        key = self._key_of(value)
+        if self.keys[idx] <= key:
             return
-        self.data[idx] = value
+        self._assign(idx, value, key)
         if self.type == "min" and idx > 0:
             self.heapify_down(idx)
         if self.type == "max":
@@ -197,10 +424,225 @@ class Heap:
 
     def increase_key(self, idx, value):
         """Update key at idx with value, where value > key."""
-        if self.data[idx] >= value:
+        key = self._key_of(value)
+        if self.keys[idx] >= key:
             return
-        self.data[idx] = value
+        self._assign(idx, value, key)
         if self.type == "max" and idx > 0:
             self.heapify_down(idx)
         if self.type == "min":
             self.heapify(idx)
+
+##################################################
+# Indexed Heap Implementation
+##################################################
+class IndexedHeap(Heap):
+    """Indexed(addressable) Binary Heap implementation.
+       Every element is tagged with a stable handle, returned by push.
+       A position map (handle -> index) is maintained through every swap,
+       so an element can be found, updated or removed without a scan.
+       Complexity: Push/Pop | Update | Remove | Contains
+                   O(log(n)) |O(log(n))|O(log(n))|  O(1) """
+    def __init__(self, data=None, htype="min", cap=float("inf"), arity=2, key=None):
+        data = [] if data is None else list(data)
+        # Handles are auto-assigned integers unless the caller provides one.
+        self._handles = list(range(len(data)))
+        self._pos = {handle: handle for handle in self._handles}
+        self._next_handle = len(data)
+        super().__init__(data, htype, cap, arity, key)
+
+    def _swap(self, idx1, idx2):
+        """Swap elements at idx1 & idx2 and keep the position map in sync."""
+        super()._swap(idx1, idx2)
+        handles = self._handles
+        handles[idx1], handles[idx2] = handles[idx2], handles[idx1]
+        self._pos[handles[idx1]] = idx1
+        self._pos[handles[idx2]] = idx2
+
+    def _pop_last(self):
+        """Utility function to remove and return the last element of the heap array."""
+        del self._pos[self._handles.pop()]
+        return super()._pop_last()
+
+    def _auto_handle(self):
+        """Utility function to get the next auto-assigned handle,
+           skipping any the caller already took."""
+        while self._next_handle in self._pos:
+            self._next_handle += 1
+        handle = self._next_handle
+        self._next_handle += 1
+        return handle
+
+    def _new_handle(self, handle):
+        """Utility function to resolve the handle of a new element."""
+        if handle is None:
+            handle = self._auto_handle()
+        self._pos[handle] = self.size()
+        self._handles.append(handle)
+        return handle
+
+    def contains(self, handle):
+        """Check if the element with handle is in the heap."""
+        return handle in self._pos
+
+    def get(self, handle):
+        """Get the value of the element with handle."""
+        if not self.contains(handle):
+            print("WARNING: Handle NOT in Heap!")
+            return None
+        return self.data[self._pos[handle]]
+
+    def push(self, value, handle=None):
+        """Add a value to the heap.
+           If handle is given and already in the heap, its value is updated instead.
+           Returns:
+               handle: The stable handle of the element."""
+        if handle is not None and self.contains(handle):
+            self.update(handle, value)
+            return handle
+        if self.is_full():
+            print("WARNING: Heap Overflow!")
+            return None
+        handle = self._new_handle(handle)
+        self._append(value)
+        self.heapify_down(self.size() - 1)
+        return handle
+
+    def peek_item(self):
+        """Get the (handle, value) of the root element."""
+        if self.is_empty():
+            print("WARNING: Heap Underflow!")
+            return None
+        return self._handles[0], self.data[0]
+
+    def pop_item(self):
+        """Get the (handle, value) of the root element and remove it from the heap."""
+        if self.is_empty():
+            print("WARNING: Heap Underflow!")
+            return None
+        handle = self._handles[0]
+        return handle, self.pop()
+
+    def replace(self, value, handle=None):
+        """Pop root and push a new key(poppush), balancing only once.
+           The new element gets a new handle, unless one is given
+           (a handle of another element in the heap is an error)."""
+        if self.is_empty():
+            print("WARNING: Heap Underflow!. Will Push New Value!")
+            self.push(value, handle)
+            return None
+        if handle is not None and handle != self._handles[0] and self.contains(handle):
+            print("ERROR: Handle already in Heap! Use update.")
+            return None
+        del self._pos[self._handles[0]]
+        if handle is None:
+            handle = self._auto_handle()
+        self._handles[0] = handle
+        self._pos[handle] = 0
+        return super().replace(value)
+
+    def pushpop(self, value, handle=None):
+        """Push a new key and pop root(reverse of replace), balancing only once.
+           If value would be popped straight away, the heap is left untouched."""
+        if self.size() and self._root_first(self._key_of(value)):
+            return self.replace(value, handle)
+        return value
+
+    def merge(self, heap):
+        """Union: add all the elements of heap (an iterable of values).
+           Returns:
+               handles (list): The handles of the new elements, in order."""
+        handles = []
+        for value in heap:
+            handles.append(self._new_handle(None))
+            self._append(value)
+        self.full_heapify()
+        return handles
+
+    def update(self, handle, value):
+        """Set the value of the element with handle, moving it up or down as needed."""
+        if not self.contains(handle):
+            print("WARNING: Handle NOT in Heap!")
+            return None
+        idx = self._pos[handle]
+        self._assign(idx, value, self._key_of(value))
+        self.heapify_down(idx)
+        self.heapify(idx)
+        return True
+
+    def remove(self, handle):
+        """Remove the element with handle from the heap.
+           Returns:
+               value: The value of the removed element (None if not found)."""
+        if not self.contains(handle):
+            print("WARNING: Handle NOT in Heap!")
+            return None
+        idx = self._pos[handle]
+        last = self.size() - 1
+        self._swap(idx, last)
+        value = self._pop_last()
+        if idx < last:
+            self.heapify_down(idx)
+            self.heapify(idx)
+        return value
+
+##################################################
+# Top-K Selector Implementation
+##################################################
+class TopK(Heap):
+    """Bounded Top-K selector over a stream, built on Heap.
+       Keeps the k best items (largest keys for best="max", smallest for best="min")
+       in a heap ordered the opposite way, so the root is the worst kept item -
+       the threshold a new item has to beat. Once full, push has pushpop semantics.
+       Complexity: Push | Extend(m items, r accepted) | Threshold | Sorted
+                 O(log(k)) |   O(m + r*log(k))       |   O(1)    | O(k*log(k))"""
+    def __init__(self, k, key=None, best="max"):
+        if k < 1:
+            print("WARNING: K must be positive. K=1 Selector Created!")
+            k = 1
+        if best not in ("min", "max"):
+            print("WARNING: Best NOT Supported. Max Selector Created!")
+            best = "max"
+        self.best = best
+        super().__init__(None, "min" if best == "max" else "max", cap=k, key=key)
+
+    def threshold(self):
+        """Get the key an item has to beat to enter the selector (None until full)."""
+        if not self.is_full():
+            return None
+        return self.keys[0]
+
+    def push(self, value):
+        """Offer value to the selector. Once full, value replaces the worst kept
+           item only if it is strictly better.
+           Returns:
+               evicted: The item dropped from (or not admitted to) the selector,
+                        None if nothing was dropped."""
+        if not self.is_full():
+            super().push(value)
+            return None
+        key = self._key_of(value)
+        if self.opr(key, self.keys[0]):
+            return self._replace_root(value, key)
+        return value
+
+    def extend(self, values):
+        """Offer a batch of values. Once full, every value is checked against the
+           current threshold first, and only the ones beating it touch the heap."""
+        values = iter(values)
+        while not self.is_full():
+            value = next(values, self)
+            if value is self:
+                return
+            super().push(value)
+        opr = self.opr
+        keys = self.keys
+        key_of = self.key
+        for value in values:
+            key = value if key_of is None else key_of(value)
+            if opr(key, keys[0]):
+                self._replace_root(value, key)
+
+    def sorted(self):
+        """Get the kept items, best first (sorted on demand, the heap is unchanged)."""
+        return sorted(self.data, key=self.key, reverse=self.best == "max")
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+#################################################
+""" meldable_heap.py
+# # Meldable Heap Implementations (Pairing, Leftist, Skew)
+#   Pointer-based heaps with the same surface as heap.Heap,
+#   which merge(meld) two heaps without copying their elements.
+#   Supports:
+#     - Basic:
+#         > push, peek(find min/max), pop(extract min/max), replace, pushpop.
+#     - Creation:
+#         > heap, merge(meld).
+#     - Inspection
+#         > size, is_empty, is_full, capacity.
+#     - Internal:
+#         > meld, pop_root
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import operator
+from abc import ABC, abstractmethod
+##################################################
+# Nodes
+##################################################
+class PairingNode:
+    """Node for a Pairing Heap (left-child, right-sibling representation)."""
+    __slots__ = ("value", "child", "sibling")
+
+    def __init__(self, value):
+        self.value = value
+        self.child = None
+        self.sibling = None
+
+class SkewNode:
+    """Node for a Skew Heap."""
+    __slots__ = ("value", "left", "right")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+
+class LeftistNode(SkewNode):
+    """Node for a Leftist Heap, rank is the null path length(npl)."""
+    __slots__ = ("rank",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.rank = 1
+
+##################################################
+# Base Implementation
+##################################################
+class MeldableHeap(ABC):
+    """Base for pointer-based heaps, which are built around a single meld operation.
+       Subclasses implement _new_node, _meld(root1, root2) and _pop_root(),
+       and list the node attributes pointing to other nodes in _links."""
+    _links = ()
+
+    def __init__(self, data=None, htype="min", cap=float("inf")):
+        # resolve the heap's type (min/max).
+        self.type = htype
+        if self.type == "min":
+            self.opr = operator.gt
+        elif self.type == "max":
+            self.opr = operator.lt
+        else:
+            print("WARNING: Heap Type NOT Supported. MinHeap Created!")
+            self.type = "min"
+            self.opr = operator.gt
+        self.root = None
+        self.num_els = 0
+        self.cap = cap
+        if data is not None:
+            for value in data:
+                self.push(value)
+
+    def size(self):
+        """Get the number of elements in the heap."""
+        return self.num_els
+
+    def __str__(self):
+        return str(self._values())
+
+    def is_empty(self):
+        """True if the heap is empty."""
+        return self.size() <= 0
+
+    def capacity(self):
+        """Get the heap's capacity."""
+        return self.cap
+
+    def is_full(self):
+        """True if the heap is full."""
+        return self.size() == self.cap
+
+    @abstractmethod
+    def _new_node(self, value):
+        """Utility function to create a single-element heap node."""
+
+    @abstractmethod
+    def _meld(self, root1, root2):
+        """Utility function to meld the heaps rooted at root1 & root2.
+           Returns the root of the new heap."""
+
+    @abstractmethod
+    def _pop_root(self):
+        """Utility function to replace self.root with the meld of its subtrees."""
+
+    def _values(self):
+        """Utility function to get all values (pre-order, iterative)."""
+        values = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            for link in self._links:
+                sub = getattr(node, link)
+                if sub is not None:
+                    stack.append(sub)
+        return values
+
+    def push(self, value):
+        """Add a value to the heap."""
+        if self.is_full():
+            print("WARNING: Heap Overflow!")
+            return None
+        self.root = self._meld(self.root, self._new_node(value))
+        self.num_els += 1
+        return True
+
+    def peek(self):
+        """Find a maximum item of a max-heap,
+           or a minimum item of a min-heap, respectively."""
+        if self.is_empty():
+            print("WARNING: Heap Underflow!")
+            return None
+        return self.root.value
+
+    def pop(self):
+        """Get the maximum value from a max heap
+           [or minimum value from a min heap] and removing it from the heap."""
+        if self.is_empty():
+            print("WARNING: Heap Underflow!")
+            return None
+        value = self.root.value
+        self._pop_root()
+        self.num_els -= 1
+        return value
+
+    def replace(self, value):
+        """Pop root and push a new key(poppush)."""
+        if self.is_empty():
+            print("WARNING: Heap Underflow!. Will Push New Value!")
+            self.push(value)
+            return None
+        rvalue = self.root.value
+        self._pop_root()
+        self.root = self._meld(self.root, self._new_node(value))
+        return rvalue
+
+    def pushpop(self, value):
+        """Push a new key and pop root(reverse of replace).
+           If value would be popped straight away, the heap is left untouched."""
+        if self.size() and self.opr(value, self.root.value):
+            return self.replace(value)
+        return value
+
+    def merge(self, heap):
+        """Union: meld heap into this heap.
+           A heap of the same kind and type is melded without copying
+           and is left empty. Any other iterable is pushed value by value.
+           Nothing is merged if the result would exceed the heap's capacity.
+           Returns:
+               feedback (Boolean): True if merged, None on overflow (or self merge)."""
+        if heap is self:
+            print("ERROR: Cannot merge a heap into itself!")
+            return None
+        if not isinstance(heap, MeldableHeap):
+            heap = list(heap)
+        other_size = heap.size() if isinstance(heap, MeldableHeap) else len(heap)
+        if self.size() + other_size > self.cap:
+            print("WARNING: Heap Overflow!")
+            return None
+        if isinstance(heap, MeldableHeap):
+            if isinstance(heap, type(self)) and heap.type == self.type:
+                self.root = self._meld(self.root, heap.root)
+                self.num_els += heap.num_els
+            else:
+                for value in heap._values():
+                    self.root = self._meld(self.root, self._new_node(value))
+                    self.num_els += 1
+            heap.root = None
+            heap.num_els = 0
+            return True
+        for value in heap:
+            self.root = self._meld(self.root, self._new_node(value))
+            self.num_els += 1
+        return True
+
+##################################################
+# Pairing Heap Implementation
+##################################################
+class PairingHeap(MeldableHeap):
+    """Pairing Heap implementation.
+       A multiway tree, where meld just links the worse root under the better one.
+       Complexity: Find Max | Extract Max | Insert | Merge
+                     O(1)   | O(log(n))*  |  O(1)  | O(1)    (*amortized)"""
+    _links = ("child", "sibling")
+
+    def _new_node(self, value):
+        """Utility function to create a single-element heap node."""
+        return PairingNode(value)
+
+    def _meld(self, root1, root2):
+        """Utility function to meld the heaps rooted at root1 & root2."""
+        if root1 is None:
+            return root2
+        if root2 is None:
+            return root1
+        if self.opr(root1.value, root2.value):
+            root1, root2 = root2, root1
+        root2.sibling = root1.child
+        root1.child = root2
+        return root1
+
+    def _pop_root(self):
+        """Utility function to replace self.root with the two-pass meld of its children."""
+        # First pass: meld children in pairs, left to right.
+        pairs = []
+        node = self.root.child
+        while node is not None:
+            first = node
+            second = node.sibling
+            node = second.sibling if second is not None else None
+            first.sibling = None
+            if second is not None:
+                second.sibling = None
+            pairs.append(self._meld(first, second))
+        # Second pass: meld the pairs, right to left.
+        root = None
+        while pairs:
+            root = self._meld(pairs.pop(), root)
+        self.root = root
+
+##################################################
+# Skew Heap Implementation
+##################################################
+class SkewHeap(MeldableHeap):
+    """Skew Heap implementation (self-adjusting leftist heap).
+       Meld walks the right spines and swaps the children of every node on the path.
+       Complexity: Find Max | Extract Max | Insert | Merge
+                     O(1)   | O(log(n))*  |O(log(n))*|O(log(n))*   (*amortized)"""
+    _links = ("left", "right")
+
+    def _new_node(self, value):
+        """Utility function to create a single-element heap node."""
+        return SkewNode(value)
+
+    def _merge_spines(self, root1, root2):
+        """Utility function to merge the right spines of root1 & root2, iterative.
+           Returns (root, path), where path lists the nodes on the merged right spine."""
+        if self.opr(root1.value, root2.value):
+            root1, root2 = root2, root1
+        path = []
+        node = root1
+        while True:
+            path.append(node)
+            if node.right is None:
+                node.right = root2
+                break
+            if self.opr(node.right.value, root2.value):
+                node.right, root2 = root2, node.right
+            node = node.right
+        return root1, path
+
+    def _meld(self, root1, root2):
+        """Utility function to meld the heaps rooted at root1 & root2."""
+        if root1 is None:
+            return root2
+        if root2 is None:
+            return root1
+        root, path = self._merge_spines(root1, root2)
+        for node in path:
+            node.left, node.right = node.right, node.left
+        return root
+
+    def _pop_root(self):
+        """Utility function to replace self.root with the meld of its subtrees."""
+        self.root = self._meld(self.root.left, self.root.right)
+
+##################################################
+# Leftist Heap Implementation
+##################################################
+class LeftistHeap(SkewHeap):
+    """Leftist Heap implementation.
+       Every node's left subtree has the longer null path, so the right spine,
+       which meld walks, is at most log(n+1) long.
+       Complexity: Find Max | Extract Max | Insert | Merge
+                     O(1)   | O(log(n))   |O(log(n))|O(log(n))"""
+    def _new_node(self, value):
+        """Utility function to create a single-element heap node."""
+        return LeftistNode(value)
+
+    def _meld(self, root1, root2):
+        """Utility function to meld the heaps rooted at root1 & root2."""
+        if root1 is None:
+            return root2
+        if root2 is None:
+            return root1
+        root, path = self._merge_spines(root1, root2)
+        # Restore the leftist property bottom-up along the merged spine.
+        for node in reversed(path):
+            lrank = node.left.rank if node.left is not None else 0
+            rrank = node.right.rank if node.right is not None else 0
+            if lrank < rrank:
+                node.left, node.right = node.right, node.left
+                lrank, rrank = rrank, lrank
+            node.rank = rrank + 1
+        return root
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+#################################################
+""" numeric_heap.py
+# # Numeric Heap Implementation
+#   Heap of ints/floats stored unboxed in a typed array.array,
+#   with bulk creation and batched push/pop.
+#   Supports:
+#     - Everything Heap supports (no key function), plus:
+#         > from_array, push_many, pop_many.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from array import array
+from math import log2
+
+# Local Application/Library Specific Imports.
+from heap import Heap
+##################################################
+# Implementation
+##################################################
+class NumericHeap(Heap):
+    """Numeric (d-ary) Heap implementation, backed by array.array.
+       Values are stored as raw C numbers (typecode "d" - float64, "q" - int64, ...),
+       8 bytes per element instead of a pointer plus a boxed Python object.
+       Bulk builds (from_array, large push_many batches) and large pop_many batches
+       sort the array in C - a sorted array is a valid heap of any arity - which beats
+       heapifying element by element in Python despite O(n*log(n)). The sort goes
+       through a temporary list of boxed values (O(n) extra memory while it runs).
+       Trade-off: every single push/pop boxes or unboxes the values it touches,
+       so one by one operations are slower than Heap (see bench_numeric_heap.py);
+       the wins are memory and the bulk operations.
+       Complexity: From Array  | Push Many(k) - small / large k   | Pop Many(k) - small / large k
+                   O(n*log(n)) |  O(k*log(n)) / O((n+k)*log(n+k)) |  O(k*log(n)) / O(n*log(n))"""
+    def __init__(self, data=None, htype="min", cap=float("inf"), arity=2, typecode="d"):
+        self.typecode = typecode
+        super().__init__(array(typecode, data if data is not None else ()),
+                         htype, cap, arity)
+
+    def __str__(self):
+        return str(self.data.tolist())
+
+    @classmethod
+    def from_array(cls, values, htype="min", cap=float("inf"), arity=2, typecode="d"):
+        """Create a heap from values in bulk. Buffers of the same format
+           (array.array, numpy arrays, memoryviews) are copied as raw bytes."""
+        hp = cls(None, htype, cap, arity, typecode)
+        try:
+            view = memoryview(values)
+        except TypeError:
+            view = None
+        if view is not None and view.format == typecode and view.c_contiguous:
+            hp.data.frombytes(view.cast("B"))
+        else:
+            hp.data.extend(array(typecode, values))
+        hp.num_els = len(hp.data)
+        hp._sort()
+        return hp
+
+    def _sort(self):
+        """Utility function to order the whole array in one bulk (C level) sort
+           (through a temporary list of boxed values)."""
+        self.data[:] = array(self.typecode, sorted(self.data, reverse=self.type == "max"))
+
+    def push_many(self, values):
+        """Add a batch of values to the heap. Large batches (compared to the heap)
+           are appended in bulk and the heap is rebuilt once (sorted)."""
+        values = array(self.typecode, values)
+        free = self.capacity() - self.size()
+        if len(values) > free:
+            print("WARNING: Heap Overflow!")
+            values = values[:int(free)]
+        if len(values) > self.size():
+            self.data.extend(values)
+            self.num_els = len(self.data)
+            self._sort()
+        else:
+            for value in values:
+                self._append(value)
+                self.heapify_down(self.size() - 1)
+        return len(values)
+
+    def pop_many(self, num):
+        """Pop (up to) num values from the heap, in heap order.
+           Large batches sort the array once - a sorted array is a valid heap,
+           so the remaining values need no rebalancing.
+           Returns:
+               values (array.array): The popped values."""
+        num = min(num, self.size())
+        if num <= 0:
+            return array(self.typecode)
+        if num * log2(self.size() + 1) >= self.size():
+            self._sort()
+            values = self.data[:num]
+            del self.data[:num]
+            self.num_els -= num
+            return values
+        values = array(self.typecode)
+        for _ in range(num):
+            values.append(self.pop())
+        return values
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#################################################
+""" running_median.py
+# # Streaming Median / Quantile Implementation (two Heaps)
+#   Supports:
+#     - RunningQuantile: insert, remove (lazy deletion), quantile, sliding window.
+#     - RunningMedian: running (windowed) median.
+#     - QuantileTracker: several percentiles (e.g. p50/p90/p99) of one stream.
+#     - Inspection
+#         > size, is_empty.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from collections import deque
+
+# Local Application/Library Specific Imports.
+from heap import Heap
+##################################################
+# Running Quantile Implementation
+##################################################
+class RunningQuantile:
+    """Running q-quantile over a stream, built from two Heaps.
+       The max-heap <lower> holds the floor(q*(n-1))+1 smallest values and the
+       min-heap <upper> the rest, so the quantile is the top of <lower>.
+       Removed values are deleted lazily: they are counted in <_delayed> and
+       dropped only once they reach the top of a heap.
+       With window=N, only the last N inserted values are kept; an explicit
+       remove must then also find the value in the window (a deque), O(N).
+       Complexity: Insert | Remove (no window / window=N) | Quantile
+                 O(log(n)) |   O(log(n))* / O(N + log(n))*  | O(1)   (*amortized)"""
+    def __init__(self, q=0.5, window=None):
+        if not 0 <= q <= 1:
+            print("WARNING: Quantile NOT in [0, 1]. Median Tracked!")
+            q = 0.5
+        self.q = q
+        self.window = window
+        self._values = deque() if window is not None else None
+        self._lower = Heap(htype="max")
+        self._upper = Heap(htype="min")
+        # Number of valid (not deleted) values in each heap.
+        self._lower_size = 0
+        self._upper_size = 0
+        self._delayed = {}
+
+    def size(self):
+        """Get the number of values tracked."""
+        return self._lower_size + self._upper_size
+
+    def is_empty(self):
+        """True if no values are tracked."""
+        return self.size() <= 0
+
+    def _prune(self, heap):
+        """Utility function to pop lazily deleted values off the top of heap."""
+        delayed = self._delayed
+        while not heap.is_empty() and heap.data[0] in delayed:
+            value = heap.pop()
+            delayed[value] -= 1
+            if not delayed[value]:
+                del delayed[value]
+
+    def _rebalance(self):
+        """Utility function to move tops between heaps, until <lower> has the target size."""
+        size = self.size()
+        target = int(self.q * (size - 1)) + 1 if size else 0
+        while self._lower_size > target:
+            self._upper.push(self._lower.pop())
+            self._lower_size -= 1
+            self._upper_size += 1
+            self._prune(self._lower)
+        while self._lower_size < target:
+            self._lower.push(self._upper.pop())
+            self._lower_size += 1
+            self._upper_size -= 1
+            self._prune(self._upper)
+
+    def insert(self, value):
+        """Add value to the stream (evicting the oldest value if the window is full)."""
+        if self._lower_size and value > self._lower.data[0]:
+            self._upper.push(value)
+            self._upper_size += 1
+        else:
+            self._lower.push(value)
+            self._lower_size += 1
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > self.window:
+                self._remove(self._values.popleft())
+        self._rebalance()
+
+    def remove(self, value):
+        """Remove (one occurrence of) value, which must have been inserted.
+           With a window, the value is searched for in it first: O(window).
+           Returns:
+               feedback (Boolean): True, None if a window is kept and value is not in it."""
+        if self._values is not None:
+            try:
+                self._values.remove(value)
+            except ValueError:
+                print("WARNING: Value NOT in Window!")
+                return None
+        self._remove(value)
+        self._rebalance()
+        return True
+
+    def _remove(self, value):
+        """Utility function to lazily delete value from the heap holding it."""
+        self._delayed[value] = self._delayed.get(value, 0) + 1
+        if self._lower_size and value <= self._lower.data[0]:
+            self._lower_size -= 1
+            self._prune(self._lower)
+        else:
+            self._upper_size -= 1
+            self._prune(self._upper)
+
+    def quantile(self):
+        """Get the current q-quantile (lower nearest rank)."""
+        if self.is_empty():
+            print("WARNING: No Values!")
+            return None
+        return self._lower.data[0]
+
+##################################################
+# Running Median Implementation
+##################################################
+class RunningMedian(RunningQuantile):
+    """Running median over a stream (mean of the two middle values for an even count)."""
+    def __init__(self, window=None):
+        super().__init__(0.5, window)
+
+    def median(self):
+        """Get the current median."""
+        if self.is_empty():
+            print("WARNING: No Values!")
+            return None
+        if self._lower_size > self._upper_size:
+            return self._lower.data[0]
+        return (self._lower.data[0] + self._upper.data[0]) / 2
+
+##################################################
+# Quantile Tracker Implementation
+##################################################
+class QuantileTracker:
+    """Several running quantiles (e.g. p50/p90/p99) of one stream,
+       one RunningQuantile (pair of Heaps) per quantile.
+       With window=N, the window is shared, so a remove costs O(N) once."""
+    def __init__(self, quantiles=(0.5, 0.9, 0.99), window=None):
+        self._trackers = {q: RunningQuantile(q) for q in quantiles}
+        self.window = window
+        self._values = deque() if window is not None else None
+
+    def size(self):
+        """Get the number of values tracked."""
+        return next(iter(self._trackers.values())).size() if self._trackers else 0
+
+    def is_empty(self):
+        """True if no values are tracked."""
+        return self.size() <= 0
+
+    def insert(self, value):
+        """Add value to the stream (evicting the oldest value if the window is full)."""
+        for tracker in self._trackers.values():
+            tracker.insert(value)
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > self.window:
+                self._remove(self._values.popleft())
+
+    def remove(self, value):
+        """Remove (one occurrence of) value, which must have been inserted.
+           With a window, the value is searched for in it first: O(window).
+           Returns:
+               feedback (Boolean): True, None if a window is kept and value is not in it."""
+        if self._values is not None:
+            try:
+                self._values.remove(value)
+            except ValueError:
+                print("WARNING: Value NOT in Window!")
+                return None
+        self._remove(value)
+        return True
+
+    def _remove(self, value):
+        """Utility function to remove value from every quantile's heaps."""
+        for tracker in self._trackers.values():
+            tracker.remove(value)
+
+    def quantile(self, q):
+        """Get the current q-quantile (q has to be one of the tracked quantiles)."""
+        if q not in self._trackers:
+            print("WARNING: Quantile NOT Tracked!")
+            return None
+        return self._trackers[q].quantile()
+
+    def quantiles(self):
+        """Get all the tracked quantiles, as {q: value}."""
+        return {q: tracker.quantile() for q, tracker in self._trackers.items()}
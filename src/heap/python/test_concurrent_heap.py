@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#################################################
+""" test_concurrent_heap.py
+# # Test for Thread-Safe & Asyncio Priority Queue Implementations
+#   Tests:
+#      - ConcurrentHeap: producers/consumers threads, cap blocking, timeouts, get_many.
+#      - AsyncHeap: async producers/consumers, timeouts, get_many, nowait wake-ups,
+#                   put_threadsafe (rejected on the loop thread).
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+import asyncio
+import threading
+from random import randint
+
+# Local Application/Library Specific Imports.
+import concurrent_heap as ch
+##################################################
+# Test
+##################################################
+print("==== TEST CONCURRENT HEAP IMPLEMENTATION ====")
+QUEUE = ch.ConcurrentHeap(htype="min", cap=8)
+print("Get (empty, timeout=0.01):", QUEUE.get(timeout=0.01))
+print("Get many (empty, non-blocking):", QUEUE.get_many(3, block=False))
+JOBS = [randint(0, 1000) for _ in range(400)]
+RESULTS = []
+RESULTS_LOCK = threading.Lock()
+# Poison pill, popped after every real job from a min-heap.
+STOP = float("inf")
+
+def producer(jobs):
+    """Put jobs one by one (blocks while the queue is full)."""
+    for job in jobs:
+        QUEUE.put(job)
+
+def consumer():
+    """Get jobs in batches until a poison pill arrives (extra pills are put back)."""
+    while True:
+        batch = QUEUE.get_many(4)
+        with RESULTS_LOCK:
+            RESULTS.extend(job for job in batch if job != STOP)
+        if STOP in batch:
+            QUEUE.put_many([STOP] * (batch.count(STOP) - 1))
+            return
+
+PRODUCERS = [threading.Thread(target=producer, args=(JOBS[i::4],)) for i in range(4)]
+CONSUMERS = [threading.Thread(target=consumer) for _ in range(3)]
+for thread in PRODUCERS + CONSUMERS:
+    thread.start()
+for thread in PRODUCERS:
+    thread.join()
+QUEUE.put_many([STOP] * 3)
+for thread in CONSUMERS:
+    thread.join()
+print("Consumed {} jobs, queue size: {}".format(len(RESULTS), QUEUE.size()))
+assert sorted(RESULTS) == sorted(JOBS)
+QUEUE.put_many(range(8))
+print("Put (full, timeout=0.01):", QUEUE.put(100, timeout=0.01))
+print("Peek:", QUEUE.peek(), "| Get many (5):", QUEUE.get_many(5))
+
+print("\n==== TEST ASYNC HEAP IMPLEMENTATION ====")
+async def async_test():
+    """Async producers/consumers sharing one AsyncHeap, plus a producer thread."""
+    queue = ch.AsyncHeap(htype="max", cap=5)
+    print("Get (empty, timeout=0.01):", await queue.get(timeout=0.01))
+    jobs = [randint(0, 1000) for _ in range(100)]
+    results = []
+    stop = float("-inf")
+
+    async def producer(jobs):
+        for job in jobs:
+            await queue.put(job)
+
+    async def consumer():
+        while True:
+            batch = await queue.get_many(3)
+            results.extend(job for job in batch if job != stop)
+            if stop in batch:
+                for _ in range(batch.count(stop) - 1):
+                    await queue.put(stop)
+                return
+
+    consumers = [asyncio.create_task(consumer()) for _ in range(2)]
+    await asyncio.gather(producer(jobs[:50]), producer(jobs[50:80]))
+    thread = threading.Thread(target=lambda: [queue.put_threadsafe(job) for job in jobs[80:]])
+    thread.start()
+    await asyncio.to_thread(thread.join)
+    for _ in consumers:
+        await queue.put(stop)
+    await asyncio.gather(*consumers)
+    print("Consumed {} jobs, queue size: {}".format(len(results), queue.size()))
+    assert sorted(results) == sorted(jobs)
+    for job in range(5):
+        queue.put_nowait(job)
+    print("Put nowait (full):", queue.put_nowait(9))
+    print("Put (full, timeout=0.01):", await queue.put(9, timeout=0.01))
+    print("Get nowait:", queue.get_nowait(), "| Get many (10):", await queue.get_many(10))
+    # A nowait put/get wakes the waiter of the other side synchronously.
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    print("Put nowait for a waiting getter:", queue.put_nowait(42), "| Got:", await getter)
+    assert not queue._getters and queue.is_empty()
+    try:
+        queue.put_threadsafe(1)
+        assert False, "put_threadsafe must not block the loop's thread"
+    except RuntimeError as err:
+        print("Put threadsafe on the loop thread:", err)
+
+asyncio.run(async_test())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+#################################################
+""" test_external_sort.py
+# # Test for External Merge Sort Implementation
+#   Tests:
+#      - merge_sorted: key, reverse, stability, lazy early stop.
+#      - External sort: pickle runs, struct runs, multi-pass merge.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from itertools import count, islice
+from random import randint, random
+
+# Local Application/Library Specific Imports.
+import external_sort as ext
+##################################################
+# Test
+##################################################
+print("==== TEST MERGE SORTED ====")
+STREAMS = [sorted(randint(-50, 50) for _ in range(randint(0, 10))) for _ in range(4)]
+print("Streams:", STREAMS)
+MERGED = list(ext.merge_sorted(*STREAMS))
+print("Merged:", MERGED)
+assert MERGED == sorted(sum(STREAMS, []))
+print("Merged(reverse):", list(ext.merge_sorted(*[s[::-1] for s in STREAMS], reverse=True)))
+PAIRS = list(ext.merge_sorted([(1, 'a'), (2, 'a')], [(1, 'b'), (3, 'b')], [(1, 'c')],
+                              key=lambda pair: pair[0]))
+print("Stable merge on key:", PAIRS)
+assert PAIRS == [(1, 'a'), (1, 'b'), (1, 'c'), (2, 'a'), (3, 'b')]
+print("First 5 of infinite streams:", list(islice(ext.merge_sorted(count(0, 2), count(1, 2)), 5)))
+
+print("\n==== TEST EXTERNAL SORT (pickle runs) ====")
+WORDS = ["w{}".format(randint(0, 10000)) for _ in range(5000)]
+SORTED = list(ext.external_sort(WORDS, key=len, run_size=300, max_fanout=4, chunk_size=64))
+print("Sorted {} words in runs of 300, first: {}".format(len(SORTED), SORTED[:5]))
+assert SORTED == sorted(WORDS, key=len)
+
+print("\n==== TEST EXTERNAL SORT (struct runs) ====")
+FLOATS = [random() for _ in range(5000)]
+SORTED = list(ext.external_sort(FLOATS, reverse=True, run_size=512, record_format="d"))
+print("Sorted {} floats, first: {}".format(len(SORTED), SORTED[:3]))
+assert SORTED == sorted(FLOATS, reverse=True)
+RECORDS = [(randint(0, 100), random()) for _ in range(2000)]
+SORTED = list(ext.external_sort(RECORDS, run_size=100, record_format="qd", max_fanout=3))
+assert SORTED == sorted(RECORDS)
+print("Small input (in memory):", list(ext.external_sort([3, 1, 2], run_size=10)))
@@ -7,11 +7,20 @@
 #      - Push, peek, pop: functionality + API.
 #      - Size, capacity, is_empty.
 #      - Merge, pushpop, replace, increase/decrease_key
+#   Tests d-ary heaps:
+#      - Push, pop with arity 4.
+#   Tests key heaps:
+#      - Cached keys, FIFO order of equal keys.
+#   Tests indexed heap:
+#      - Push (handles), update, remove, contains, pop_item.
+#      - Caller & auto handles never collide; replace rejects a taken handle.
+#   Tests top-k selector:
+#      - Push (eviction), extend, threshold, sorted.
 """
 #################################################
 # ###  Author: Samyuel Danyo
 # ###  Date: 07/06/2020
-# ###  Last Edit: 07/06/2020
+# ###  Last Edit: 18/10/2026
 ##################################################
 # ## imports
 # Python Standard Library
@@ -96,3 +105,77 @@ print(MAX_HEAP)
 print("Decrease key at 0 to 5")
 MAX_HEAP.decrease_key(0, 5)
 print(MAX_HEAP)
+
+print("\n==== TEST 4-ARY MIN HEAP IMPLEMENTATION ====")
+DARY_HEAP = heap.Heap([3, 6, 10, -3, 5], "min", arity=4)
+for _ in range(10):
+    DARY_HEAP.push(randint(-100, 100))
+print(DARY_HEAP)
+POPPED = []
+while not DARY_HEAP.is_empty():
+    POPPED.append(DARY_HEAP.pop())
+print("Pop the heap:", POPPED)
+assert POPPED == sorted(POPPED)
+
+print("\n==== TEST KEY MAX HEAP IMPLEMENTATION ====")
+TASKS = [("build", 2), ("test", 1), ("lint", 2), ("deploy", 3), ("docs", 1)]
+KEY_HEAP = heap.Heap(list(TASKS[:3]), "max", key=lambda task: task[1])
+for task in TASKS[3:]:
+    KEY_HEAP.push(task)
+print(KEY_HEAP, "| Keys:", KEY_HEAP.keys)
+print("PushPop (fmt, 2):", KEY_HEAP.pushpop(("fmt", 2)))
+POPPED = []
+while not KEY_HEAP.is_empty():
+    POPPED.append(KEY_HEAP.pop())
+print("Pop the heap:", POPPED)
+assert POPPED == [("build", 2), ("lint", 2), ("fmt", 2), ("test", 1), ("docs", 1)]
+
+print("\n==== TEST INDEXED HEAP IMPLEMENTATION ====")
+INDEXED_HEAP = heap.IndexedHeap([3, 6, 10, -3, 5], "min")
+print(INDEXED_HEAP)
+HANDLES = {}
+for name in "abcde":
+    val = randint(-100, 100)
+    HANDLES[name] = INDEXED_HEAP.push(val, name)
+    print("Pushing {} -> handle {}".format(val, HANDLES[name]))
+print(INDEXED_HEAP)
+print("Contains(a)={}, Contains(z)={}".format(INDEXED_HEAP.contains('a'),
+                                              INDEXED_HEAP.contains('z')))
+print("Update a to -200:", INDEXED_HEAP.update('a', -200))
+print("Peek item:", INDEXED_HEAP.peek_item())
+print("Update a to 200:", INDEXED_HEAP.update('a', 200))
+print("Remove b:", INDEXED_HEAP.remove('b'))
+print("Remove b again:", INDEXED_HEAP.remove('b'))
+print("Handles after merge:", INDEXED_HEAP.merge([7, -7]))
+print(INDEXED_HEAP)
+POPPED = []
+while not INDEXED_HEAP.is_empty():
+    POPPED.append(INDEXED_HEAP.pop_item())
+print("Pop items:", POPPED)
+assert [val for _, val in POPPED] == sorted(val for _, val in POPPED)
+assert POPPED[-1] == ('a', 200)
+MIXED_HEAP = heap.IndexedHeap()
+MIXED_HANDLES = [MIXED_HEAP.push(1, handle=2)] + [MIXED_HEAP.push(val) for val in (5, 6, 7)]
+print("Caller handle 2, then auto handles:", MIXED_HANDLES)
+assert MIXED_HANDLES == [2, 0, 1, 3]
+print("Remove 2:", MIXED_HEAP.remove(2), "| Peek item:", MIXED_HEAP.peek_item())
+assert MIXED_HEAP.peek_item() == (0, 5)
+print("Replace root with taken handle 1:", MIXED_HEAP.replace(0, handle=1))
+assert MIXED_HEAP.get(1) == 6 and MIXED_HEAP.peek_item() == (0, 5)
+print("Replace root with handle 'x':", MIXED_HEAP.replace(9, handle='x'))
+print("Pop items:", [MIXED_HEAP.pop_item() for _ in range(MIXED_HEAP.size())])
+
+print("\n==== TEST TOP-K SELECTOR IMPLEMENTATION ====")
+STREAM = [randint(-100, 100) for _ in range(50)]
+TOP_K = heap.TopK(5)
+for val in STREAM[:10]:
+    print("Push {} | Evicted: {}".format(val, TOP_K.push(val)))
+print("Threshold:", TOP_K.threshold())
+TOP_K.extend(STREAM[10:])
+print("Top 5 of stream:", TOP_K.sorted())
+assert TOP_K.sorted() == sorted(STREAM, reverse=True)[:5]
+LATENCIES = [("GET /", 12), ("GET /a", 250), ("POST /b", 90), ("GET /c", 3), ("PUT /d", 250)]
+BOTTOM_K = heap.TopK(2, key=lambda req: req[1], best="min")
+BOTTOM_K.extend(LATENCIES)
+print("Fastest 2 requests:", BOTTOM_K.sorted())
+assert BOTTOM_K.sorted() == [("GET /c", 3), ("GET /", 12)]
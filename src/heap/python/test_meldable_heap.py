@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#################################################
+""" test_meldable_heap.py
+# # Test for Meldable Heap Implementations (Pairing, Leftist, Skew)
+#   Tests min/max heaps of every kind:
+#      - Creating a heap
+#      - Push, peek, pop: functionality + API.
+#      - Size, capacity, is_empty.
+#      - Merge(meld) (self merge & merge over capacity rejected), pushpop, replace
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from random import randint
+
+# Local Application/Library Specific Imports.
+import meldable_heap as mh
+##################################################
+# Test
+##################################################
+for HEAP_CLASS in (mh.PairingHeap, mh.LeftistHeap, mh.SkewHeap):
+    for HTYPE in ("min", "max"):
+        print("\n==== TEST {} {} IMPLEMENTATION ====".format(HTYPE.upper(), HEAP_CLASS.__name__))
+        HEAP = HEAP_CLASS([3, 6, 10, -3, 5], HTYPE)
+        print(HEAP)
+        for _ in range(5):
+            val = randint(-100, 100)
+            print("Pushing ", val)
+            HEAP.push(val)
+        print("HEAP cap: {} | size: {}".format(HEAP.capacity(), HEAP.size()))
+        print("HEAP peek:", HEAP.peek())
+        print("HEAP replace (7):", HEAP.replace(7))
+        print("PushPop -4: ", HEAP.pushpop(-4))
+        print("PushPop 50: ", HEAP.pushpop(50))
+        OTHER = HEAP_CLASS([randint(-100, 100) for _ in range(10)], HTYPE)
+        print("Merge", OTHER)
+        HEAP.merge(OTHER)
+        print("Merged size: {} | Other size: {}".format(HEAP.size(), OTHER.size()))
+        HEAP.merge([1, 2, -1])
+        print("Merge [1, 2, -1] size:", HEAP.size())
+        print("Merge itself:", HEAP.merge(HEAP), "| size:", HEAP.size())
+        assert HEAP.size() == 23
+        POPPED = []
+        while not HEAP.is_empty():
+            POPPED.append(HEAP.pop())
+        print("Pop the heap:", POPPED)
+        assert POPPED == sorted(POPPED, reverse=HTYPE == "max")
+        assert len(POPPED) == 23
+        HEAP.pop()
+
+print("\n==== TEST CROSS-KIND MERGE ====")
+PAIRING = mh.PairingHeap([5, 1, 3])
+PAIRING.merge(mh.LeftistHeap([4, 2], "max"))
+print("Pairing <- Leftist(max):", [PAIRING.pop() for _ in range(PAIRING.size())])
+try:
+    mh.MeldableHeap()
+    assert False, "MeldableHeap is abstract"
+except TypeError as err:
+    print("MeldableHeap():", err)
+
+print("\n==== TEST MERGE OVER CAPACITY ====")
+CAPPED = mh.PairingHeap([1, 2, 3], cap=5)
+OVER = mh.PairingHeap([4, 5, 6])
+print("Merge 3 into 3 (cap 5):", CAPPED.merge(OVER), "| Sizes:", CAPPED.size(), OVER.size())
+print("Merge [4, 5, 6] (cap 5):", CAPPED.merge([4, 5, 6]), "| Size:", CAPPED.size())
+assert CAPPED.size() == 3 and OVER.size() == 3
+print("Merge [4, 5] (cap 5):", CAPPED.merge([4, 5]), "| Size:", CAPPED.size())
+assert CAPPED.is_full() and [CAPPED.pop() for _ in range(5)] == [1, 2, 3, 4, 5]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+#################################################
+""" test_numeric_heap.py
+# # Test for Numeric Heap Implementation
+#   Tests min/max numeric heaps:
+#      - Creating a heap (from_array)
+#      - Push, peek, pop, pushpop, replace.
+#      - Push_many, pop_many (small + large batches).
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from array import array
+from random import randint, random
+
+# Local Application/Library Specific Imports.
+import numeric_heap as nh
+##################################################
+# Test
+##################################################
+print("==== TEST NUMERIC MIN HEAP IMPLEMENTATION ====")
+MIN_HEAP = nh.NumericHeap.from_array(array("d", [3, 6, 10, -3, 5]))
+print(MIN_HEAP, "| typecode:", MIN_HEAP.data.typecode)
+for _ in range(5):
+    MIN_HEAP.push(random())
+print("MIN_HEAP min:", MIN_HEAP.peek())
+print("MIN_HEAP replace (7):", MIN_HEAP.replace(7))
+print("PushPop -4: ", MIN_HEAP.pushpop(-4))
+print("Push many (3 values):", MIN_HEAP.push_many([2.5, -1, 8]))
+print("Push many (50 values):", MIN_HEAP.push_many(random() * 100 for _ in range(50)))
+print("Size:", MIN_HEAP.size())
+SMALL = MIN_HEAP.pop_many(3)
+print("Pop many (3):", SMALL)
+REST = MIN_HEAP.pop_many(100)
+print("Pop many (rest):", REST[:5], "...")
+assert list(SMALL) + list(REST) == sorted(list(SMALL) + list(REST))
+assert MIN_HEAP.is_empty() and len(MIN_HEAP.pop_many(1)) == 0
+
+print("\n==== TEST NUMERIC MAX HEAP IMPLEMENTATION ====")
+MAX_HEAP = nh.NumericHeap([randint(-100, 100) for _ in range(10)], "max", cap=20, typecode="q")
+print(MAX_HEAP)
+print("Push many (15 values, cap 20):", MAX_HEAP.push_many(range(15)))
+print("Is full:", MAX_HEAP.is_full())
+POPPED = list(MAX_HEAP.pop_many(4)) + list(MAX_HEAP.pop_many(16))
+print("Pop the heap:", POPPED)
+assert POPPED == sorted(POPPED, reverse=True) and len(POPPED) == 20
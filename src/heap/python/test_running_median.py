@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+#################################################
+""" test_running_median.py
+# # Test for Streaming Median / Quantile Implementation
+#   Tests:
+#      - RunningMedian: insert, remove, median (odd/even counts), sliding window.
+#      - RunningQuantile: p90 over a stream.
+#      - QuantileTracker: p50/p90/p99, sliding window.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from random import randint
+
+# Local Application/Library Specific Imports.
+import running_median as rm
+##################################################
+# Test
+##################################################
+print("==== TEST RUNNING MEDIAN IMPLEMENTATION ====")
+MEDIAN = rm.RunningMedian()
+MEDIAN.median()
+for val in [5, 15, 1, 3, 8]:
+    MEDIAN.insert(val)
+    print("Insert {} | Median: {}".format(val, MEDIAN.median()))
+print("Remove 3:", MEDIAN.remove(3), "| Median:", MEDIAN.median())
+assert MEDIAN.median() == 6.5
+
+print("\n==== TEST WINDOWED RUNNING MEDIAN IMPLEMENTATION ====")
+STREAM = [randint(0, 100) for _ in range(30)]
+WINDOWED = rm.RunningMedian(window=5)
+for idx, val in enumerate(STREAM):
+    WINDOWED.insert(val)
+    WINDOW = sorted(STREAM[max(0, idx - 4):idx + 1])
+    print("Window: {} | Median: {}".format(WINDOW, WINDOWED.median()))
+    assert WINDOWED.size() == len(WINDOW)
+    assert WINDOWED.median() == (WINDOW[len(WINDOW) // 2] if len(WINDOW) % 2 else
+                                 (WINDOW[len(WINDOW) // 2 - 1] + WINDOW[len(WINDOW) // 2]) / 2)
+
+print("\n==== TEST RUNNING QUANTILE IMPLEMENTATION ====")
+P90 = rm.RunningQuantile(0.9)
+for val in range(1, 101):
+    P90.insert(val)
+print("p90 of 1..100:", P90.quantile())
+assert P90.quantile() == 90
+
+print("\n==== TEST QUANTILE TRACKER IMPLEMENTATION ====")
+LATENCIES = rm.QuantileTracker((0.5, 0.9, 0.99), window=100)
+STREAM = [randint(1, 1000) for _ in range(500)]
+for val in STREAM:
+    LATENCIES.insert(val)
+print("Size: {} | Quantiles: {}".format(LATENCIES.size(), LATENCIES.quantiles()))
+LAST = sorted(STREAM[-100:])
+assert LATENCIES.quantiles() == {0.5: LAST[49], 0.9: LAST[89], 0.99: LAST[98]}
+print("p75 (not tracked):", LATENCIES.quantile(0.75))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#################################################
+""" test_timer_wheel.py
+# # Test for Hierarchical Timer Wheel Implementation
+#   Tests:
+#      - Schedule (near, far, past deadlines), cancel (incl. an already fired timer).
+#      - Advance: batches, tick order, cascading, overflow heap,
+#                 never before the deadline (fractional deadlines, tick > 1).
+#      - Size, is_empty, now.
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Python Standard Library
+from random import random
+
+# Local Application/Library Specific Imports.
+import timer_wheel as tw
+##################################################
+# Test
+##################################################
+print("==== TEST TIMER WHEEL IMPLEMENTATION ====")
+# 10ms ticks, 3 levels of 8 slots: wheels cover 5.12s ahead, the rest overflows.
+WHEEL = tw.TimerWheel(tick=0.01, wheel_size=8, levels=3)
+TIMERS = {}
+for name, deadline in [("a", 0.035), ("b", 0.2), ("c", 1.5), ("d", 60.0), ("e", 0.035), ("f", 3.0)]:
+    TIMERS[name] = WHEEL.schedule(deadline, name)
+print("Scheduled: {} | Now: {}".format(WHEEL.size(), WHEEL.now()))
+print("Cancel c: {} | Cancel c again: {}".format(WHEEL.cancel(TIMERS["c"]), WHEEL.cancel(TIMERS["c"])))
+print("Cancel d (overflow heap): {}".format(WHEEL.cancel(TIMERS["d"])))
+print("Advance(0.03):", WHEEL.advance(0.03))
+print("Advance(0.04):", WHEEL.advance(0.04))
+print("Schedule g in the past:", WHEEL.schedule(0.0, "g").tick)
+print("Advance(2.5):", WHEEL.advance(2.5))
+print("Advance(100):", WHEEL.advance(100), "| Size:", WHEEL.size(), "| Is empty:", WHEEL.is_empty())
+assert WHEEL.is_empty()
+
+print("\n==== TEST TIMER WHEEL: MANY TIMEOUTS, MOSTLY CANCELLED ====")
+WHEEL = tw.TimerWheel(tick=1, wheel_size=16, levels=2)
+DEADLINES = [int(random() * 2000) for _ in range(2000)]
+TIMERS = [WHEEL.schedule(deadline, idx) for idx, deadline in enumerate(DEADLINES)]
+for timer in TIMERS[::3]:
+    WHEEL.cancel(timer)
+print("Scheduled: {} | After cancelling 1/3: {}".format(len(TIMERS), WHEEL.size()))
+FIRED = []
+for now in range(0, 2100, 100):
+    BATCH = WHEEL.advance(now)
+    FIRED.extend(BATCH)
+    assert all(DEADLINES[idx] <= now for idx in BATCH)
+print("Fired:", len(FIRED))
+assert sorted(FIRED) == [idx for idx in range(len(TIMERS)) if idx % 3]
+assert [DEADLINES[idx] for idx in FIRED] == sorted(DEADLINES[idx] for idx in FIRED)
+
+print("\n==== TEST TIMER WHEEL: CANCEL A FIRED TIMER ====")
+WHEEL = tw.TimerWheel(tick=1, wheel_size=8, levels=2)
+for idx in range(10):
+    WHEEL.schedule(1000 + idx, idx)
+FIRED_TIMER = WHEEL.schedule(1, "fired")
+print("Advance(2):", WHEEL.advance(2))
+print("Cancel fired: {} | Size: {}".format(WHEEL.cancel(FIRED_TIMER), WHEEL.size()))
+assert WHEEL.cancel(FIRED_TIMER) is False and WHEEL.size() == 10
+print("Advance(5000):", WHEEL.advance(5000), "| Size:", WHEEL.size())
+assert WHEEL.is_empty()
+
+print("\n==== TEST TIMER WHEEL: NEVER FIRES EARLY ====")
+WHEEL = tw.TimerWheel(tick=10, wheel_size=8, levels=2)
+WHEEL.schedule(19, "y")
+print("tick=10, y at 19 | Advance(10): {} | Advance(18.5): {} | Advance(19): {}"
+      .format(WHEEL.advance(10), WHEEL.advance(18.5), WHEEL.advance(19)))
+assert WHEEL.is_empty()
+WHEEL = tw.TimerWheel(tick=1, wheel_size=8, levels=2)
+for deadline, item in ((5.9, "x"), (5.2, "w"), (5.0, "v"), (40.5, "far")):
+    WHEEL.schedule(deadline, item)
+EXPIRED = [WHEEL.advance(now) for now in (5, 5.5, 6, 40.4, 40.5)]
+print("tick=1, v/w/x at 5/5.2/5.9, far at 40.5 | Advance(5, 5.5, 6, 40.4, 40.5):", EXPIRED)
+assert EXPIRED == [["v"], ["w"], ["x"], [], ["far"]] and WHEEL.is_empty()
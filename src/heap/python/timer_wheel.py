@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+#################################################
+""" timer_wheel.py
+# # Hierarchical Timer Wheel Implementation
+#   Delayed-task scheduler with O(1) schedule & cancel.
+#   Deadlines beyond the wheels' range wait in a Heap.
+#   Supports:
+#     - Basic:
+#         > schedule, cancel, advance (returns expired items in a batch).
+#     - Inspection
+#         > size, is_empty, now.
+#     - Internal:
+#         > place, cascade, migrate (heap -> wheels), compact (heap)
+"""
+#################################################
+# ###  Author: Samyuel Danyo
+# ###  Date: 18/10/2026
+# ###  Last Edit: 18/10/2026
+##################################################
+# ## imports
+# Local Application/Library Specific Imports.
+from heap import Heap
+##################################################
+# Implementation
+##################################################
+class Timer:
+    """Handle of a scheduled item (returned by TimerWheel.schedule)."""
+    __slots__ = ("deadline", "tick", "item", "slot", "cancelled", "fired")
+
+    def __init__(self, deadline, tick, item):
+        self.deadline = deadline
+        self.tick = tick
+        self.item = item
+        # The wheel slot (dict) holding the timer, None while in the overflow heap.
+        self.slot = None
+        self.cancelled = False
+        # Set once the timer expired (advance returned its item).
+        self.fired = False
+
+class TimerWheel:
+    """Hierarchical Timing Wheel implementation.
+       Time is cut into ticks of <tick> units. Level l has wheel_size slots,
+       each spanning wheel_size**l ticks, so the wheels cover wheel_size**levels
+       ticks ahead. A timer goes to the lowest level whose slots can still tell
+       it apart from "now"; when a higher level slot comes due, its timers are
+       cascaded down. Deadlines past the top level wait in a Heap, where
+       cancelled timers are dropped lazily. Ticks only bucket the timers: expiry
+       compares exact deadlines, so a timer never fires before its deadline.
+       Complexity: Schedule | Cancel | Advance
+                      O(1)  |  O(1)  | O(ticks elapsed + timers expired/cascaded)
+                   (far-future deadlines: O(log(n)) schedule, via the Heap)"""
+    def __init__(self, tick=1.0, wheel_size=256, levels=4, start=0):
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.levels = levels
+        self._now = self._tick_of(start)
+        self._spans = [wheel_size ** lvl for lvl in range(levels)]
+        self._wheels = [[{} for _ in range(wheel_size)] for _ in range(levels)]
+        self._num_wheel = 0
+        self._overflow = Heap(htype="min", key=lambda timer: timer.tick)
+        self._num_dead = 0
+
+    def _tick_of(self, time):
+        """Utility function to convert time to its tick number."""
+        return int(time // self.tick)
+
+    def size(self):
+        """Get the number of scheduled (not cancelled, not expired) timers."""
+        return self._num_wheel + self._overflow.size() - self._num_dead
+
+    def is_empty(self):
+        """True if no timers are scheduled."""
+        return self.size() <= 0
+
+    def now(self):
+        """Get the current time (start of the current tick)."""
+        return self._now * self.tick
+
+    def _place(self, timer):
+        """Utility function to put timer in its wheel slot, or the overflow heap."""
+        for lvl, span in enumerate(self._spans):
+            if timer.tick // span - self._now // span < self.wheel_size:
+                slot = self._wheels[lvl][(timer.tick // span) % self.wheel_size]
+                slot[timer] = None
+                timer.slot = slot
+                self._num_wheel += 1
+                return
+        self._overflow.push(timer)
+
+    def schedule(self, deadline, item):
+        """Schedule item to expire at deadline (past deadlines expire on the next advance).
+           Returns:
+               timer (Timer): Handle for cancel."""
+        timer = Timer(deadline, max(self._tick_of(deadline), self._now), item)
+        self._place(timer)
+        return timer
+
+    def cancel(self, timer):
+        """Cancel a scheduled timer.
+           Returns:
+               feedback (Boolean): True if the timer was pending and is now cancelled,
+                                   False if it already fired (None if already cancelled)."""
+        if timer.cancelled:
+            return None
+        if timer.fired:
+            return False
+        timer.cancelled = True
+        if timer.slot is not None:
+            if timer in timer.slot:
+                del timer.slot[timer]
+                self._num_wheel -= 1
+                timer.slot = None
+                return True
+            return None
+        # Not fired & not on a wheel: in the overflow heap.
+        # Lazy deletion, compacted once the heap is mostly dead.
+        self._num_dead += 1
+        if self._num_dead > self._overflow.size() // 2:
+            self._compact()
+        return True
+
+    def _compact(self):
+        """Utility function to drop cancelled timers from the overflow heap."""
+        live = [timer for timer in self._overflow.data if not timer.cancelled]
+        self._overflow = Heap(live, "min", key=lambda timer: timer.tick)
+        self._num_dead = 0
+
+    def _migrate(self):
+        """Utility function to move overflow timers that came into range to the wheels."""
+        span = self._spans[-1]
+        overflow = self._overflow
+        while (not overflow.is_empty()
+               and overflow.keys[0] // span - self._now // span < self.wheel_size):
+            timer = overflow.pop()
+            if timer.cancelled:
+                self._num_dead -= 1
+            else:
+                self._place(timer)
+
+    def _cascade(self, lvl):
+        """Utility function to re-place the timers of the level lvl slot that came due."""
+        wheel = self._wheels[lvl]
+        idx = (self._now // self._spans[lvl]) % self.wheel_size
+        slot = wheel[idx]
+        wheel[idx] = {}
+        self._num_wheel -= len(slot)
+        for timer in slot:
+            self._place(timer)
+
+    def advance(self, now):
+        """Move the clock forward to now.
+           Returns:
+               expired (list): Items of the timers with deadline <= now, in deadline(tick) order."""
+        target = self._tick_of(now)
+        expired = []
+        # Timers of the current tick (scheduled after it was processed, or not yet due).
+        self._expire(expired, now)
+        while self._now < target:
+            if not self._num_wheel:
+                # Nothing on the wheels - jump straight to the next overflow deadline.
+                if self._overflow.size() == self._num_dead:
+                    self._now = target
+                    break
+                self._now = max(self._now, min(target, self._overflow.keys[0]) - 1)
+                if self._now >= target:
+                    break
+            self._now += 1
+            self._migrate()
+            for lvl in range(self.levels - 1, 0, -1):
+                if self._now % self._spans[lvl] == 0:
+                    self._cascade(lvl)
+            self._expire(expired, now)
+        return expired
+
+    def _expire(self, expired, now):
+        """Utility function to collect the items of the current tick's level 0 slot.
+           Timers due later in the tick (deadline > now) stay on the slot."""
+        wheel = self._wheels[0]
+        idx = self._now % self.wheel_size
+        slot = wheel[idx]
+        if not slot:
+            return
+        pending = wheel[idx] = {}
+        for timer in slot:
+            if timer.deadline > now:
+                pending[timer] = None
+                timer.slot = pending
+                continue
+            self._num_wheel -= 1
+            timer.slot = None
+            timer.fired = True
+            expired.append(timer.item)